@@ -0,0 +1,85 @@
+# benchmarks.enlinkd_infer.py
+
+"""Microbenchmark for the enlinkd port string inference helpers.
+
+Compares the previous per-field `re.search` patterns with the single-pass,
+memoized `pyonms.models.enlinkd.parse_port()` over a topology pull where
+port strings repeat across links.
+
+    python -m benchmarks.enlinkd_infer
+"""
+
+# pylint: disable=C0116
+
+import re
+import timeit
+from typing import List, Optional
+
+from pyonms.models import enlinkd
+
+
+def search_ifindex(text: str) -> Optional[int]:
+    ifindex = re.search(r"^.*\(ifindex:(\d+)\).*", text)
+    return int(ifindex.group(1)) if ifindex else None
+
+
+def search_ip(text: str) -> Optional[str]:
+    ip = re.search(r"^.*\((((25[0-5]|(2[0-4]|1\d|[1-9]|)\d)\.?\b){4})\).*", text)
+    return ip.group(1) if ip else None
+
+
+def search_mac(text: str) -> Optional[str]:
+    mac = re.search(r"^.*\((mac|macAddress):([0-9A-Fa-f]+)\).*", text)
+    return mac.group(2) if mac else None
+
+
+def search_node(url: str) -> Optional[int]:
+    node = re.search(r"^.*node=(\d+).*", url)
+    return int(node.group(1)) if node else None
+
+
+def build_ports(switches: int = 200, ports: int = 48) -> List[str]:
+    return [
+        f"GigabitEthernet1/0/{port}(ifindex:{10100 + port})(10.{switch // 250}.{switch % 250}.1)"
+        f"(mac:00aa{switch:04x}{port:02x})"
+        for switch in range(switches)
+        for port in range(1, ports + 1)
+    ]
+
+
+def previous(ports: List[str], urls: List[str]) -> None:
+    for port, url in zip(ports, urls):
+        search_ifindex(port)
+        search_ip(port)
+        search_mac(port)
+        search_node(url)
+
+
+def current(ports: List[str], urls: List[str]) -> None:
+    enlinkd.parse_port.cache_clear()
+    enlinkd.infer_node_from_url.cache_clear()
+    for port, url in zip(ports, urls):
+        enlinkd.parse_port(port)
+        enlinkd.infer_node_from_url(url)
+
+
+def main(repeat: int = 5) -> None:
+    ports = build_ports()
+    urls = [f"element/node.jsp?node={index % 200}" for index in range(len(ports))]
+    # Each port is reported twice, once by the link from either end.
+    ports = [port for port in ports for _ in range(2)]
+    urls = [url for url in urls for _ in range(2)]
+    for name, function in [("re.search", previous), ("parse_port", current)]:
+        best = min(
+            timeit.repeat(
+                "function(ports, urls)",
+                number=1,
+                repeat=repeat,
+                globals={"function": function, "ports": ports, "urls": urls},
+            )
+        )
+        print(f"{name:>10}: {best * 1000:8.1f} ms for {len(ports)} port strings")
+
+
+if __name__ == "__main__":
+    main()
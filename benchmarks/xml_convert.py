@@ -0,0 +1,81 @@
+# benchmarks.xml_convert.py
+
+"""Microbenchmark for converting v1 XML responses into dictionaries.
+
+Compares the previous `xmltodict.parse()` plus recursive `normalize_dict()` path
+with the single-pass `pyonms.utils.xml_parser.parse_xml()`, and the per-node
+`iter_xml()` stream, over a generated model-import requisition.
+
+    python -m benchmarks.xml_convert
+"""
+
+# pylint: disable=C0116
+
+import timeit
+
+import xmltodict
+
+from pyonms.models.requisition import Interface, Requisition, RequisitionNode, Service
+from pyonms.utils import normalize_dict
+from pyonms.utils.xml_parser import iter_xml, parse_xml
+
+
+def build_requisition(nodes: int = 5000) -> bytes:
+    requisition = Requisition(foreign_source="benchmark")
+    for node_id in range(nodes):
+        node = RequisitionNode(
+            foreign_id=str(node_id),
+            node_label=f"node-{node_id}",
+            location="Default",
+            interface=[
+                Interface(
+                    ip_addr=f"10.{node_id // 250 % 250}.{node_id % 250}.{octet}",
+                    snmp_primary="P" if octet == 1 else "N",
+                    monitored_service=[
+                        Service(service_name="ICMP"),
+                        Service(service_name="SNMP"),
+                    ],
+                )
+                for octet in range(1, 3)
+            ],
+        )
+        node.add_category("Routers")
+        node.set_asset(name="city", value="Durham")
+        node.set_metadata(key="owner", value="noc")
+        requisition.add_node(node)
+    return b"".join(requisition.iter_xml())
+
+
+def previous(document: bytes) -> None:
+    normalize_dict(xmltodict.parse(document))
+
+
+def current(document: bytes) -> None:
+    parse_xml(document)
+
+
+def streamed(document: bytes) -> None:
+    for _ in iter_xml(document, tag="node"):
+        pass
+
+
+def main(repeat: int = 5) -> None:
+    document = build_requisition()
+    for name, function in [
+        ("xmltodict", previous),
+        ("parse_xml", current),
+        ("iter_xml", streamed),
+    ]:
+        best = min(
+            timeit.repeat(
+                "function(document)",
+                number=1,
+                repeat=repeat,
+                globals={"function": function, "document": document},
+            )
+        )
+        print(f"{name:>10}: {best * 1000:8.1f} ms for {len(document)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,7 @@ from multiprocessing import current_process
 from typing import Any, Optional, Union
 from urllib.parse import urlsplit
 
-from pyonms import dao, models
+from pyonms import cache, dao, models
 
 
 class PyONMS:
@@ -27,6 +27,15 @@ class PyONMS:
         name: Optional[str] = None,
         verify_ssl: Optional[bool] = True,
         timeout: Optional[int] = 30,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        retries: int = 3,
+        page_threads: int = 4,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        conditional_requests: bool = False,
+        stream_json: bool = False,
+        json_backend: str = "json",
     ):
         """Attributes:
             hostname (str): OpenNMS URL
@@ -35,16 +44,45 @@ class PyONMS:
             name (str): Instance name. Defaults to hostname.
             verify_ssl (bool): Verify SSL certificate. Defaults to True.
             timeout (int): Timeout for HTTP requests. Defaults to 30 seconds.
+            pool_connections (int): Number of connection pools to cache. Defaults to 10.
+            pool_maxsize (int): Maximum keep-alive connections per host. Defaults to 10.
+            retries (int): Retries for failed idempotent HTTP requests. Defaults to 3.
+            page_threads (int): Number of pages to prefetch concurrently when paginating. Defaults to 4.
+            cache_ttl (float): Cache single-record lookups such as `get_node()` for this many seconds.
+                Defaults to None (caching disabled).
+            cache_size (int): Maximum cached records per endpoint when `cache_ttl` is set. Defaults to 1024.
+            conditional_requests (bool): Revalidate repeated GETs with `ETag`/`Last-Modified`
+                and reuse the previous payload on `304 Not Modified`. Defaults to False.
+            stream_json (bool): Decode paginated responses incrementally from the socket,
+                yielding each record as soon as it is parsed instead of buffering whole pages.
+                Pages are then fetched one at a time rather than prefetched.
+                Requires the optional `stream` extra (`pip install pyonms[stream]`). Defaults to False.
+            json_backend (str): JSON library used to decode responses and encode request bodies:
+                `orjson`, `msgspec`, `json`, or `auto` for the fastest one installed.
+                Falls back to `json` when the requested library is missing. Defaults to `json`.
         Returns:
             `PyONMS` object
         """
         self.hostname = hostname
+        self.session = dao.base.create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            retries=retries,
+        )
+        """Connection-pooled `requests.Session` shared by all endpoints"""
         args: dict[str, Any] = {
             "hostname": hostname,
             "username": username,
             "password": password,
             "verify_ssl": verify_ssl,
             "timeout": timeout,
+            "session": self.session,
+            "page_threads": page_threads,
+            "cache_ttl": cache_ttl,
+            "cache_size": cache_size,
+            "conditional_requests": conditional_requests,
+            "stream_json": stream_json,
+            "json_backend": json_backend,
         }
         if name:
             self.name = name
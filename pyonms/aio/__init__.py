@@ -0,0 +1,167 @@
+# aio.__init__.py
+
+# cSpell: ignore UDLAPI
+
+"""Asyncio client
+
+Requires the optional `aiohttp` dependency, installed with `pip install pyonms[async]`.
+
+```python
+async with AsyncPyONMS(hostname=..., username=..., password=...) as onms:
+    nodes = await onms.nodes.get_nodes(limit=0)
+    async for alarm in onms.alarms.iter_alarms():
+        ...
+```
+"""
+
+import asyncio
+from typing import Any, List, Optional
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+except ImportError as error:  # pragma: no cover
+    raise ImportError(
+        "The asyncio client requires `aiohttp`. Install it with `pip install pyonms[async]`."
+    ) from error
+
+import pyonms.models.health  # noqa: E402
+import pyonms.models.info  # noqa: E402
+from pyonms.aio import (  # noqa: E402
+    alarms,
+    base,
+    business_services,
+    enlinkd,
+    events,
+    foreign_sources,
+    health,
+    info,
+    ips,
+    nodes,
+    requisitions,
+    udl,
+)
+
+
+class AsyncPyONMS:
+    """Asyncio server instance class"""
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        name: Optional[str] = None,
+        verify_ssl: Optional[bool] = True,
+        timeout: Optional[int] = 30,
+        max_concurrency: int = 50,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 1024,
+        conditional_requests: bool = False,
+    ):
+        """Attributes:
+            hostname (str): OpenNMS URL
+            username (str): Username
+            password (str): Password
+            name (str): Instance name. Defaults to hostname.
+            verify_ssl (bool): Verify SSL certificate. Defaults to True.
+            timeout (int): Timeout for HTTP requests. Defaults to 30 seconds.
+            max_concurrency (int): Maximum number of in-flight HTTP requests. Defaults to 50.
+            cache_ttl (float): Cache single-record lookups such as `get_node()` for this many seconds.
+                Defaults to None (caching disabled).
+            cache_size (int): Maximum cached records per endpoint when `cache_ttl` is set. Defaults to 1024.
+            conditional_requests (bool): Revalidate repeated GETs with `ETag`/`Last-Modified`
+                and reuse the previous payload on `304 Not Modified`. Defaults to False.
+        Returns:
+            `AsyncPyONMS` object
+        """
+        self.hostname = hostname
+        self.max_concurrency = max_concurrency
+        self.session: Optional[aiohttp.ClientSession] = None
+        """`aiohttp.ClientSession` shared by all endpoints, created by `open()`"""
+        self.health_status: Optional[pyonms.models.health.Health] = None
+        self.server_status: Optional[pyonms.models.info.Info] = None
+        args: dict[str, Any] = {
+            "hostname": hostname,
+            "username": username,
+            "password": password,
+            "verify_ssl": verify_ssl,
+            "timeout": timeout,
+            "cache_ttl": cache_ttl,
+            "cache_size": cache_size,
+            "conditional_requests": conditional_requests,
+        }
+        if name:
+            self.name = name
+        else:
+            self.name = urlsplit(hostname).netloc.split(":")[0]
+        args["name"] = self.name
+
+        self.health = health.HealthAPI(args)
+        """`pyonms.aio.health.HealthAPI` endpoint"""
+        self.info = info.InfoAPI(args)
+        """`pyonms.aio.info.InfoAPI` endpoint"""
+        self.alarms = alarms.AlarmAPI(args)
+        """`pyonms.aio.alarms.AlarmAPI` endpoint"""
+        self.bsm = business_services.BSMAPI(args)
+        """`pyonms.aio.business_services.BSMAPI` endpoint"""
+        self.enlinkd = enlinkd.EnlinkdAPI(args)
+        """`pyonms.aio.enlinkd.EnlinkdAPI` endpoint"""
+        self.events = events.EventAPI(args)
+        """`pyonms.aio.events.EventAPI` endpoint"""
+        self.fs = foreign_sources.ForeignSourceAPI(args)
+        """`pyonms.aio.foreign_sources.ForeignSourceAPI` endpoint"""
+        self.nodes = nodes.NodeAPI(args)
+        """`pyonms.aio.nodes.NodeAPI` endpoint"""
+        self.ips = ips.IPAPI(args)
+        """`pyonms.aio.ips.IPAPI` endpoint"""
+        self.requisitions = requisitions.RequisitionsAPI(args)
+        """`pyonms.aio.requisitions.RequisitionsAPI` endpoint"""
+        self.udl = udl.UDLAPI(args)
+        """`pyonms.aio.udl.UDLAPI` endpoint"""
+
+    def __repr__(self):
+        return self.hostname
+
+    async def __aenter__(self) -> "AsyncPyONMS":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    def _endpoints(self) -> List[base.AsyncEndpoint]:
+        return [
+            self.health,
+            self.info,
+            self.alarms,
+            self.bsm,
+            self.enlinkd,
+            self.events,
+            self.fs,
+            self.nodes,
+            self.ips,
+            self.requisitions,
+            self.udl,
+        ]
+
+    async def open(self) -> None:
+        """Open the shared HTTP session and load server status."""
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+        )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        for endpoint in self._endpoints():
+            endpoint.session = self.session  # type: ignore[assignment]
+            endpoint.semaphore = semaphore
+        self.health_status = await self.health.get_health()
+        self.server_status = await self.info.get_info()
+        if self.server_status:
+            for endpoint in self._endpoints():
+                endpoint.version = self.server_status.version  # type: ignore[attr-defined]
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        if self.session:
+            await self.session.close()
+            self.session = None
@@ -0,0 +1,201 @@
+# aio.alarms.py
+
+"Alarms asyncio data access"
+
+import asyncio
+import inspect
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import pyonms.dao.alarms
+import pyonms.models.alarm
+import pyonms.utils
+from pyonms.aio.base import AsyncEndpoint
+from pyonms.dao.alarms import ALARM_TIME_COLUMNS, LAST_ALARM_PARAMS
+
+
+class AlarmAPI(pyonms.dao.alarms.AlarmAPI, AsyncEndpoint):
+    """Alarms API endpoint"""
+
+    async def get_alarm(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.alarm.Alarm]:
+        """Get alarm by ID number."""
+        return await self._cached(id, lambda: self._fetch_alarm(id))
+
+    async def _fetch_alarm(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.alarm.Alarm]:
+        record = await self._get(url=f"{self.url}/{id}")
+        if record is not None:
+            return self._process_alarm(record)
+        else:
+            return None
+
+    async def get_alarms(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+        lazy: bool = False,
+    ) -> List[pyonms.models.alarm.Alarm]:
+        """Get all matching alarms.
+        See `pyonms.dao.alarms.AlarmAPI.get_alarms` for `keyset`, `after_id` and `lazy`.
+        """
+        params = self._fiql_params(fiql)
+        records = await self._get_batch(
+            url=self.url,
+            endpoint="alarm",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            keyset=keyset,
+            after=after_id,
+        )
+        return self._process_alarms(records, lazy=lazy)
+
+    async def get_alarms_table(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Get all matching alarms as a pandas `DataFrame` or Arrow `Table`, without building model objects.
+        See `pyonms.dao.alarms.AlarmAPI.get_alarms_table` for the arguments.
+        """
+        params = self._fiql_params(fiql)
+        return await self._get_table(
+            url=self.url,
+            endpoint="alarm",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            output=output,
+            columns=columns,
+            time_columns=ALARM_TIME_COLUMNS,
+        )
+
+    async def iter_alarms(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 0,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[pyonms.models.alarm.Alarm]:
+        """Iterate over matching alarms one page at a time.
+        See `pyonms.dao.alarms.AlarmAPI.iter_alarms` for `keyset`, `after_id` and `lazy`.
+        """
+        params = self._fiql_params(fiql)
+        async for record in self._iter_records(  # pylint: disable=E1133
+            url=self.url,
+            endpoint="alarm",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            keyset=keyset,
+            after=after_id,
+        ):
+            if record:
+                yield self._process_alarm(record, lazy=lazy)
+
+    async def watch(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        since: Optional[Union[int, datetime]] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[asyncio.Event] = None,
+    ) -> AsyncIterator[pyonms.models.alarm.Alarm]:
+        """Follow new and updated alarms, polling every `interval` seconds.
+        See `pyonms.dao.alarms.AlarmAPI.watch` for the arguments.
+        """
+        if since is None:
+            high_water, seen = await self._last_alarm_time()
+        else:
+            high_water, seen = self._watch_mark(since), set()
+        polls = 0
+        while stop is None or not stop.is_set():
+            async for record in self._iter_batch(  # pylint: disable=E1133
+                url=self.url,
+                endpoint="alarm",
+                batch_size=batch_size,
+                params=self._watch_params(fiql, high_water),
+            ):
+                new, high_water, seen = self._watch_seen(record, high_water, seen)
+                if new:
+                    yield self._process_alarm(record)
+            polls += 1
+            if max_polls and polls >= max_polls:
+                return
+            if await self._pause(interval, stop):
+                return
+
+    async def watch_forever(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        callback: Callable[[pyonms.models.alarm.Alarm], Any],
+        fiql: Optional[str] = None,
+        since: Optional[Union[int, datetime]] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Pass new and updated alarms to `callback`, which may be a coroutine function.
+        Runs until `max_polls` cycles have run or `stop` is set.
+        See `pyonms.dao.alarms.AlarmAPI.watch_forever` for the arguments.
+        """
+        async for alarm in self.watch(
+            fiql=fiql,
+            since=since,
+            interval=interval,
+            batch_size=batch_size,
+            max_polls=max_polls,
+            stop=stop,
+        ):
+            if inspect.isawaitable(result := callback(alarm)):
+                await result
+
+    async def _last_alarm_time(  # type: ignore[override] # pylint: disable=W0236
+        self,
+    ) -> Tuple[int, Set[int]]:
+        return self._parse_last_alarm(
+            await self._get(url=self.url, params=LAST_ALARM_PARAMS)
+        )
+
+    async def ack_alarm(self, id: int, ack: bool):  # type: ignore[override] # pylint: disable=W0236,W0622
+        """Acknowledge alarm by ID number."""
+        params = self._ack_params(ack)
+        await self._put(url=f"{self.url}/{id}", params=params, data=params)
+        self._invalidate(id)
+        return
+
+    async def clear_alarm(self, id: int):  # type: ignore[override] # pylint: disable=W0236,W0622
+        """Clear alarm by ID number."""
+        params = {"clear": True}
+        await self._put(url=f"{self.url}/{id}", params=params, data=params)
+        self._invalidate(id)
+        return
+
+    async def escalate_alarm(self, id: int):  # type: ignore[override] # pylint: disable=W0236,W0622
+        """Escalate alarm severity by ID number."""
+        params = {"escalate": True}
+        await self._put(url=f"{self.url}/{id}", params=params, data=params)
+        self._invalidate(id)
+        return
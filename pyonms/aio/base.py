@@ -0,0 +1,422 @@
+# aio.base.py
+
+"""Base classes for asyncio DAO objects"""
+
+# Subclasses of `AsyncEndpoint` replace sync DAO methods with coroutines of the same name,
+# so each override disables pylint W0236 where it is defined. Request parameters and record
+# conversion live in helpers on the sync DAO classes, shared by both clients.
+# Pylint resolves `_iter_batch()`, `_iter_keyset()`, `_iter_records()` and `_iter_xml()`
+# to the sync generators, so `async for` loops over them are marked with `disable=E1133`.
+
+import asyncio
+import base64
+import copy
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import aiohttp
+
+from pyonms.dao.base import Endpoint
+from pyonms.models.exceptions import ApiPayloadError, AuthenticationError
+from pyonms.utils.columnar import to_table
+from pyonms.utils.xml_parser import iter_xml
+
+
+@dataclass
+class Response:
+    "Minimal HTTP response returned by write operations"
+
+    status_code: int
+    text: str
+
+
+class AsyncEndpoint(Endpoint):
+    """Base class for asyncio endpoint data access"""
+
+    def __init__(self, **kwargs):
+        self.semaphore: Optional[asyncio.Semaphore] = kwargs.pop("semaphore", None)
+        super().__init__(**kwargs)
+        # Newer aiohttp releases deprecate `aiohttp.BasicAuth`, so credentials are sent as a header.
+        credentials = f"{self.username}:{self.password}".encode("latin1")
+        self.aio_auth = f"Basic {base64.b64encode(credentials).decode('ascii')}"
+
+    def _create_session(self):
+        # The `aiohttp.ClientSession` is attached by `AsyncPyONMS.open()`,
+        # since it must be created inside a running event loop.
+        return None
+
+    @staticmethod
+    async def _pause(  # type: ignore[override] # pylint: disable=W0236
+        interval: float, stop: Optional[asyncio.Event]
+    ) -> bool:
+        if stop is None:
+            await asyncio.sleep(interval)
+            return False
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+        return stop.is_set()
+
+    async def _cached(  # type: ignore[override] # pylint: disable=W0236
+        self, key: Hashable, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.record_cache is None:
+            return await fetch()
+        value = self.record_cache.get(key)
+        if value is None:
+            value = await fetch()
+            if value is not None:
+                self.record_cache.set(key, value)
+        return value
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json: Optional[dict] = None,
+        data: Optional[Union[str, bytes, dict]] = None,
+    ) -> aiohttp.ClientResponse:
+        if self.session is None or self.semaphore is None:
+            raise RuntimeError(
+                "Client session is not open. Use `async with AsyncPyONMS(...)` or `await AsyncPyONMS.open()`."
+            )
+        if params:
+            params = {
+                key: str(value).lower() if isinstance(value, bool) else str(value)
+                for key, value in params.items()
+            }
+        headers = dict(headers or {}, Authorization=self.aio_auth)
+        if json is not None and self.json_backend.name != "json":
+            headers["Content-Type"] = "application/json"
+            data, json = self.json_backend.dumps(json), None
+        session: aiohttp.ClientSession = self.session  # type: ignore[assignment]
+        async with self.semaphore:
+            response = await session.request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json,
+                data=data,
+                ssl=bool(self.verify_ssl),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            await response.read()
+        return response
+
+    async def _get_batch(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        hide_progress: bool = True,
+        threads: Optional[int] = None,
+        keyset: bool = False,
+        after: Optional[int] = None,
+    ) -> List[dict]:
+        if keyset or after is not None:
+            return [
+                record
+                async for record in self._iter_records(  # pylint: disable=E1133
+                    url=url,
+                    endpoint=endpoint,
+                    limit=limit,
+                    batch_size=batch_size,
+                    params=params,
+                    keyset=keyset,
+                    after=after,
+                )
+            ]
+        if not params:
+            params = {}
+        params["offset"] = 0
+        if limit > batch_size:
+            params["limit"] = batch_size
+        else:
+            params["limit"] = limit
+        records = await self._get(url=url, params=params, endpoint=endpoint)
+        if records.get(endpoint, [None]) in [[None], []]:
+            return []
+        if limit == 0 or records["totalCount"] < limit:
+            target_count = records["totalCount"]
+        else:
+            target_count = limit
+        result: List[dict] = records[endpoint][:target_count]
+        page_size = params["limit"]
+        offset = len(result)
+        # Offsets can only be precomputed when the server honors the page size.
+        # A short first page means a server-side cap, so fall back to sequential paging.
+        if page_size and offset == page_size:
+            offsets = range(offset, target_count, page_size)
+            pages = await asyncio.gather(
+                *[
+                    self._get(
+                        url=url,
+                        params=dict(params, offset=page_offset),
+                        endpoint=endpoint,
+                    )
+                    for page_offset in offsets
+                ]
+            )
+            offset = target_count
+            for page_offset, page in zip(offsets, pages):
+                page_records = page.get(endpoint) or []
+                result.extend(page_records)
+                if len(page_records) < page_size:
+                    if page_records:
+                        offset = page_offset + len(page_records)
+                    break
+        while offset < target_count:
+            page = await self._get(
+                url=url, params=dict(params, offset=offset), endpoint=endpoint
+            )
+            if not page.get(endpoint):
+                break
+            result.extend(page[endpoint])
+            offset += len(page[endpoint])
+        return result[:target_count]
+
+    async def _get_table(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+        time_columns: Sequence[str] = (),
+    ) -> Any:
+        """Fetch page records concurrently and build a pandas `DataFrame` or Arrow `Table` from them."""
+        records = await self._get_batch(
+            url=url,
+            endpoint=endpoint,
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+        )
+        return to_table(
+            records, output=output, columns=columns, time_columns=time_columns
+        )
+
+    async def _iter_batch(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        hide_progress: bool = True,
+        threads: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        if not params:
+            params = {}
+        params["offset"] = 0
+        params["limit"] = batch_size
+        target_count = limit
+        while True:
+            records = await self._get(url=url, params=params, endpoint=endpoint)
+            if records.get(endpoint, [None]) in [[None], []]:
+                return
+            if limit == 0 or records["totalCount"] < limit:
+                target_count = records["totalCount"]
+            for record in records[endpoint]:
+                yield record
+                params["offset"] += 1
+                if params["offset"] >= target_count:
+                    return
+
+    async def _iter_keyset(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        after: int = 0,
+        key: str = "id",
+        hide_progress: bool = True,
+    ) -> AsyncIterator[dict]:
+        """Yield records in ascending `key` order, one page at a time.
+        See `pyonms.dao.base.Endpoint._iter_keyset`.
+        """
+        params = dict(params or {})
+        fiql = params.get("_s")
+        params.update(orderBy=key, order="asc", offset=0)
+        count = 0
+        while limit == 0 or count < limit:
+            params["limit"] = min(batch_size, limit - count) if limit else batch_size
+            cursor = f"{key}=gt={after}"
+            params["_s"] = f"({fiql});{cursor}" if fiql else cursor
+            records = await self._get(url=url, params=params, endpoint=endpoint)
+            page = records.get(endpoint) if records else None
+            if not page:
+                return
+            for record in page:
+                yield record
+                count += 1
+            after = page[-1][key]
+            if len(page) < params["limit"]:
+                return
+
+    async def _iter_records(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        keyset: bool = False,
+        after: Optional[int] = None,
+        hide_progress: bool = True,
+        threads: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """Page records by ascending ID with `_iter_keyset` when `keyset` is set or `after` is given,
+        otherwise by offset with `_iter_batch`.
+        """
+        if keyset or after is not None:
+            records = self._iter_keyset(
+                url=url,
+                endpoint=endpoint,
+                limit=limit,
+                batch_size=batch_size,
+                params=params,
+                after=after or 0,
+            )
+        else:
+            records = self._iter_batch(
+                url=url,
+                endpoint=endpoint,
+                limit=limit,
+                batch_size=batch_size,
+                params=params,
+            )
+        async for record in records:  # pylint: disable=E1133
+            yield record
+
+    async def _get(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        endpoint: Optional[str] = None,
+    ):
+        headers = dict(headers) if headers else {}
+        if endpoint != "raw":
+            for key, value in self.headers.items():
+                headers[key] = value
+        cache_key = None
+        cached = None
+        if self.validator_cache is not None:
+            cache_key = (url, repr(sorted((params or {}).items())), endpoint == "raw")
+            cached = self.validator_cache.get(cache_key)
+            if cached:
+                headers.update(cached[0])
+        response = await self._request("GET", url, headers=headers, params=params)
+        if response.status == 304 and cached:
+            return copy.deepcopy(cached[1])
+        text = await response.text()
+        if response.status == 200:
+            if (
+                response.content_type.startswith("text/") and not response.charset
+            ) or url[-5:] in ["probe"]:
+                payload = text
+            elif "was not found" not in text:
+                payload = self.json_backend.loads(text)
+            else:
+                return {}
+            if cache_key is not None:
+                self._store_validators(cache_key, response.headers, payload)
+            return payload
+        elif response.status == 401:
+            raise AuthenticationError
+        elif response.status >= 400:
+            raise ApiPayloadError(message=text)
+        return {}
+
+    async def _iter_xml(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        tag: str,
+        force_list: Sequence[str] = (),
+        params: Optional[dict] = None,
+    ) -> AsyncIterator[Any]:
+        """Yield each `tag` element of an XML response once it is parsed.
+        Unlike the sync client, the response body is read in full before parsing starts.
+        """
+        response = await self._request(
+            "GET", url, headers={"Accept": "application/xml"}, params=params
+        )
+        if response.status == 200:
+            for element in iter_xml(
+                await response.read(), tag=tag, force_list=force_list
+            ):
+                yield element
+        elif response.status == 401:
+            raise AuthenticationError
+        elif response.status >= 400:
+            raise ApiPayloadError(message=await response.text())
+
+    async def _post(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        headers: Optional[dict] = None,
+        data: Optional[str] = None,
+        json: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Response:
+        response = await self._request(
+            "POST", url, headers=headers, params=params, json=json, data=data
+        )
+        text = await response.text()
+        if response.status >= 400:
+            raise ApiPayloadError(message=text)
+        return Response(status_code=response.status, text=text)
+
+    async def _put(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        url: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+    ) -> Response:
+        if data:
+            data = {
+                key: str(value).lower() if isinstance(value, bool) else value
+                for key, value in data.items()
+            }
+        response = await self._request(
+            "PUT", url, headers=headers, params=params, json=json, data=data
+        )
+        text = await response.text()
+        if response.status >= 400:
+            raise ApiPayloadError(message=text)
+        return Response(status_code=response.status, text=text)
+
+    async def _delete(  # type: ignore[override] # pylint: disable=W0236
+        self, url: str, headers: Optional[dict] = None, params: Optional[dict] = None
+    ) -> dict:
+        if not headers:
+            headers = {}
+        headers["Accept"] = "application/json"
+        response = await self._request("DELETE", url, headers=headers)
+        text = await response.text()
+        if response.status >= 400:
+            raise ApiPayloadError(message=text)
+        return {}
@@ -0,0 +1,86 @@
+# aio.business_services.py
+
+"Business Service asyncio data access"
+
+import asyncio
+from typing import List, Optional
+
+import pyonms.dao.business_services
+import pyonms.models.business_service
+from pyonms.aio.base import AsyncEndpoint
+
+
+class BSMAPI(pyonms.dao.business_services.BSMAPI, AsyncEndpoint):
+    "Business Service API endpoint"
+
+    async def get_bsm(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.business_service.BusinessService]:
+        """Get BusinessService object by ID number."""
+        return await self._cached(int(id), lambda: self._fetch_bsm(id))
+
+    async def _fetch_bsm(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.business_service.BusinessService]:
+        return self._store_bsm(await self._get(url=f"{self.url}/{id}"))
+
+    async def _get_bsm_ids(self) -> List[int]:  # type: ignore[override] # pylint: disable=W0236
+        return self._parse_bsm_ids(await self._get(url=self.url))
+
+    async def get_bsms(  # type: ignore[override] # pylint: disable=W0236
+        self, threads: int = 10
+    ) -> List[pyonms.models.business_service.BusinessService]:
+        """Get all BusinessService objects, refreshing the business service cache.
+        Concurrency is bounded by the client's `max_concurrency`, so `threads` is ignored.
+        """
+        results = await asyncio.gather(
+            *[self.get_bsm(id=bsm_id) for bsm_id in await self._get_bsm_ids()]
+        )
+        service_list = [
+            bsm
+            for bsm in results
+            if isinstance(bsm, pyonms.models.business_service.BusinessService)
+        ]
+        self.bsm_cache.replace(service_list)
+        return service_list
+
+    async def find_bsm_name(  # type: ignore[override] # pylint: disable=W0236
+        self, name: str, cache_only: bool = False, threads: int = 10
+    ) -> Optional[pyonms.models.business_service.BusinessService]:
+        """Get BusinessService object by name.
+        On a cache miss, all business services are refreshed concurrently with `get_bsms`,
+        unless `cache_only` is set or the cache was fully refreshed within its TTL.
+        `threads` is ignored, see `get_bsms`.
+        """
+        bsm = self.bsm_cache.get_name(name)
+        if bsm or cache_only or self.bsm_cache.complete:
+            return bsm
+        await self.get_bsms()
+        return self.bsm_cache.get_name(name)
+
+    async def reload_bsm_daemon(self) -> None:  # type: ignore[override] # pylint: disable=W0236
+        """Trigger reload of the `bsmd` daemon."""
+        await self._post(url=f"{self.url}/daemon/reload", json={})
+
+    async def create_bsm(  # type: ignore[override] # pylint: disable=W0236
+        self, bsm: pyonms.models.business_service.BusinessServiceRequest
+    ) -> None:
+        """Create new BusinessService object."""
+        response = await self._post(url=self.url, json=bsm.to_dict())
+        self._check_bsm_created(bsm, response.text)
+
+    async def update_bsm(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        id: int,  # pylint: disable=W0622
+        bsm: pyonms.models.business_service.BusinessServiceRequest,
+    ):
+        """Update existing BusinessService object."""
+        await self._put(url=f"{self.url}/{id}", json=bsm.to_dict())
+        self._invalidate(int(id))
+
+    async def delete_bsm(  # type: ignore[override] # pylint: disable=W0236
+        self, bsm: pyonms.models.business_service.BusinessService
+    ) -> None:
+        """Delete BusinessService object."""
+        await self._delete(url=f"{self.url}/{bsm.id}")
+        self._invalidate(bsm.id)
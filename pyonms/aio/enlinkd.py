@@ -0,0 +1,43 @@
+# aio.enlinkd.py
+
+"Enlinkd asyncio Endpoint"
+
+import asyncio
+from typing import List, Optional
+
+import pyonms.dao.enlinkd
+import pyonms.models.enlinkd
+from pyonms.aio.base import AsyncEndpoint
+
+
+class EnlinkdAPI(pyonms.dao.enlinkd.EnlinkdAPI, AsyncEndpoint):
+    "Enlinkd API Endpoint"
+
+    async def get_node_links(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int
+    ) -> Optional[pyonms.models.enlinkd.Topology]:
+        "Get all links for a given node."
+        record = await self._get(url=f"{self.url}/{node_id}")
+        if record not in [None, {}]:
+            return self._process_topology(record)
+        else:
+            return None
+
+    async def get_topology_graph(  # type: ignore[override] # pylint: disable=W0236
+        self, node_ids: Optional[List[int]] = None, threads: int = 10
+    ) -> pyonms.models.enlinkd.TopologyGraph:
+        """Get the links of many nodes concurrently and join them into one `TopologyGraph`.
+        Concurrency is bounded by the client's `max_concurrency`, so `threads` is ignored.
+        """
+        if node_ids is None:
+            node_ids = [
+                int(record["id"])
+                async for record in self._iter_batch(  # pylint: disable=E1133
+                    url=f"{self.base_v2}nodes", endpoint="node", batch_size=1000
+                )
+                if record
+            ]
+        topologies = await asyncio.gather(
+            *[self.get_node_links(node_id) for node_id in node_ids]
+        )
+        return self._build_topology_graph(node_ids, list(topologies))
@@ -0,0 +1,173 @@
+# aio.events.py
+
+"Events asyncio data access"
+
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+
+import pyonms.dao.events
+import pyonms.models.event
+from pyonms.aio.base import AsyncEndpoint
+from pyonms.dao.events import EVENT_TIME_COLUMNS, LAST_EVENT_PARAMS
+
+
+class EventAPI(pyonms.dao.events.EventAPI, AsyncEndpoint):
+    "Events API endpoint"
+
+    async def get_event(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.event.Event]:
+        """Get event by ID number."""
+        return await self._cached(id, lambda: self._fetch_event(id))
+
+    async def _fetch_event(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.event.Event]:
+        record = await self._get(url=f"{self.url}/{id}")
+        if record is not None:
+            return self._process_event(record)
+        else:
+            return None
+
+    async def get_events(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+    ) -> List[pyonms.models.event.Event]:
+        """Get all matching event objects.
+        See `pyonms.dao.events.EventAPI.get_events` for `keyset` and `after_id`.
+        """
+        params = self._fiql_params(fiql)
+        records = await self._get_batch(
+            url=self.url,
+            endpoint="event",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            keyset=keyset,
+            after=after_id,
+        )
+        return self._process_events(records)
+
+    async def get_events_table(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Get all matching events as a pandas `DataFrame` or Arrow `Table`, without building model objects.
+        See `pyonms.dao.events.EventAPI.get_events_table` for the arguments.
+        """
+        params = self._fiql_params(fiql)
+        return await self._get_table(
+            url=self.url,
+            endpoint="event",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            output=output,
+            columns=columns,
+            time_columns=EVENT_TIME_COLUMNS,
+        )
+
+    async def iter_events(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 0,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+    ) -> AsyncIterator[pyonms.models.event.Event]:
+        """Iterate over matching events one page at a time.
+        See `pyonms.dao.events.EventAPI.iter_events` for `keyset` and `after_id`.
+        """
+        params = self._fiql_params(fiql)
+        async for record in self._iter_records(  # pylint: disable=E1133
+            url=self.url,
+            endpoint="event",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            keyset=keyset,
+            after=after_id,
+        ):
+            if record:
+                yield self._process_event(record)
+
+    async def tail(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        after_id: Optional[int] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[asyncio.Event] = None,
+    ) -> AsyncIterator[pyonms.models.event.Event]:
+        """Follow new events, polling every `interval` seconds.
+        See `pyonms.dao.events.EventAPI.tail` for the arguments.
+        """
+        if after_id is None:
+            after_id = await self._last_event_id()
+        params = self._fiql_params(fiql)
+        polls = 0
+        while stop is None or not stop.is_set():
+            async for record in self._iter_keyset(  # pylint: disable=E1133
+                url=self.url,
+                endpoint="event",
+                batch_size=batch_size,
+                params=params,
+                after=after_id,
+            ):
+                after_id = record["id"]
+                yield self._process_event(record)
+            polls += 1
+            if max_polls and polls >= max_polls:
+                return
+            if await self._pause(interval, stop):
+                return
+
+    async def tail_forever(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        callback: Callable[[pyonms.models.event.Event], Any],
+        fiql: Optional[str] = None,
+        after_id: Optional[int] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[asyncio.Event] = None,
+    ) -> None:
+        """Pass new events to `callback`, which may be a coroutine function.
+        Runs until `max_polls` cycles have run or `stop` is set.
+        See `pyonms.dao.events.EventAPI.tail_forever` for the arguments.
+        """
+        async for event in self.tail(
+            fiql=fiql,
+            after_id=after_id,
+            interval=interval,
+            batch_size=batch_size,
+            max_polls=max_polls,
+            stop=stop,
+        ):
+            if inspect.isawaitable(result := callback(event)):
+                await result
+
+    async def _last_event_id(self) -> int:  # type: ignore[override] # pylint: disable=W0236
+        return self._parse_last_event(
+            await self._get(url=self.url, params=LAST_EVENT_PARAMS)
+        )
+
+    async def send_event(  # type: ignore[override] # pylint: disable=W0236
+        self, event: pyonms.models.event.Event
+    ) -> bool:
+        """Send Event object."""
+        result = await self._post(url=self.url, json=event.to_dict())
+        if result.status_code == 204:
+            return True
+        else:
+            return False
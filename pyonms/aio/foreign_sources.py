@@ -0,0 +1,48 @@
+# aio.foreign_sources.py
+
+"Foreign Sources asyncio data access"
+
+from typing import List, Optional
+
+import pyonms.dao.foreign_sources
+import pyonms.models.foreign_source
+from pyonms.aio.base import AsyncEndpoint, Response
+
+
+class ForeignSourceAPI(pyonms.dao.foreign_sources.ForeignSourceAPI, AsyncEndpoint):
+    "Foreign Sources API endpoint"
+
+    async def get_foreign_source(  # type: ignore[override] # pylint: disable=W0236
+        self, name: str
+    ) -> Optional[pyonms.models.foreign_source.ForeignSource]:
+        """Get foreign source definition."""
+        return await self._cached(name, lambda: self._fetch_foreign_source(name))
+
+    async def _fetch_foreign_source(  # type: ignore[override] # pylint: disable=W0236
+        self, name: str
+    ) -> Optional[pyonms.models.foreign_source.ForeignSource]:
+        record = await self._get(url=f"{self.url}/{name}", endpoint="foreignSources")
+        if record is not None:
+            return self._process_foreign_source(record)
+        else:
+            return None
+
+    async def get_foreign_sources(  # type: ignore[override] # pylint: disable=W0236
+        self,
+    ) -> List[pyonms.models.foreign_source.ForeignSource]:
+        """Get all foreign source definitions"""
+        records = await self._get(
+            url=self.url,
+            endpoint="foreignSources",
+        )
+        return self._process_foreign_sources(records)
+
+    async def update_foreign_source(  # type: ignore[override] # pylint: disable=W0236
+        self, foreign_source: pyonms.models.foreign_source.ForeignSource
+    ) -> Response:
+        """Update foreign source definition on server."""
+        response = await self._post(
+            url=self.url, headers=self.headers, json=foreign_source.to_dict()
+        )
+        self._invalidate(foreign_source.name)
+        return response
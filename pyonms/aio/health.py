@@ -0,0 +1,23 @@
+# aio.health.py
+
+"Health endpoint asyncio data access"
+
+from typing import Optional
+
+import pyonms.dao.health
+import pyonms.models.health
+from pyonms.aio.base import AsyncEndpoint
+
+
+class HealthAPI(pyonms.dao.health.HealthAPI, AsyncEndpoint):
+    """Health API endpoint"""
+
+    async def get_health(  # type: ignore[override] # pylint: disable=W0236
+        self,
+    ) -> Optional[pyonms.models.health.Health]:
+        """Get health status from current server instance"""
+        return self._report_health(await self._get(url=f"{self.url}", endpoint="raw"))
+
+    async def probe(self) -> str:  # type: ignore[override] # pylint: disable=W0236
+        """Get probe status from current server instance"""
+        return await self._get(url=f"{self.url}/probe", endpoint="raw")
@@ -0,0 +1,23 @@
+# aio.info.py
+
+"Info endpoint asyncio data access"
+
+from typing import Optional
+
+import pyonms.dao.info
+import pyonms.models.info
+from pyonms.aio.base import AsyncEndpoint
+
+
+class InfoAPI(pyonms.dao.info.InfoAPI, AsyncEndpoint):
+    "Info API endpoint"
+
+    async def get_info(  # type: ignore[override] # pylint: disable=W0236
+        self,
+    ) -> Optional[pyonms.models.info.Info]:
+        """Get information about the current server instance"""
+        record = await self._get(url=f"{self.url}", endpoint="raw")
+        if record is not None:
+            return self._process_info(record)
+        else:
+            return None
@@ -0,0 +1,64 @@
+# aio.ips.py
+
+# cspell:ignore ipinterfaces
+
+"IP Interface asyncio data access"
+
+from typing import AsyncIterator, List, Optional, Union
+
+import pyonms.dao.ips
+import pyonms.models.node
+from pyonms.aio.base import AsyncEndpoint
+
+
+class IPAPI(pyonms.dao.ips.IPAPI, AsyncEndpoint):
+    "IP Interface API endpoint"
+
+    async def get_ips(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        limit: int = 10,
+        batch_size: int = 100,
+        ip: Optional[str] = None,
+        nodeId: Optional[int] = None,
+        nodeLabel: Optional[str] = None,
+        primary: Optional[Union[pyonms.models.node.PrimaryType, str]] = None,
+    ) -> List[pyonms.models.node.IPInterface]:
+        """Search for IP Interface objects.
+        See `pyonms.dao.ips.IPAPI.get_ips` for parameters.
+        """
+        params = self._search_params(
+            ip=ip, nodeId=nodeId, nodeLabel=nodeLabel, primary=primary
+        )
+        record = await self._get_batch(
+            url=self.url,
+            limit=limit,
+            params=params,
+            batch_size=batch_size,
+            endpoint="ipInterface",
+        )
+        return self._process_ips(record)
+
+    async def iter_ips(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        limit: int = 0,
+        batch_size: int = 100,
+        ip: Optional[str] = None,
+        nodeId: Optional[int] = None,
+        nodeLabel: Optional[str] = None,
+        primary: Optional[Union[pyonms.models.node.PrimaryType, str]] = None,
+    ) -> AsyncIterator[pyonms.models.node.IPInterface]:
+        """Iterate over matching IP Interface objects one page at a time.
+        See `pyonms.dao.ips.IPAPI.get_ips` for parameters.
+        """
+        params = self._search_params(
+            ip=ip, nodeId=nodeId, nodeLabel=nodeLabel, primary=primary
+        )
+        async for address in self._iter_batch(  # pylint: disable=E1133
+            url=self.url,
+            limit=limit,
+            params=params,
+            batch_size=batch_size,
+            endpoint="ipInterface",
+        ):
+            if address:
+                yield self._process_ip(address)
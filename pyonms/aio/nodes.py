@@ -0,0 +1,458 @@
+# aio.nodes.py
+
+# cspell:ignore snmpinterfaces, ipinterfaces
+
+"Nodes asyncio data access"
+
+import asyncio
+from typing import Any, AsyncIterator, List, Optional, Sequence, Union
+
+import pyonms.cache
+import pyonms.dao.nodes
+import pyonms.models.node
+import pyonms.utils
+from pyonms.aio.base import AsyncEndpoint
+from pyonms.dao.nodes import NODE_TIME_COLUMNS, NODE_TIME_FIELDS, NodeComponents
+
+
+class NodeAPI(pyonms.dao.nodes.NodeAPI, AsyncEndpoint):
+    "Nodes API endpoint"
+
+    async def get_node(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        id: int,  # pylint: disable=W0622
+        components: Optional[List[NodeComponents]] = None,
+    ) -> Optional[pyonms.models.node.Node]:
+        """Get node by database ID number."""
+        components = self._default_components(components)
+        return await self._cached(
+            (id, frozenset(components)), lambda: self._fetch_node(id, components)
+        )
+
+    async def _fetch_node(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int, components: List[NodeComponents]  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.node.Node]:
+        record = await self._get(url=f"{self.url}/{id}")
+        if record is not None:
+            return await self._process_node(record, components=components)
+        else:
+            return None
+
+    async def get_nodes(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        components: Optional[List[NodeComponents]] = None,
+        threads: int = 10,
+        bulk: bool = False,
+    ) -> List[pyonms.models.node.Node]:
+        """Get all matching Node objects.
+        Components are hydrated concurrently, bounded by the client's `max_concurrency`,
+        so `threads` is ignored. See `pyonms.dao.nodes.NodeAPI.get_nodes` for `bulk`.
+        """
+        components = self._default_components(components)
+        params = self._fiql_params(fiql)
+        records = await self._get_batch(
+            url=self.url,
+            endpoint="node",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+        )
+        return await self._process_nodes(records, components=components, bulk=bulk)
+
+    async def get_nodes_table(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Get all matching nodes as a pandas `DataFrame` or Arrow `Table`, without building model objects.
+        See `pyonms.dao.nodes.NodeAPI.get_nodes_table` for the arguments.
+        """
+        params = self._fiql_params(fiql)
+        return await self._get_table(
+            url=self.url,
+            endpoint="node",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            output=output,
+            columns=columns,
+            time_columns=NODE_TIME_COLUMNS,
+        )
+
+    async def iter_nodes(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 0,
+        batch_size: int = 100,
+        components: Optional[List[NodeComponents]] = None,
+        threads: int = 10,
+        bulk: bool = False,
+    ) -> AsyncIterator[pyonms.models.node.Node]:
+        """Iterate over matching Node objects, fetching and hydrating one page at a time.
+        See `get_nodes` for `threads` and `bulk`.
+        """
+        components = self._default_components(components)
+        params = self._fiql_params(fiql)
+        page: List[dict] = []
+        async for record in self._iter_batch(  # pylint: disable=E1133
+            url=self.url,
+            endpoint="node",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+        ):
+            if record:
+                page.append(record)
+            if len(page) >= batch_size:
+                for node in await self._process_nodes(
+                    page, components=components, bulk=bulk
+                ):
+                    yield node
+                page = []
+        for node in await self._process_nodes(page, components=components, bulk=bulk):
+            yield node
+
+    async def get_nodes_cached(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        cache: pyonms.cache.NodeCache,
+        fiql: Optional[str] = None,
+        batch_size: int = 100,
+        components: Optional[List[NodeComponents]] = None,
+        threads: int = 10,
+        bulk: bool = False,
+        prune: bool = True,
+    ) -> List[pyonms.models.node.Node]:
+        """Get all matching Node objects through a persistent `pyonms.cache.NodeCache`.
+        See `pyonms.dao.nodes.NodeAPI.get_nodes_cached` for the arguments, and `get_nodes` for `threads`.
+        """
+        components = self._default_components(components)
+        scope, incremental, watermark, params = self._cached_query(
+            cache, fiql, components
+        )
+        records = [
+            record
+            async for record in self._iter_batch(  # pylint: disable=E1133
+                url=self.url,
+                endpoint="node",
+                limit=0,
+                batch_size=batch_size,
+                params=params,
+            )
+            if record
+        ]
+        watermark = self._node_watermark(records, watermark)
+        cache.put(
+            self.name,
+            await self._process_nodes(records, components=components, bulk=bulk),
+        )
+        if incremental and prune:
+            current = {
+                record["id"]
+                async for record in self._iter_batch(  # pylint: disable=E1133
+                    url=self.url,
+                    endpoint="node",
+                    batch_size=batch_size,
+                    params=self._fiql_params(fiql),
+                )
+            }
+            cache.delete(self.name, cache.ids(self.name) - current)
+        cache.set_watermark(self.name, scope, watermark)
+        return cache.get_all(self.name)
+
+    async def _process_nodes(  # type: ignore[override] # pylint: disable=W0236,W0221
+        self, records: List[dict], components: list, bulk: bool = False
+    ) -> List[pyonms.models.node.Node]:
+        if bulk:
+            return await self._process_nodes_bulk(records, components=components)
+        pyonms.utils.convert_record_times(records, NODE_TIME_FIELDS)
+        return list(
+            await asyncio.gather(
+                *[
+                    self._process_node(data=record, components=components)
+                    for record in records
+                    if record
+                ]
+            )
+        )
+
+    async def _process_nodes_bulk(  # type: ignore[override] # pylint: disable=W0236,W0221
+        self, records: List[dict], components: list, bulk_size: int = 100
+    ) -> List[pyonms.models.node.Node]:
+        nodes = self._process_node_records(records)
+        if not nodes or components in [[NodeComponents.NONE], []]:
+            return nodes
+        hydrate = self._hydrate_flags(components)
+        await asyncio.gather(
+            *[
+                self._hydrate_node_batch(
+                    nodes=nodes[index : index + bulk_size], **hydrate
+                )
+                for index in range(0, len(nodes), bulk_size)
+            ]
+        )
+        return nodes
+
+    async def _hydrate_node_batch(  # type: ignore[override] # pylint: disable=W0236,W0221
+        self,
+        nodes: List[pyonms.models.node.Node],
+        ips: bool = False,
+        services: bool = False,
+        snmp: bool = False,
+        metadata: bool = False,
+        hardware: bool = False,
+    ) -> None:
+        node_map = {node.id: node for node in nodes}
+        fiql = self._node_ids_fiql(node_map)
+
+        async def collection(
+            enabled: bool, name: str, endpoint: str
+        ) -> Optional[List[dict]]:
+            if not enabled:
+                return None
+            return await self._get_collection(name, endpoint, fiql)
+
+        ip_map = self._join_node_components(
+            node_map,
+            *await asyncio.gather(
+                collection(ips, "ipinterfaces", "ipInterface"),
+                collection(services, "ifservices", "service"),
+                collection(snmp, "snmpinterfaces", "snmpInterface"),
+            ),
+        )
+
+        async def set_node(node: pyonms.models.node.Node):
+            if metadata:
+                node.metadata = await self._get_node_metadata(node.id)  # type: ignore
+            if hardware:
+                node.hardwareInventory = await self._get_node_hardware(node.id)
+
+        async def set_ip(ip: pyonms.models.node.IPInterface):
+            # Metadata has no collection endpoint, so it is still fetched per resource.
+            ip.metadata = await self._get_ip_metadata(
+                node_id=ip.nodeId, ipaddress=ip.ipAddress  # type: ignore
+            )
+            service_metadata = await asyncio.gather(
+                *[
+                    self._get_service_metadata(
+                        node_id=ip.nodeId,  # type: ignore
+                        ipaddress=ip.ipAddress,  # type: ignore
+                        service=service.serviceType.name,  # type: ignore
+                    )
+                    for service in ip.services
+                ]
+            )
+            for service, data in zip(ip.services, service_metadata):
+                service.metadata = data
+
+        await asyncio.gather(
+            *[set_node(node) for node in nodes],
+            *[set_ip(ip) for ip in (ip_map.values() if metadata else [])],
+        )
+
+    async def _get_collection(  # type: ignore[override] # pylint: disable=W0236
+        self, collection: str, endpoint: str, fiql: str
+    ) -> List[dict]:
+        return [
+            record
+            async for record in self._iter_batch(  # pylint: disable=E1133
+                url=f"{self.base_v2}{collection}",
+                endpoint=endpoint,
+                batch_size=1000,
+                params={"_s": fiql},
+            )
+            if record
+        ]
+
+    async def _get_node_snmpinterfaces(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int
+    ) -> List[pyonms.models.node.SnmpInterface]:
+        records = await self._get_batch(
+            url=f"{self.url}/{node_id}/snmpinterfaces",
+            endpoint="snmpInterface",
+        )
+        return self._process_snmp_interfaces(records)
+
+    async def _get_node_ip_addresses(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int, services: bool = False, metadata: bool = False
+    ) -> List[pyonms.models.node.IPInterface]:
+        records = await self._get_batch(
+            url=f"{self.url}/{node_id}/ipinterfaces",
+            endpoint="ipInterface",
+        )
+        ip_addresses = self._process_ip_interfaces(records)
+
+        async def hydrate(ip: pyonms.models.node.IPInterface):
+            if services:
+                ip.services = await self._get_node_ip_services(
+                    node_id=node_id,
+                    ip_address=ip.ipAddress,  # type: ignore
+                    metadata=metadata,
+                )
+            if metadata:
+                ip.metadata = await self._get_ip_metadata(
+                    node_id=node_id,
+                    ipaddress=ip.ipAddress,  # type: ignore
+                )
+
+        await asyncio.gather(*[hydrate(ip) for ip in ip_addresses])
+        return ip_addresses
+
+    async def _get_node_ip_services(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int, ip_address: str, metadata: bool = False
+    ) -> List[pyonms.models.node.Service]:
+        records = await self._get_batch(
+            url=f"{self.url}/{node_id}/ipinterfaces/{ip_address}/services",
+            endpoint="service",
+        )
+        services = self._process_services(records)
+        if metadata:
+            service_metadata = await asyncio.gather(
+                *[
+                    self._get_service_metadata(
+                        node_id=node_id,
+                        ipaddress=ip_address,
+                        service=service.serviceType.name,  # type: ignore
+                    )
+                    for service in services
+                ]
+            )
+            for service, data in zip(services, service_metadata):
+                service.metadata = data
+        return services
+
+    async def _get_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self, url: str
+    ) -> List[pyonms.models.node.Metadata]:
+        records = await self._get_batch(url=url, endpoint="metaData")
+        return self._process_metadata(records)
+
+    async def _get_node_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int
+    ) -> List[pyonms.models.node.Metadata]:
+        return await self._get_metadata(url=self._metadata_url(node_id))
+
+    async def _get_ip_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int, ipaddress: str
+    ) -> List[pyonms.models.node.Metadata]:
+        return await self._get_metadata(url=self._metadata_url(node_id, ipaddress))
+
+    async def _get_service_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int, ipaddress: str, service: str
+    ) -> List[pyonms.models.node.Metadata]:
+        return await self._get_metadata(
+            url=self._metadata_url(node_id, ipaddress, service)
+        )
+
+    async def _get_node_hardware(  # type: ignore[override] # pylint: disable=W0236
+        self, node_id: int
+    ) -> Optional[pyonms.models.node.HardwareInventory]:
+        record = await self._get(url=f"{self.url}/{node_id}/hardwareInventory")
+        return pyonms.models.node.HardwareInventory(**record)
+
+    async def _process_node(  # type: ignore[override] # pylint: disable=W0236
+        self, data: dict, components: list
+    ) -> pyonms.models.node.Node:
+        node = pyonms.models.node.Node(**data)
+        hydrate = self._hydrate_flags(components)
+
+        async def set_metadata():
+            node.metadata = await self._get_node_metadata(node.id)  # type: ignore
+
+        async def set_ip_interfaces():
+            node.ipInterfaces = await self._get_node_ip_addresses(  # type: ignore
+                node.id,
+                services=hydrate["services"],
+                metadata=hydrate["metadata"],
+            )
+
+        async def set_snmp_interfaces():
+            node.snmpInterfaces = await self._get_node_snmpinterfaces(  # type: ignore
+                node.id
+            )
+
+        async def set_hardware():
+            node.hardwareInventory = await self._get_node_hardware(node.id)
+
+        tasks = []
+        if hydrate["metadata"]:
+            tasks.append(set_metadata())
+        if hydrate["ips"]:
+            tasks.append(set_ip_interfaces())
+        if hydrate["snmp"]:
+            tasks.append(set_snmp_interfaces())
+        if hydrate["hardware"]:
+            tasks.append(set_hardware())
+        await asyncio.gather(*tasks)
+        return node
+
+    async def set_node_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        node: Union[int, pyonms.models.node.Node],
+        metadata: pyonms.models.node.Metadata,
+    ):
+        """Set custom metadata on a node."""
+        node_id = self._node_id(node)
+        await self._post(url=self._metadata_url(node_id), json=metadata.to_dict())
+        self._invalidate_node(node_id)
+
+    async def remove_node_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self, node: Union[int, pyonms.models.node.Node], context: str, key: str
+    ):
+        """Remove custom metadata from a node."""
+        node_id = self._node_id(node)
+        await self._delete(url=f"{self._metadata_url(node_id)}/{context}/{key}")
+        self._invalidate_node(node_id)
+
+    async def set_ip_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        node: Union[int, pyonms.models.node.Node],
+        ip: str,
+        metadata: pyonms.models.node.Metadata,
+    ):
+        """Set custom metadata on an IP interface."""
+        node_id = self._node_id(node)
+        await self._post(url=self._metadata_url(node_id, ip), json=metadata.to_dict())
+        self._invalidate_node(node_id)
+
+    async def remove_ip_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self, node: Union[int, pyonms.models.node.Node], ip: str, context: str, key: str
+    ):
+        """Remove custom metadata from an IP interface."""
+        node_id = self._node_id(node)
+        await self._delete(url=f"{self._metadata_url(node_id, ip)}/{context}/{key}")
+        self._invalidate_node(node_id)
+
+    async def set_service_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        node: Union[int, pyonms.models.node.Node],
+        ip: str,
+        service: str,
+        metadata: pyonms.models.node.Metadata,
+    ):
+        """Set custom metadata on an IP service."""
+        node_id = self._node_id(node)
+        await self._post(
+            url=self._metadata_url(node_id, ip, service), json=metadata.to_dict()
+        )
+        self._invalidate_node(node_id)
+
+    async def remove_service_metadata(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        node: Union[int, pyonms.models.node.Node],
+        ip: str,
+        service: str,
+        context: str,
+        key: str,
+    ):
+        """Remove custom metadata from an IP service."""
+        node_id = self._node_id(node)
+        await self._delete(
+            url=f"{self._metadata_url(node_id, ip, service)}/{context}/{key}"
+        )
+        self._invalidate_node(node_id)
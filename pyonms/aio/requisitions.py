@@ -0,0 +1,163 @@
+# aio.requisitions.py
+
+"Requisitions asyncio data access"
+
+import asyncio
+from typing import AsyncIterator, Iterator, List, Optional, Union
+
+import pyonms.dao.requisitions
+import pyonms.models.requisition
+from pyonms.aio.base import AsyncEndpoint, Response
+
+
+class RequisitionsAPI(pyonms.dao.requisitions.RequisitionsAPI, AsyncEndpoint):
+    "Requisitions API endpoint"
+
+    async def get_requisition_names(self) -> List[str]:  # type: ignore[override] # pylint: disable=W0236
+        """Get a list of Requisition names"""
+        names = await self._get(
+            url=f"{self.base_v1}/requisitionNames",
+            endpoint="requisitionNames",
+            headers=self.headers,
+        )
+        return names["foreign-source"]
+
+    async def get_requisition(  # type: ignore[override] # pylint: disable=W0236
+        self, name: str
+    ) -> Optional[pyonms.models.requisition.Requisition]:
+        """Get the contents of a requisition"""
+        record = await self._get(
+            url=f"{self.url}/{name}", endpoint="requisitions", headers=self.headers
+        )
+        if record is not None:
+            return self._process_requisition(record)
+        else:
+            return None
+
+    async def iter_requisition_nodes(  # type: ignore[override] # pylint: disable=W0236
+        self, name: str
+    ) -> AsyncIterator[pyonms.models.requisition.RequisitionNode]:
+        """Get the nodes of a requisition one at a time.
+        The response body is read in full, then parsed one node at a time.
+
+        Args:
+            name (str): Requisition name.
+
+        Returns:
+            Async iterator of `pyonms.models.requisition.RequisitionNode` objects
+        """
+        async for record in self._iter_xml(  # pylint: disable=E1133
+            url=f"{self.url}/{name}",
+            tag="node",
+            force_list=pyonms.models.requisition.XML_LIST_KEYS,
+        ):
+            if record:
+                yield pyonms.models.requisition.RequisitionNode(**record)
+
+    async def get_requisitions(  # type: ignore[override] # pylint: disable=W0236
+        self,
+    ) -> List[pyonms.models.requisition.Requisition]:
+        """Get the contents of all requisitions"""
+        records = await self._get(
+            url=self.url,
+            endpoint="model-import",
+        )
+        return self._process_requisitions(records)
+
+    async def get_requisition_active_count(self) -> int:  # type: ignore[override] # pylint: disable=W0236
+        """Get number of active requisitions"""
+        count = await self._get(url=f"{self.url}/count", endpoint="raw")
+        return int(count)
+
+    async def get_requisition_deployed_count(self) -> int:  # type: ignore[override] # pylint: disable=W0236
+        """Get number of deployed requisitions"""
+        count = await self._get(url=f"{self.url}/deployed/count", endpoint="raw")
+        return int(count)
+
+    async def import_requisition(  # type: ignore[override] # pylint: disable=W0236
+        self, name: str, rescan: bool = False
+    ) -> bool:
+        """Trigger rescan of an existing requisition"""
+        response = await self._put(
+            url=f"{self.url}/{name}/import",
+            params={"rescanExisting": rescan},
+        )
+        if response.status_code in [202, 204]:
+            return True
+        else:
+            return False
+
+    async def update_requisition(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        requisition: pyonms.models.requisition.Requisition,
+        stream: Optional[str] = None,
+    ) -> Response:
+        """Post an entire requisition to create or overwrite.
+        Set `stream` to `json` or `xml` to send it as a chunked request body.
+        """
+        if stream is None:
+            return await self._post(
+                url=self.url, headers=self.headers, json=requisition.to_dict()
+            )
+        return await self._post(
+            url=self.url,
+            headers=self._stream_headers(stream),
+            data=_chunks(self._stream(requisition, stream)),  # type: ignore[arg-type]
+        )
+
+    async def update_node(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        requisition: Union[str, pyonms.models.requisition.Requisition],
+        node: pyonms.models.requisition.RequisitionNode,
+    ) -> Response:
+        """Post a single node to create or overwrite."""
+        response = await self._post(
+            url=self._nodes_url(requisition),
+            headers=self.headers,
+            json=node.to_dict(),
+        )
+        return response
+
+    async def delete_node(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        requisition: Union[str, pyonms.models.requisition.Requisition],
+        foreign_id: str,
+    ) -> dict:
+        """Delete a single node from a requisition."""
+        return await self._delete(url=f"{self._nodes_url(requisition)}/{foreign_id}")
+
+    async def sync_requisition(  # type: ignore[override] # pylint: disable=W0236
+        self,
+        desired: pyonms.models.requisition.Requisition,
+        threads: int = 10,
+        rescan: bool = False,
+    ) -> pyonms.models.requisition.RequisitionDiff:
+        """Bring a requisition in line with the desired version, sending only the nodes that differ.
+        Concurrency is bounded by the client's `max_concurrency`, so `threads` is ignored.
+        """
+        name = desired.foreign_source
+        if name in await self.get_requisition_names():
+            current = await self.get_requisition(name)
+        else:
+            current = None
+        if current is None:
+            diff = pyonms.models.requisition.Requisition(foreign_source=name).diff(
+                desired
+            )
+            await self.update_requisition(desired)
+        else:
+            diff = current.diff(desired)
+            updates = self._sync_updates(desired, diff)
+            await asyncio.gather(
+                *[self.update_node(name, node) for node in updates],
+                *[self.delete_node(name, foreign_id) for foreign_id in diff.removed],
+            )
+        if diff:
+            await self.import_requisition(name, rescan=rescan)
+        return diff
+
+
+async def _chunks(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    # `aiohttp` sends an async iterable as a chunked request body.
+    for chunk in chunks:
+        yield chunk
@@ -0,0 +1,92 @@
+# aio.udl.py
+
+# cSpell: ignore userdefinedlinks UDLAPI
+
+"User Defined Links asyncio data access"
+
+from typing import AsyncIterator, List, Optional
+
+import pyonms.dao.udl
+import pyonms.models.udl
+from pyonms.aio.base import AsyncEndpoint
+
+
+class UDLAPI(pyonms.dao.udl.UDLAPI, AsyncEndpoint):
+    "UDL API Endpoint"
+
+    async def get_link(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.udl.UserDefinedLink]:
+        """Get UserDefinedLink by ID number.
+
+        Args:
+            id (int): ID number of UserDefinedLink to retrieve.
+        """
+        return await self._cached(id, lambda: self._fetch_link(id))
+
+    async def _fetch_link(  # type: ignore[override] # pylint: disable=W0236
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.udl.UserDefinedLink]:
+        record = await self._get(url=f"{self.url}/{id}")
+        if record not in [None, {}]:
+            return self._process_udl(record)
+        else:
+            return None
+
+    async def get_links(  # type: ignore[override] # pylint: disable=W0236
+        self, limit: int = 100, batch_size: int = 100
+    ) -> List[pyonms.models.udl.UserDefinedLink]:
+        """Get all UserDefinedLink objects
+
+        Args:
+            limit (int, optional): Max number of UserDefinedLink objects to retrieve. Defaults to 100.
+            batch_size (int, optional): Number of UserDefinedLink to retrieve per API call. Defaults to 100.
+        """
+        records = await self._get_batch(
+            url=self.url,
+            endpoint="user_defined_link",
+            limit=limit,
+            batch_size=batch_size,
+        )
+        return self._process_udls(records)
+
+    async def iter_links(  # type: ignore[override] # pylint: disable=W0236
+        self, limit: int = 0, batch_size: int = 100
+    ) -> AsyncIterator[pyonms.models.udl.UserDefinedLink]:
+        """Iterate over UserDefinedLink objects one page at a time.
+
+        Args:
+            limit (int, optional): Max number of UserDefinedLink objects to retrieve. Defaults to 0 (all).
+            batch_size (int, optional): Number of UserDefinedLink to retrieve per API call. Defaults to 100.
+        """
+        async for record in self._iter_batch(  # pylint: disable=E1133
+            url=self.url,
+            endpoint="user_defined_link",
+            limit=limit,
+            batch_size=batch_size,
+        ):
+            if record:
+                yield self._process_udl(record)
+
+    async def delete_link(self, id: int):  # type: ignore[override] # pylint: disable=W0236,W0622
+        """Delete UserDefinedLink object.
+
+        Args:
+            id (int): ID number of UserDefinedLink to delete
+        """
+        await self._delete(url=f"{self.url}/{id}")
+        self._invalidate(id)
+
+    async def create_link(  # type: ignore[override] # pylint: disable=W0236
+        self, link: pyonms.models.udl.UserDefinedLink
+    ) -> bool:
+        """Create new UserDefinedLink between two nodes.
+
+        Args:
+            link (pyonms.models.udl.UserDefinedLink): UserDefinedLink object to create
+        """
+        x = await self._post(url=self.url, json=link.to_dict())
+        if x.status_code == 201:
+            return True
+        else:
+            return False
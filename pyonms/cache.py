@@ -0,0 +1,292 @@
+# cache.py
+
+"""Local caches for API objects"""
+
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import pyonms.models.business_service
+import pyonms.models.node
+
+
+class TTLCache:
+    """Thread-safe in-memory cache bounded by entry count and age.
+
+    The least recently used entry is evicted once `maxsize` is reached,
+    and entries older than `ttl` seconds are treated as missing.
+    Cached objects are shared, not copied, so treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        """Attributes:
+            maxsize (int): Maximum number of entries. Defaults to 1024.
+            ttl (float): Seconds an entry stays valid. Defaults to 60.
+        Returns:
+            `TTLCache` object
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"TTLCache(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get an unexpired entry, marking it as recently used."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Add or replace an entry, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key matches `predicate`."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class BusinessServiceCache(TTLCache):
+    """`TTLCache` of business services by ID, with a secondary index by name.
+
+    Used as the `bsm_cache` of `pyonms.dao.business_services.BSMAPI`, and as its `record_cache` when enabled.
+    A full refresh through `BSMAPI.get_bsms()` marks the cache complete for `ttl` seconds,
+    so name lookups that miss during that window are answered without going back to the server.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300):
+        """Attributes:
+            maxsize (int): Maximum number of business services. Defaults to 10000.
+            ttl (float): Seconds a business service stays valid. Defaults to 300.
+        Returns:
+            `BusinessServiceCache` object
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._names = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._complete_until = 0.0
+
+    def __repr__(self):
+        return f"BusinessServiceCache(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self)})"
+
+    @property
+    def complete(self) -> bool:
+        """Whether a full refresh happened within the last `ttl` seconds."""
+        return self._complete_until > time.monotonic()
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Add or replace a business service in both indexes."""
+        super().set(key, value)
+        self._names.set(value.name, value)
+
+    def add(self, bsm: pyonms.models.business_service.BusinessService) -> None:
+        """Add or replace a business service by its ID."""
+        self.set(bsm.id, bsm)
+
+    def get_name(
+        self, name: str
+    ) -> Optional[pyonms.models.business_service.BusinessService]:
+        """Get business service by name."""
+        bsm = self._names.get(name)
+        if bsm is not None and bsm.name == name and self.get(bsm.id) is bsm:
+            return bsm
+        return None
+
+    def by_id(self) -> Dict[int, pyonms.models.business_service.BusinessService]:
+        """Unexpired business services by ID."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: value
+                for key, (expires, value) in self._data.items()
+                if expires > now
+            }
+
+    def by_name(self) -> Dict[str, pyonms.models.business_service.BusinessService]:
+        """Unexpired business services by name."""
+        return {bsm.name: bsm for bsm in self.by_id().values()}
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a business service from both indexes and mark the cache incomplete."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is not None:
+            self._names.invalidate(entry[1].name)
+        self.mark_incomplete()
+
+    def invalidate_if(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every business service whose ID matches `predicate` and mark the cache incomplete."""
+        super().invalidate_if(predicate)
+        self.mark_incomplete()
+
+    def remove(self, id: int) -> None:  # pylint: disable=W0622
+        """Remove a business service and mark the cache incomplete."""
+        self.invalidate(id)
+
+    def mark_incomplete(self) -> None:
+        """Require a full refresh before name misses are trusted again."""
+        self._complete_until = 0.0
+
+    def replace(
+        self, services: Iterable[pyonms.models.business_service.BusinessService]
+    ) -> None:
+        """Replace the contents with a full set of business services and mark the cache complete."""
+        self.clear()
+        count = 0
+        for bsm in services:
+            self.add(bsm)
+            count += 1
+        if count <= self.maxsize:
+            self._complete_until = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        """Remove all business services."""
+        super().clear()
+        self._names.clear()
+        self._complete_until = 0.0
+
+
+class NodeCache:
+    """Persistent SQLite cache of hydrated `Node` objects, keyed by server name and node ID.
+
+    Used by `pyonms.dao.nodes.NodeAPI.get_nodes_cached()` to refresh only the nodes
+    that changed since the last run. Nodes are stored pickled, so only open cache files you trust.
+
+    ```python
+    cache = NodeCache("nodes.db")
+    nodes = server.nodes.get_nodes_cached(cache, components=[NodeComponents.ALL])
+    ```
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Attributes:
+            path (str): SQLite database file. Defaults to an in-memory database.
+        Returns:
+            `NodeCache` object
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS nodes ("
+                "server TEXT NOT NULL, id INTEGER NOT NULL, node BLOB NOT NULL, "
+                "PRIMARY KEY (server, id))"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS refresh ("
+                "server TEXT PRIMARY KEY, scope TEXT NOT NULL, watermark INTEGER NOT NULL)"
+            )
+
+    def __repr__(self):
+        return f"NodeCache(path={self.path})"
+
+    def get(
+        self, server: str, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.node.Node]:
+        """Get cached node by database ID number."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT node FROM nodes WHERE server = ? AND id = ?", (server, id)
+            ).fetchone()
+        if row:
+            return pickle.loads(row[0])
+        return None
+
+    def get_all(self, server: str) -> List[pyonms.models.node.Node]:
+        """Get all cached nodes for a server, ordered by ID."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT node FROM nodes WHERE server = ? ORDER BY id", (server,)
+            ).fetchall()
+        return [pickle.loads(row[0]) for row in rows]
+
+    def ids(self, server: str) -> Set[int]:
+        """Get the IDs of all cached nodes for a server."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM nodes WHERE server = ?", (server,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def put(self, server: str, nodes: Iterable[pyonms.models.node.Node]) -> None:
+        """Add or replace cached nodes."""
+        rows = [(server, node.id, pickle.dumps(node)) for node in nodes]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO nodes (server, id, node) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, server: str, ids: Iterable[int]) -> None:
+        """Remove cached nodes by ID."""
+        with self._lock, self._db:
+            self._db.executemany(
+                "DELETE FROM nodes WHERE server = ? AND id = ?",
+                [(server, node_id) for node_id in ids],
+            )
+
+    def clear(self, server: str) -> None:
+        """Remove all cached nodes and refresh state for a server."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM nodes WHERE server = ?", (server,))
+            self._db.execute("DELETE FROM refresh WHERE server = ?", (server,))
+
+    def get_watermark(self, server: str) -> Optional[Tuple[str, int]]:
+        """Get the `(scope, watermark)` recorded by the last refresh for a server."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT scope, watermark FROM refresh WHERE server = ?", (server,)
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set_watermark(self, server: str, scope: str, watermark: int) -> None:
+        """Record the scope and newest `lastCapsdPoll`/`createTime` (epoch milliseconds) seen for a server."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO refresh (server, scope, watermark) VALUES (?, ?, ?)",
+                (server, scope, watermark),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
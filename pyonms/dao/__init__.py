@@ -4,6 +4,7 @@
 
 from pyonms.dao import (
     alarms,
+    base,
     business_services,
     enlinkd,
     events,
@@ -2,12 +2,31 @@
 
 "Alarms data access"
 
-from typing import List, Optional
+import threading
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pyonms.models.alarm
+import pyonms.utils
 from pyonms.dao.base import Endpoint
 from pyonms.models import exceptions
 
+ALARM_TIME_COLUMNS = pyonms.models.alarm.ALARM_TIME_FIELDS + [
+    "lastEvent.time",
+    "lastEvent.createTime",
+]
+LAST_ALARM_PARAMS = {"orderBy": "lastEventTime", "order": "desc", "limit": 1}
+
 
 class AlarmAPI(Endpoint):
     """Alarms API endpoint"""
@@ -20,6 +39,11 @@ class AlarmAPI(Endpoint):
         self, id: int  # pylint: disable=W0622
     ) -> Optional[pyonms.models.alarm.Alarm]:
         """Get alarm by ID number."""
+        return self._cached(id, lambda: self._fetch_alarm(id))
+
+    def _fetch_alarm(
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.alarm.Alarm]:
         record = self._get(url=f"{self.url}/{id}")
         if record is not None:
             return self._process_alarm(record)
@@ -31,45 +55,229 @@ class AlarmAPI(Endpoint):
         fiql: Optional[str] = None,
         limit: int = 100,
         batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+        lazy: bool = False,
     ) -> List[pyonms.models.alarm.Alarm]:
-        """Get all matching alarms."""
-        params = {}
-        if fiql:
-            params["_s"] = fiql
+        """Get all matching alarms.
+        Set `keyset` to page by ascending alarm ID instead of offset, starting after `after_id`.
+        Set `lazy` to return `LazyAlarm` objects that convert timestamps and nested objects on first access.
+        """
+        params = self._fiql_params(fiql)
         records = self._get_batch(
             url=self.url,
             endpoint="alarm",
             limit=limit,
             batch_size=batch_size,
             params=params,
+            keyset=keyset,
+            after=after_id,
         )
-        alarms = []
-        for record in records:
+        return self._process_alarms(records, lazy=lazy)
+
+    def iter_alarms(
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 0,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+        lazy: bool = False,
+    ) -> Iterator[pyonms.models.alarm.Alarm]:
+        """Iterate over matching alarms, fetching one page at a time.
+        Only the current page is held in memory.
+        Set `keyset` to page by ascending alarm ID instead of offset, which stays consistent
+        while new alarms arrive. Resume an interrupted pull with `after_id` set to the last ID seen.
+        See `get_alarms` for `lazy`.
+        """
+        params = self._fiql_params(fiql)
+        for record in self._iter_records(
+            url=self.url,
+            endpoint="alarm",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            keyset=keyset,
+            after=after_id,
+        ):
             if record:
-                alarms.append(self._process_alarm(record))
-        return alarms
+                yield self._process_alarm(record, lazy=lazy)
 
-    def _process_alarm(self, data: dict) -> pyonms.models.alarm.Alarm:
+    def get_alarms_table(
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Get all matching alarms as a pandas `DataFrame` or Arrow `Table`, without building `Alarm` objects.
+        Nested fields are flattened into dotted columns, such as `serviceType.name`,
+        and timestamps are converted to UTC.
+
+        Args:
+            fiql (str): FIQL search filter.
+            limit (int): Maximum number of alarms. Use `0` for all. Defaults to 100.
+            batch_size (int): Alarms per page. Defaults to 100.
+            output (str): `pandas` or `arrow`. Requires the matching optional extra. Defaults to `pandas`.
+            columns (Sequence[str]): Only keep these columns. Defaults to every column.
+
+        Returns:
+            `pandas.DataFrame` or `pyarrow.Table`
+        """
+        params = self._fiql_params(fiql)
+        return self._get_table(
+            url=self.url,
+            endpoint="alarm",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            output=output,
+            columns=columns,
+            time_columns=ALARM_TIME_COLUMNS,
+        )
+
+    def watch(
+        self,
+        fiql: Optional[str] = None,
+        since: Optional[Union[int, datetime]] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[pyonms.models.alarm.Alarm]:
+        """Follow new and updated alarms, polling every `interval` seconds.
+        Each poll only fetches alarms whose `lastEventTime` is at or after the newest one seen,
+        starting from the most recent existing alarm unless `since` (epoch milliseconds or `datetime`) is given.
+        Polling stops after `max_polls` cycles or once `stop` is set, otherwise it runs until interrupted.
+        Use `watch_forever` to pass alarms to a callback instead.
+        """
+        if since is None:
+            high_water, seen = self._last_alarm_time()
+        else:
+            high_water, seen = self._watch_mark(since), set()
+        polls = 0
+        while stop is None or not stop.is_set():
+            for record in self._iter_batch(
+                url=self.url,
+                endpoint="alarm",
+                batch_size=batch_size,
+                params=self._watch_params(fiql, high_water),
+                hide_progress=True,
+            ):
+                new, high_water, seen = self._watch_seen(record, high_water, seen)
+                if new:
+                    yield self._process_alarm(record)
+            polls += 1
+            if max_polls and polls >= max_polls:
+                return
+            if self._pause(interval, stop):
+                return
+
+    def watch_forever(
+        self,
+        callback: Callable[[pyonms.models.alarm.Alarm], None],
+        fiql: Optional[str] = None,
+        since: Optional[Union[int, datetime]] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Pass new and updated alarms to `callback` as they are found.
+        Blocks until `max_polls` cycles have run or `stop` is set, which may happen from another thread
+        or from `callback`. Without either, it runs until interrupted.
+        See `watch` for the other arguments.
+        """
+        for alarm in self.watch(
+            fiql=fiql,
+            since=since,
+            interval=interval,
+            batch_size=batch_size,
+            max_polls=max_polls,
+            stop=stop,
+        ):
+            callback(alarm)
+
+    @staticmethod
+    def _watch_mark(since: Union[int, datetime]) -> int:
+        if isinstance(since, datetime):
+            return int(since.timestamp() * 1000)
+        return since
+
+    @staticmethod
+    def _watch_seen(
+        record: dict, high_water: int, seen: Set[int]
+    ) -> Tuple[bool, int, Set[int]]:
+        # Returns whether the alarm is new or updated since the last poll,
+        # with the new `lastEventTime` high-water mark and the alarm IDs seen at it.
+        event_time = record.get("lastEventTime") or 0
+        if event_time > high_water:
+            return True, event_time, {record["id"]}
+        if record["id"] in seen:
+            return False, high_water, seen
+        seen.add(record["id"])
+        return True, high_water, seen
+
+    def _watch_params(self, fiql: Optional[str], high_water: int) -> dict:
+        cursor = f"lastEventTime=ge={pyonms.utils.fiql_time(high_water)}"
+        return {
+            "_s": f"({fiql});{cursor}" if fiql else cursor,
+            "orderBy": "lastEventTime",
+            "order": "asc",
+        }
+
+    def _last_alarm_time(self) -> Tuple[int, Set[int]]:
+        return self._parse_last_alarm(self._get(url=self.url, params=LAST_ALARM_PARAMS))
+
+    @staticmethod
+    def _parse_last_alarm(records: dict) -> Tuple[int, Set[int]]:
+        if records and records.get("alarm"):
+            latest = records["alarm"][0]
+            return latest.get("lastEventTime") or 0, {latest["id"]}
+        return 0, set()
+
+    def _process_alarms(
+        self, records: List[dict], lazy: bool = False
+    ) -> List[pyonms.models.alarm.Alarm]:
+        if not lazy:
+            pyonms.utils.convert_record_times(
+                records, pyonms.models.alarm.ALARM_TIME_FIELDS
+            )
+        return [self._process_alarm(record, lazy=lazy) for record in records if record]
+
+    def _process_alarm(
+        self, data: dict, lazy: bool = False
+    ) -> pyonms.models.alarm.Alarm:
+        if lazy:
+            return pyonms.models.alarm.LazyAlarm(**data)
         return pyonms.models.alarm.Alarm(**data)
 
     def ack_alarm(self, id: int, ack: bool):  # pylint: disable=W0622
         """Acknowledge alarm by ID number."""
+        params = self._ack_params(ack)
+        self._put(url=f"{self.url}/{id}", params=params, data=params)
+        self._invalidate(id)
+        return
+
+    @staticmethod
+    def _ack_params(ack: bool) -> dict:
         if not isinstance(ack, bool):
             raise exceptions.InvalidValueError(
                 name="ack", value=ack, valid=[True, False]
             )
-        params = {"ack": ack}
-        self._put(url=f"{self.url}/{id}", params=params, data=params)
-        return
+        return {"ack": ack}
 
     def clear_alarm(self, id: int):  # pylint: disable=W0622
         """Clear alarm by ID number."""
         params = {"clear": True}
         self._put(url=f"{self.url}/{id}", params=params, data=params)
+        self._invalidate(id)
         return
 
     def escalate_alarm(self, id: int):  # pylint: disable=W0622
         """Escalate alarm severity by ID number."""
         params = {"escalate": True}
         self._put(url=f"{self.url}/{id}", params=params, data=params)
+        self._invalidate(id)
         return
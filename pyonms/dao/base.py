@@ -2,20 +2,79 @@
 
 """Base classes for DAO objects"""
 
-from typing import List, Optional, Union
+import concurrent.futures
+import copy
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Generator,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from requests.packages import urllib3  # type: ignore
 from tqdm import tqdm
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
+
+try:
+    import ijson  # type: ignore
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore
 
 import pyonms.utils
+from pyonms.cache import TTLCache
+from pyonms.utils.columnar import to_table
+from pyonms.utils.json_backend import get_json_backend
+from pyonms.utils.xml_parser import iter_xml
 from pyonms.models.exceptions import ApiPayloadError, AuthenticationError
 
 urllib3.disable_warnings(category=InsecureRequestWarning)
 
 
+def create_session(
+    pool_connections: int = 10, pool_maxsize: int = 10, retries: int = 3
+) -> requests.Session:
+    """Create a connection-pooled `requests.Session` with keep-alive.
+
+    Args:
+        pool_connections (int): Number of host connection pools to cache. Defaults to 10.
+        pool_maxsize (int): Maximum connections kept alive per host. Defaults to 10.
+        retries (int): Retries for failed connections and HTTP 502/503/504 responses
+            on idempotent methods. Defaults to 3.
+
+    Returns:
+        `requests.Session` object
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class Endpoint:
     """Base class for endpoint data access"""
 
@@ -31,11 +90,89 @@ class Endpoint:
         self.password = password
         self.verify_ssl = True
         self.timeout = 30
+        self.page_threads = 4
+        self.stream_json = False
         self.name = name
         self.headers = {"Accept": "application/json"}
         self.auth = HTTPBasicAuth(self.username, self.password)
+        self.session: requests.Session = (
+            kwargs.pop("session", None) or self._create_session()
+        )
+        self.record_cache: Optional[TTLCache] = None
+        self.validator_cache: Optional[TTLCache] = None
+        cache_ttl = kwargs.pop("cache_ttl", None)
+        cache_size = kwargs.pop("cache_size", 1024)
+        conditional_requests = kwargs.pop("conditional_requests", False)
+        self.json_backend = get_json_backend(kwargs.pop("json_backend", "json"))
         for key, value in kwargs.items():
             setattr(self, key, value)
+        if cache_ttl:
+            self.enable_cache(maxsize=cache_size, ttl=cache_ttl)
+        if conditional_requests:
+            self.enable_conditional_requests()
+        if self.stream_json and ijson is None:
+            raise ImportError(
+                "Streaming JSON decoding requires `ijson`. Install it with `pip install pyonms[stream]`."
+            )
+
+    def enable_cache(self, maxsize: int = 1024, ttl: float = 60) -> None:
+        """Cache single-record lookups on this endpoint in a `pyonms.cache.TTLCache`.
+        Writes made through this endpoint invalidate the affected records.
+
+        Args:
+            maxsize (int): Maximum number of cached records. Defaults to 1024.
+            ttl (float): Seconds a cached record stays valid. Defaults to 60.
+        """
+        self.record_cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def disable_cache(self) -> None:
+        """Stop caching single-record lookups on this endpoint."""
+        self.record_cache = None
+
+    def enable_conditional_requests(self, maxsize: int = 128) -> None:
+        """Send `If-None-Match`/`If-Modified-Since` on repeated GETs of the same URL.
+        When the server answers `304 Not Modified`, the payload from the previous
+        response is reused instead of downloading and parsing it again.
+
+        Args:
+            maxsize (int): Maximum number of URLs to remember. Defaults to 128.
+        """
+        self.validator_cache = TTLCache(maxsize=maxsize, ttl=float("inf"))
+
+    def disable_conditional_requests(self) -> None:
+        """Stop sending conditional GET requests on this endpoint."""
+        self.validator_cache = None
+
+    def _cached(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        if self.record_cache is None:
+            return fetch()
+        value = self.record_cache.get(key)
+        if value is None:
+            value = fetch()
+            if value is not None:
+                self.record_cache.set(key, value)
+        return value
+
+    def _invalidate(self, key: Hashable) -> None:
+        if self.record_cache is not None:
+            self.record_cache.invalidate(key)
+
+    def _create_session(self) -> requests.Session:
+        return create_session()
+
+    @staticmethod
+    def _fiql_params(fiql: Optional[str]) -> dict:
+        return {"_s": fiql} if fiql else {}
+
+    @staticmethod
+    def _pause(interval: float, stop: Optional[threading.Event]) -> bool:
+        """Sleep `interval` seconds between polls, waking early once `stop` is set.
+        Returns whether polling should stop.
+        """
+        if stop is None:
+            time.sleep(interval)
+            return False
+        return stop.wait(interval)
 
     def _get_batch(
         self,
@@ -45,43 +182,359 @@ class Endpoint:
         batch_size: int = 100,
         params: Optional[dict] = None,
         hide_progress: bool = False,
+        threads: Optional[int] = None,
+        keyset: bool = False,
+        after: Optional[int] = None,
     ) -> List[dict]:
+        if limit <= batch_size and not (keyset or after is not None):
+            batch_size = limit
+        return list(
+            self._iter_records(
+                url=url,
+                endpoint=endpoint,
+                limit=limit,
+                batch_size=batch_size,
+                params=params,
+                keyset=keyset,
+                after=after,
+                hide_progress=hide_progress,
+                threads=threads,
+            )
+        )
+
+    def _get_table(
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+        time_columns: Sequence[str] = (),
+    ) -> Any:
+        """Stream page records straight into columns without building model objects."""
+        return to_table(
+            self._iter_batch(
+                url=url,
+                endpoint=endpoint,
+                limit=limit,
+                batch_size=batch_size,
+                params=params,
+            ),
+            output=output,
+            columns=columns,
+            time_columns=time_columns,
+        )
+
+    def _iter_batch(
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        hide_progress: bool = False,
+        threads: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Yield records one page at a time, holding only the current page in memory.
+        Once `totalCount` is known, up to `threads` further pages are prefetched concurrently.
+        """
         if not params:
             params = {}
+        if threads is None:
+            threads = self.page_threads
         with tqdm(
             total=limit,
             unit="record",
             desc=f"Pulling {self.name} {endpoint} data",
             disable=hide_progress,
         ) as pbar:
-            result: List[dict] = []
             params["offset"] = 0
-            if limit > batch_size:
+            if limit == 0 or limit > batch_size:
                 params["limit"] = batch_size
             else:
                 params["limit"] = limit
-            records = self._get(
-                url=url,
-                params=params,
-                endpoint=endpoint,
-                headers=self.headers,
-            )
+            if self.stream_json:
+                yield from self._iter_stream(
+                    url=url, endpoint=endpoint, params=params, limit=limit, pbar=pbar
+                )
+                return
+            records = self._get_page(url=url, params=params, endpoint=endpoint)
             if records.get(endpoint, [None]) in [[None], []]:
-                return result
+                return
             if limit == 0 or records["totalCount"] < limit:
                 target_count = records["totalCount"]
                 pbar.total = target_count
             else:
                 target_count = limit
-            while params["offset"] < target_count:
-                for record in records[endpoint]:
-                    result.append(record)
-                    params["offset"] += 1
+            count = 0
+            for page in self._iter_pages(
+                url=url,
+                endpoint=endpoint,
+                params=params,
+                first_page=records[endpoint],
+                target_count=target_count,
+                threads=threads,
+            ):
+                for record in page:
+                    yield record
+                    count += 1
+                    pbar.update(1)
+                    if count >= target_count:
+                        return
+
+    def _iter_pages(
+        self,
+        url: str,
+        endpoint: str,
+        params: dict,
+        first_page: List[dict],
+        target_count: int,
+        threads: int,
+    ) -> Iterator[List[dict]]:
+        yield first_page
+        page_size = params["limit"]
+        offset = len(first_page)
+        # Offsets can only be precomputed when the server honors the page size.
+        # A short first page means a server-side cap, so fall back to sequential paging.
+        if threads > 1 and page_size and offset == page_size:
+            offset = yield from self._prefetch_pages(
+                url=url,
+                endpoint=endpoint,
+                params=params,
+                offset=offset,
+                target_count=target_count,
+                threads=threads,
+            )
+        while offset < target_count:
+            page = self._get_page(
+                url=url, params=dict(params, offset=offset), endpoint=endpoint
+            ).get(endpoint)
+            if not page:
+                return
+            yield page
+            offset += len(page)
+
+    def _prefetch_pages(
+        self,
+        url: str,
+        endpoint: str,
+        params: dict,
+        offset: int,
+        target_count: int,
+        threads: int,
+    ) -> Generator[List[dict], None, int]:
+        """Fetch pages of `params["limit"]` records concurrently, yielding them in order.
+        Returns the offset to continue from sequentially, which is `target_count`
+        unless a page came back short or empty before the end.
+        """
+        page_size = params["limit"]
+        offsets = iter(range(offset, target_count, page_size))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+            window: Deque[Tuple[int, concurrent.futures.Future]] = deque(
+                (
+                    page_offset,
+                    pool.submit(
+                        self._get_page,
+                        url=url,
+                        params=dict(params, offset=page_offset),
+                        endpoint=endpoint,
+                    ),
+                )
+                for page_offset in islice(offsets, threads)
+            )
+            try:
+                while window:
+                    page_offset, future = window.popleft()
+                    page = future.result().get(endpoint)
+                    if not page:
+                        return target_count
+                    yield page
+                    if len(page) < page_size:
+                        return page_offset + len(page)
+                    for next_offset in islice(offsets, 1):
+                        window.append(
+                            (
+                                next_offset,
+                                pool.submit(
+                                    self._get_page,
+                                    url=url,
+                                    params=dict(params, offset=next_offset),
+                                    endpoint=endpoint,
+                                ),
+                            )
+                        )
+            finally:
+                for _, future in window:
+                    future.cancel()
+        return target_count
+
+    def _iter_records(
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        keyset: bool = False,
+        after: Optional[int] = None,
+        hide_progress: bool = False,
+        threads: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Page records by ascending ID with `_iter_keyset` when `keyset` is set or `after` is given,
+        otherwise by offset with `_iter_batch`.
+        """
+        if keyset or after is not None:
+            return self._iter_keyset(
+                url=url,
+                endpoint=endpoint,
+                limit=limit,
+                batch_size=batch_size,
+                params=params,
+                after=after or 0,
+                hide_progress=hide_progress,
+            )
+        return self._iter_batch(
+            url=url,
+            endpoint=endpoint,
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            hide_progress=hide_progress,
+            threads=threads,
+        )
+
+    def _iter_keyset(
+        self,
+        url: str,
+        endpoint: str,
+        limit: int = 0,
+        batch_size: int = 100,
+        params: Optional[dict] = None,
+        after: int = 0,
+        key: str = "id",
+        hide_progress: bool = False,
+    ) -> Iterator[dict]:
+        """Yield records in ascending `key` order, one page at a time.
+        Each page is filtered with `key=gt=<last key seen>` instead of an offset,
+        so deep pages stay cheap and records arriving mid-pull cannot shift page boundaries.
+        Pass the last key seen as `after` to resume an interrupted pull.
+        """
+        params = dict(params or {})
+        fiql = params.get("_s")
+        params.update(orderBy=key, order="asc", offset=0)
+        count = 0
+        with tqdm(
+            total=limit,
+            unit="record",
+            desc=f"Pulling {self.name} {endpoint} data",
+            disable=hide_progress,
+        ) as pbar:
+            while limit == 0 or count < limit:
+                params["limit"] = (
+                    min(batch_size, limit - count) if limit else batch_size
+                )
+                cursor = f"{key}=gt={after}"
+                params["_s"] = f"({fiql});{cursor}" if fiql else cursor
+                records = self._get_page(url=url, params=params, endpoint=endpoint)
+                page = records.get(endpoint) if records else None
+                if not page:
+                    return
+                if not pbar.total:
+                    pbar.total = count + records.get("totalCount", len(page))
+                for record in page:
+                    yield record
+                    count += 1
                     pbar.update(1)
-                    if params["offset"] >= target_count:
-                        return result
-                records = self._get(url=url, params=params, endpoint=endpoint)
-            return result
+                after = page[-1][key]
+                if len(page) < params["limit"]:
+                    return
+
+    def _get_page(self, url: str, params: dict, endpoint: str) -> dict:
+        if self.stream_json:
+            # Callers that need the whole page, such as prefetching and keyset paging,
+            # still hold it in memory. `_iter_batch` streams records with `_iter_stream`.
+            totals: dict = {}
+            page = list(
+                self._stream_records(
+                    url=url, params=params, endpoint=endpoint, totals=totals
+                )
+            )
+            return dict(totals, **{endpoint: page})
+        return self._get(url=url, params=params, endpoint=endpoint)
+
+    def _iter_stream(
+        self, url: str, endpoint: str, params: dict, limit: int, pbar: tqdm
+    ) -> Iterator[dict]:
+        """Yield records one at a time as each page is decoded from the socket, paging sequentially.
+        `totalCount` is only known once a page has been read to the end, so pages are not prefetched.
+        """
+        target_count = limit
+        count = 0
+        while target_count == 0 or count < target_count:
+            totals: dict = {}
+            page_count = 0
+            for record in self._stream_records(
+                url=url,
+                params=dict(params, offset=count),
+                endpoint=endpoint,
+                totals=totals,
+            ):
+                yield record
+                count += 1
+                page_count += 1
+                pbar.update(1)
+                if count == target_count:
+                    return
+            if not page_count:
+                return
+            total = totals.get("totalCount")
+            if total is not None and (target_count == 0 or total < target_count):
+                target_count = total
+                pbar.total = target_count
+
+    def _stream_records(
+        self, url: str, params: dict, endpoint: str, totals: dict
+    ) -> Iterator[dict]:
+        """Yield the `endpoint` records of a JSON page as they are decoded from the socket,
+        so neither the raw body nor the whole page is held in memory.
+        Top-level `totalCount` and `count` values are stored in `totals` as they are parsed.
+
+        Raises:
+            `ApiPayloadError`: If the body is truncated or is not valid JSON.
+        """
+        with self.session.get(
+            url,
+            auth=self.auth,
+            headers=dict(self.headers),
+            params=params,
+            verify=self.verify_ssl,
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                events = self._count_events(
+                    ijson.parse(response.raw, use_float=True), totals
+                )
+                try:
+                    yield from ijson.items(events, f"{endpoint}.item")
+                except ijson.JSONError as error:
+                    raise ApiPayloadError(
+                        message=f"Invalid JSON response from {url}: {error}"
+                    ) from error
+            elif response.status_code == 401:
+                raise AuthenticationError
+            elif response.status_code >= 400:
+                raise ApiPayloadError(message=response.text)
+
+    @staticmethod
+    def _count_events(events: Iterator[tuple], totals: dict) -> Iterator[tuple]:
+        for prefix, event, value in events:
+            if prefix in ("totalCount", "count") and event == "number":
+                totals[prefix] = int(value)
+            yield prefix, event, value
 
     def _get(
         self,
@@ -94,14 +547,20 @@ class Endpoint:
         #    return self._get_v1(
         #        url=url, headers=headers, params=params, endpoint=endpoint
         #    )
-        if not headers:
-            headers = {}
+        headers = dict(headers) if headers else {}
         if not params:
             params = {}
         if endpoint != "raw":
             for key, value in self.headers.items():
                 headers[key] = value
-        response = requests.get(
+        cache_key = None
+        cached = None
+        if self.validator_cache is not None:
+            cache_key = (url, repr(sorted(params.items())), endpoint == "raw")
+            cached = self.validator_cache.get(cache_key)
+            if cached:
+                headers.update(cached[0])
+        response = self.session.get(
             url,
             auth=self.auth,
             headers=headers,
@@ -109,17 +568,76 @@ class Endpoint:
             verify=self.verify_ssl,
             timeout=self.timeout,
         )
+        if response.status_code == 304 and cached:
+            return copy.deepcopy(cached[1])
         if response.status_code == 200:
             if response.encoding in ["ISO-8859-1"] or url[-5:] in ["probe"]:
-                return response.text
+                payload = response.text
             elif "was not found" not in response.text:
-                return response.json()
+                payload = self._decode(response)
+            else:
+                return {}
+            if cache_key is not None:
+                self._store_validators(cache_key, response.headers, payload)
+            return payload
         elif response.status_code == 401:
             raise AuthenticationError
         elif response.status_code >= 400:
             raise ApiPayloadError(message=response.text)
         return {}
 
+    def _decode(self, response: requests.Response) -> Any:
+        if self.json_backend.name == "json":
+            return response.json()
+        return self.json_backend.loads(response.content)
+
+    def _encode(self, headers: dict, json: Any) -> Optional[bytes]:
+        # The standard library backend leaves encoding to `requests`.
+        if self.json_backend.name == "json":
+            return None
+        headers["Content-Type"] = "application/json"
+        return self.json_backend.dumps(json)
+
+    def _store_validators(
+        self, key: Hashable, headers: Mapping[str, str], payload: Any
+    ) -> None:
+        validators = {}
+        if headers.get("ETag"):
+            validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+        if validators and self.validator_cache is not None:
+            self.validator_cache.set(key, (validators, copy.deepcopy(payload)))
+
+    def _iter_xml(
+        self,
+        url: str,
+        tag: str,
+        force_list: Sequence[str] = (),
+        params: Optional[dict] = None,
+    ) -> Iterator[Any]:
+        """Parse an XML response incrementally as it is read from the socket,
+        yielding each `tag` element once it is complete.
+        """
+        headers = dict(self.headers)
+        headers["Accept"] = "application/xml"
+        with self.session.get(
+            url,
+            auth=self.auth,
+            headers=headers,
+            params=params or {},
+            verify=self.verify_ssl,
+            timeout=self.timeout,
+            stream=True,
+        ) as response:
+            if response.status_code == 200:
+                response.raw.decode_content = True
+                yield from iter_xml(response.raw, tag=tag, force_list=force_list)
+            elif response.status_code == 401:
+                raise AuthenticationError
+            elif response.status_code >= 400:
+                raise ApiPayloadError(message=response.text)
+
     def _get_v1(
         self,
         url: str,
@@ -131,7 +649,7 @@ class Endpoint:
             headers = {}
         if not params:
             params = {}
-        response = requests.get(
+        response = self.session.get(
             url,
             auth=self.auth,
             headers=headers,
@@ -156,26 +674,27 @@ class Endpoint:
         self,
         url: str,
         headers: Optional[dict] = None,
-        data: Optional[str] = None,
+        data: Optional[Union[str, bytes, Iterator[bytes]]] = None,
         json: Optional[dict] = None,
         params: Optional[dict] = None,
     ) -> requests.Response:
-        if not headers:
-            headers = {}
+        headers = dict(headers) if headers else {}
         if not params:
             params = {}
         if json:
-            response = requests.post(
+            body = self._encode(headers, json)
+            payload = {"json": json} if body is None else {"data": body}
+            response = self.session.post(
                 url,
                 auth=self.auth,
                 headers=headers,
-                json=json,
                 params=params,
                 verify=self.verify_ssl,
                 timeout=self.timeout,
+                **payload,
             )
         elif data:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 auth=self.auth,
                 headers=headers,
@@ -185,7 +704,7 @@ class Endpoint:
                 timeout=self.timeout,
             )
         else:
-            response = requests.post(
+            response = self.session.post(
                 url,
                 auth=self.auth,
                 headers=headers,
@@ -204,22 +723,23 @@ class Endpoint:
         headers: Optional[dict] = None,
         params: Optional[dict] = None,
     ) -> requests.Response:
-        if not headers:
-            headers = {}
+        headers = dict(headers) if headers else {}
         if not params:
             params = {}
         if json:
-            response = requests.put(
+            body = self._encode(headers, json)
+            payload = {"json": json} if body is None else {"data": body}
+            response = self.session.put(
                 url,
                 auth=self.auth,
                 headers=headers,
-                json=json,
                 params=params,
                 verify=self.verify_ssl,
                 timeout=self.timeout,
+                **payload,
             )
         elif data:
-            response = requests.put(
+            response = self.session.put(
                 url,
                 auth=self.auth,
                 headers=headers,
@@ -229,7 +749,7 @@ class Endpoint:
                 timeout=self.timeout,
             )
         else:
-            response = requests.put(
+            response = self.session.put(
                 url,
                 auth=self.auth,
                 headers=headers,
@@ -266,7 +786,7 @@ class Endpoint:
         if not params:
             params = {}
         headers["Accept"] = "application/json"
-        response = requests.delete(
+        response = self.session.delete(
             url,
             auth=self.auth,
             headers=headers,
@@ -5,93 +5,135 @@
 "Business Service data access"
 
 import concurrent.futures
-from typing import List, Optional
+import warnings
+from typing import Dict, Hashable, List, Optional
 
 from tqdm import tqdm
 
 import pyonms.models.business_service
+from pyonms.cache import BusinessServiceCache
 from pyonms.dao.base import Endpoint
 
 
 class BSMAPI(Endpoint):
-    "Business Service API endpoint"
+    """Business Service API endpoint
+
+    Business services fetched through this endpoint are kept in `bsm_cache`,
+    a `pyonms.cache.BusinessServiceCache` that answers `find_bsm_name()`.
+    `get_bsm()` only reads from it once the record cache is enabled,
+    in which case `bsm_cache` is also the `record_cache`.
+    """
 
     def __init__(self, kwargs):
         super().__init__(**kwargs)
         self.url = self.base_v2 + "business-services"
-        self._init_cache()
-
-    def _init_cache(self):
-        self.cache = {}
-        self.cache_name = {}
+        if self.record_cache is None:
+            self.bsm_cache = BusinessServiceCache()
+
+    def enable_cache(self, maxsize: int = 10000, ttl: float = 300) -> None:
+        """Cache `get_bsm()` lookups in `bsm_cache`, replacing it with a new `pyonms.cache.BusinessServiceCache`.
+        Writes made through this endpoint invalidate the affected records.
+
+        Args:
+            maxsize (int): Maximum number of business services. Defaults to 10000.
+            ttl (float): Seconds a business service stays valid. Defaults to 300.
+        """
+        self.bsm_cache = BusinessServiceCache(maxsize=maxsize, ttl=ttl)
+        self.record_cache = self.bsm_cache
+
+    def _invalidate(self, key: Hashable) -> None:
+        self.bsm_cache.invalidate(key)
+
+    @property
+    def cache(self) -> Dict[int, pyonms.models.business_service.BusinessService]:
+        """Deprecated: snapshot of cached business services by ID. Use `get_bsm()` or `bsm_cache`."""
+        warnings.warn(
+            "`BSMAPI.cache` is deprecated, use `get_bsm()` or `BSMAPI.bsm_cache`",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.bsm_cache.by_id()
+
+    @property
+    def cache_name(self) -> Dict[str, int]:
+        """Deprecated: snapshot of cached business service IDs by name. Use `find_bsm_name()`."""
+        warnings.warn(
+            "`BSMAPI.cache_name` is deprecated, use `find_bsm_name()`",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return {name: bsm.id for name, bsm in self.bsm_cache.by_name().items()}
 
     def get_bsm(
         self, id: int  # pylint: disable=W0622
     ) -> Optional[pyonms.models.business_service.BusinessService]:
         """Get BusinessService object by ID number."""
-        record = self._get(url=f"{self.url}/{id}")
+        return self._cached(int(id), lambda: self._fetch_bsm(id))
+
+    def _fetch_bsm(
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.business_service.BusinessService]:
+        return self._store_bsm(self._get(url=f"{self.url}/{id}"))
+
+    def _store_bsm(
+        self, record: Optional[dict]
+    ) -> Optional[pyonms.models.business_service.BusinessService]:
         if record is not None:
             bsm = self._process_bsm(record)
-            self.cache[bsm.id] = bsm
-            self.cache_name[bsm.name] = bsm.id
+            self.bsm_cache.add(bsm)
             return bsm
         else:
             return None
 
-    def _get_bsm_ids(
-        self,
-    ) -> dict:
-        response = self._get(url=self.url)
-        if response.get("business-services"):
-            return response
-        else:
-            return {"business-services": []}
+    def _get_bsm_ids(self) -> List[int]:
+        return self._parse_bsm_ids(self._get(url=self.url))
+
+    @staticmethod
+    def _parse_bsm_ids(response: dict) -> List[int]:
+        # The collection lists each business service as `/api/v2/business-services/<id>`.
+        return [
+            int(service_url.rsplit("/", 1)[-1])
+            for service_url in response.get("business-services") or []
+        ]
 
     def get_bsms(
         self, threads: int = 10
     ) -> List[pyonms.models.business_service.BusinessService]:
-        """Get all BusinessService objects."""
+        """Get all BusinessService objects, refreshing the business service cache."""
         service_list = []
-        services = self._get_bsm_ids()
+        bsm_ids = self._get_bsm_ids()
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
             with tqdm(
-                total=len(services["business-services"]),
+                total=len(bsm_ids),
                 unit="business-service",
                 desc=f"Getting {self.name} Business Services",
             ) as progress:
                 futures = []
-                for service_url in services["business-services"]:
-                    future = pool.submit(
-                        self.get_bsm,
-                        id=service_url[26:],
-                    )
+                for bsm_id in bsm_ids:
+                    future = pool.submit(self._fetch_bsm, id=bsm_id)
                     future.add_done_callback(lambda p: progress.update())
                     futures.append(future)
                 for future in futures:
                     bsm = future.result()
                     if isinstance(bsm, pyonms.models.business_service.BusinessService):
-                        self.cache[bsm.id] = bsm
-                        self.cache_name[bsm.name] = bsm.id
                         service_list.append(bsm)
 
+        self.bsm_cache.replace(service_list)
         return service_list
 
     def find_bsm_name(
-        self, name: str, cache_only: bool = False
+        self, name: str, cache_only: bool = False, threads: int = 10
     ) -> Optional[pyonms.models.business_service.BusinessService]:
-        """Get all BusinessService objects and filter to matching names."""
-        if self.cache_name.get(name):
-            return self.cache[self.cache_name[name]]
-        elif cache_only:
-            return None
-        else:
-            services = self._get(url=self.url)
-            for service_url in services.get("business-services", []):
-                service_record = self._get(url=f"{self.hostname}{service_url}")
-                if service_record["name"] == name:
-                    return self._process_bsm(service_record)
-        return None
+        """Get BusinessService object by name.
+        On a cache miss, all business services are refreshed concurrently with `get_bsms`,
+        unless `cache_only` is set or the cache was fully refreshed within its TTL.
+        """
+        bsm = self.bsm_cache.get_name(name)
+        if bsm or cache_only or self.bsm_cache.complete:
+            return bsm
+        self.get_bsms(threads=threads)
+        return self.bsm_cache.get_name(name)
 
     def _process_bsm(
         self, data: dict
@@ -122,7 +164,13 @@ class BSMAPI(Endpoint):
     ) -> None:
         """Create new BusinessService object."""
         response = self._post(url=self.url, json=bsm.to_dict())
-        if "constraint [bsm_service_name_key]" in response.text:
+        self._check_bsm_created(bsm, response.text)
+
+    def _check_bsm_created(
+        self, bsm: pyonms.models.business_service.BusinessServiceRequest, text: str
+    ) -> None:
+        self.bsm_cache.mark_incomplete()
+        if "constraint [bsm_service_name_key]" in text:
             raise pyonms.models.exceptions.DuplicateEntityError(bsm.name, bsm)
 
     def update_bsm(
@@ -132,6 +180,7 @@ class BSMAPI(Endpoint):
     ):
         """Update existing BusinessService object."""
         self._put(url=f"{self.url}/{id}", json=bsm.to_dict())  # noqa: W0612
+        self._invalidate(int(id))
 
     def _merge_bsm_request(
         self,
@@ -161,7 +210,4 @@ class BSMAPI(Endpoint):
     def delete_bsm(self, bsm: pyonms.models.business_service.BusinessService) -> None:
         """Delete BusinessService object."""
         self._delete(url=f"{self.url}/{bsm.id}")
-        if self.cache.get(bsm.id):
-            del self.cache[bsm.id]
-        if self.cache_name.get(bsm.name):
-            del self.cache_name[bsm.name]
+        self._invalidate(bsm.id)
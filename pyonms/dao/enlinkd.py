@@ -2,9 +2,11 @@
 
 "Enlinkd Endpoint"
 
+import concurrent.futures
 from typing import List, Optional
 
 import pyonms.models.enlinkd
+import pyonms.utils
 from pyonms.dao.base import Endpoint
 
 
@@ -23,6 +25,51 @@ class EnlinkdAPI(Endpoint):
         else:
             return None
 
+    def get_topology_graph(
+        self, node_ids: Optional[List[int]] = None, threads: int = 10
+    ) -> pyonms.models.enlinkd.TopologyGraph:
+        """Get the links of many nodes concurrently and join them into one `TopologyGraph`.
+        A link reported by both of its ends appears once.
+
+        Args:
+            node_ids (List[int]): Node IDs to include. Defaults to every node.
+            threads (int): Concurrent requests. Defaults to 10.
+
+        Returns:
+            `pyonms.models.enlinkd.TopologyGraph` object
+        """
+        if node_ids is None:
+            node_ids = self._get_node_ids()
+        if not node_ids:
+            return pyonms.models.enlinkd.TopologyGraph()
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(threads, len(node_ids))
+        ) as pool:
+            topologies = list(pool.map(self.get_node_links, node_ids))
+        return self._build_topology_graph(node_ids, topologies)
+
+    @staticmethod
+    def _build_topology_graph(
+        node_ids: List[int],
+        topologies: List[Optional[pyonms.models.enlinkd.Topology]],
+    ) -> pyonms.models.enlinkd.TopologyGraph:
+        graph = pyonms.models.enlinkd.TopologyGraph()
+        for node_id, topology in zip(node_ids, topologies):
+            graph.add_topology(node_id, topology or pyonms.models.enlinkd.Topology())
+        return graph
+
+    def _get_node_ids(self) -> List[int]:
+        return [
+            int(record["id"])
+            for record in self._iter_batch(
+                url=f"{self.base_v2}nodes",
+                endpoint="node",
+                batch_size=1000,
+                hide_progress=True,
+            )
+            if record
+        ]
+
     def _process_topology(self, data: dict) -> pyonms.models.enlinkd.Topology:
         topology = pyonms.models.enlinkd.Topology()
         if data.get("bridgeLinkNodes"):
@@ -62,6 +109,11 @@ class EnlinkdAPI(Endpoint):
     def _process_bridge_links(
         self, data: list[dict]
     ) -> List[pyonms.models.enlinkd.BridgeLink]:
+        pyonms.utils.convert_record_times(
+            data,
+            ["bridgeLinkCreateTime", "bridgeLinkLastPollTime"],
+            convert=pyonms.utils.convert_link_times,
+        )
         links = []
         for link in data:
             links.append(pyonms.models.enlinkd.BridgeLink(**link))
@@ -70,6 +122,11 @@ class EnlinkdAPI(Endpoint):
     def _process_cdp_links(
         self, data: list[dict]
     ) -> List[pyonms.models.enlinkd.CdpLink]:
+        pyonms.utils.convert_record_times(
+            data,
+            ["cdpCreateTime", "cdpLastPollTime"],
+            convert=pyonms.utils.convert_link_times,
+        )
         links = []
         for link in data:
             links.append(pyonms.models.enlinkd.CdpLink(**link))
@@ -78,6 +135,11 @@ class EnlinkdAPI(Endpoint):
     def _process_isis_links(
         self, data: list[dict]
     ) -> List[pyonms.models.enlinkd.IsIsLink]:
+        pyonms.utils.convert_record_times(
+            data,
+            ["isisLinkCreateTime", "isisLinkLastPollTime"],
+            convert=pyonms.utils.convert_link_times,
+        )
         links = []
         for link in data:
             links.append(pyonms.models.enlinkd.IsIsLink(**link))
@@ -86,6 +148,11 @@ class EnlinkdAPI(Endpoint):
     def _process_lldp_links(
         self, data: list[dict]
     ) -> List[pyonms.models.enlinkd.LldpLink]:
+        pyonms.utils.convert_record_times(
+            data,
+            ["lldpCreateTime", "lldpLastPollTime"],
+            convert=pyonms.utils.convert_link_times,
+        )
         links = []
         for link in data:
             links.append(pyonms.models.enlinkd.LldpLink(**link))
@@ -94,6 +161,11 @@ class EnlinkdAPI(Endpoint):
     def _process_ospf_links(
         self, data: list[dict]
     ) -> List[pyonms.models.enlinkd.OspfLink]:
+        pyonms.utils.convert_record_times(
+            data,
+            ["ospfLinkCreateTime", "ospfLinkLastPollTime"],
+            convert=pyonms.utils.convert_link_times,
+        )
         links = []
         for link in data:
             links.append(pyonms.models.enlinkd.OspfLink(**link))
@@ -2,12 +2,17 @@
 
 "Events data access"
 
-from typing import List, Optional
+import threading
+from typing import Any, Callable, Iterator, List, Optional, Sequence
 
 import pyonms.models.event
 import pyonms.models.node
+import pyonms.utils
 from pyonms.dao.base import Endpoint
 
+EVENT_TIME_COLUMNS = ["time", "createTime"]
+LAST_EVENT_PARAMS = {"orderBy": "id", "order": "desc", "limit": 1}
+
 
 class EventAPI(Endpoint):
     "Events API endpoint"
@@ -20,6 +25,11 @@ class EventAPI(Endpoint):
         self, id: int  # pylint: disable=W0622
     ) -> Optional[pyonms.models.event.Event]:
         """Get event by ID number."""
+        return self._cached(id, lambda: self._fetch_event(id))
+
+    def _fetch_event(
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.event.Event]:
         record = self._get(url=f"{self.url}/{id}")
         if record is not None:
             return self._process_event(record)
@@ -27,24 +37,151 @@ class EventAPI(Endpoint):
             return None
 
     def get_events(
-        self, fiql: Optional[str] = None, limit: int = 100, batch_size: int = 100
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
     ) -> List[pyonms.models.event.Event]:
-        """Get all matching event objects."""
-        params = {}
-        if fiql:
-            params["_s"] = fiql
+        """Get all matching event objects.
+        Set `keyset` to page by ascending event ID instead of offset, starting after `after_id`.
+        """
+        params = self._fiql_params(fiql)
         records = self._get_batch(
             url=self.url,
             endpoint="event",
             limit=limit,
             batch_size=batch_size,
             params=params,
+            keyset=keyset,
+            after=after_id,
         )
-        events = []
-        for record in records:
+        return self._process_events(records)
+
+    def iter_events(
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 0,
+        batch_size: int = 100,
+        keyset: bool = False,
+        after_id: Optional[int] = None,
+    ) -> Iterator[pyonms.models.event.Event]:
+        """Iterate over matching events, fetching one page at a time.
+        Only the current page is held in memory.
+        Set `keyset` to page by ascending event ID instead of offset, which stays consistent
+        while new events arrive. Resume an interrupted pull with `after_id` set to the last ID seen.
+        """
+        params = self._fiql_params(fiql)
+        for record in self._iter_records(
+            url=self.url,
+            endpoint="event",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            keyset=keyset,
+            after=after_id,
+        ):
             if record:
-                events.append(self._process_event(record))
-        return events
+                yield self._process_event(record)
+
+    def get_events_table(
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Get all matching events as a pandas `DataFrame` or Arrow `Table`, without building `Event` objects.
+        See `pyonms.dao.alarms.AlarmAPI.get_alarms_table` for the arguments.
+        """
+        params = self._fiql_params(fiql)
+        return self._get_table(
+            url=self.url,
+            endpoint="event",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            output=output,
+            columns=columns,
+            time_columns=EVENT_TIME_COLUMNS,
+        )
+
+    def tail(
+        self,
+        fiql: Optional[str] = None,
+        after_id: Optional[int] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[pyonms.models.event.Event]:
+        """Follow new events, polling every `interval` seconds.
+        Each poll only fetches events with an ID above the last one seen,
+        starting after the newest existing event unless `after_id` is given.
+        Polling stops after `max_polls` cycles or once `stop` is set, otherwise it runs until interrupted.
+        Use `tail_forever` to pass events to a callback instead.
+        """
+        if after_id is None:
+            after_id = self._last_event_id()
+        params = self._fiql_params(fiql)
+        polls = 0
+        while stop is None or not stop.is_set():
+            for record in self._iter_records(
+                url=self.url,
+                endpoint="event",
+                batch_size=batch_size,
+                params=params,
+                keyset=True,
+                after=after_id,
+                hide_progress=True,
+            ):
+                after_id = record["id"]
+                yield self._process_event(record)
+            polls += 1
+            if max_polls and polls >= max_polls:
+                return
+            if self._pause(interval, stop):
+                return
+
+    def tail_forever(
+        self,
+        callback: Callable[[pyonms.models.event.Event], None],
+        fiql: Optional[str] = None,
+        after_id: Optional[int] = None,
+        interval: float = 30,
+        batch_size: int = 100,
+        max_polls: Optional[int] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Pass new events to `callback` as they are found.
+        Blocks until `max_polls` cycles have run or `stop` is set, which may happen from another thread
+        or from `callback`. Without either, it runs until interrupted.
+        See `tail` for the other arguments.
+        """
+        for event in self.tail(
+            fiql=fiql,
+            after_id=after_id,
+            interval=interval,
+            batch_size=batch_size,
+            max_polls=max_polls,
+            stop=stop,
+        ):
+            callback(event)
+
+    def _last_event_id(self) -> int:
+        return self._parse_last_event(self._get(url=self.url, params=LAST_EVENT_PARAMS))
+
+    @staticmethod
+    def _parse_last_event(records: dict) -> int:
+        if records and records.get("event"):
+            return records["event"][0]["id"]
+        return 0
+
+    def _process_events(self, records: List[dict]) -> List[pyonms.models.event.Event]:
+        pyonms.utils.convert_record_times(records, EVENT_TIME_COLUMNS)
+        return [self._process_event(record) for record in records if record]
 
     def _process_event(self, data: dict) -> pyonms.models.event.Event:
         return pyonms.models.event.Event(**data)
@@ -21,6 +21,11 @@ class ForeignSourceAPI(Endpoint):
         self, name: str
     ) -> Optional[pyonms.models.foreign_source.ForeignSource]:
         """Get foreign source definition."""
+        return self._cached(name, lambda: self._fetch_foreign_source(name))
+
+    def _fetch_foreign_source(
+        self, name: str
+    ) -> Optional[pyonms.models.foreign_source.ForeignSource]:
         record = self._get(url=f"{self.url}/{name}", endpoint="foreignSources")
         if record is not None:
             return self._process_foreign_source(record)
@@ -35,11 +40,16 @@ class ForeignSourceAPI(Endpoint):
             url=self.url,
             endpoint="foreignSources",
         )
-        foreign_sources = []
-        for record in records["foreignSources"]:
-            if record:
-                foreign_sources.append(self._process_foreign_source(record))
-        return foreign_sources
+        return self._process_foreign_sources(records)
+
+    def _process_foreign_sources(
+        self, records: dict
+    ) -> List[pyonms.models.foreign_source.ForeignSource]:
+        return [
+            self._process_foreign_source(record)
+            for record in records["foreignSources"]
+            if record
+        ]
 
     def _process_foreign_source(
         self, data: dict
@@ -67,4 +77,5 @@ class ForeignSourceAPI(Endpoint):
         response = self._post(
             url=self.url, headers=self.headers, json=foreign_source.to_dict()
         )
+        self._invalidate(foreign_source.name)
         return response
@@ -17,7 +17,11 @@ class HealthAPI(Endpoint):
 
     def get_health(self) -> Optional[pyonms.models.health.Health]:
         """Get health status from current server instance"""
-        record = self._get(url=f"{self.url}", endpoint="raw")
+        return self._report_health(self._get(url=f"{self.url}", endpoint="raw"))
+
+    def _report_health(
+        self, record: Optional[dict]
+    ) -> Optional[pyonms.models.health.Health]:
         if record is not None:
             health = self._process_health(record)
             if health.healthy is True:
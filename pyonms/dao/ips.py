@@ -4,7 +4,7 @@
 
 "IP Interface data access"
 
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 import pyonms.models.node
 from pyonms.dao.base import Endpoint
@@ -45,6 +45,57 @@ class IPAPI(Endpoint):
         Returns:
             List[pyonms.models.node.IPInterface]: List of `IPInterface` objects.
         """
+        params = self._search_params(
+            ip=ip, nodeId=nodeId, nodeLabel=nodeLabel, primary=primary
+        )
+        record = self._get_batch(
+            url=self.url,
+            limit=limit,
+            params=params,
+            batch_size=batch_size,
+            endpoint="ipInterface",
+        )
+        return self._process_ips(record)
+
+    def iter_ips(
+        self,
+        limit: int = 0,
+        batch_size: int = 100,
+        ip: Optional[str] = None,
+        nodeId: Optional[int] = None,
+        nodeLabel: Optional[str] = None,
+        primary: Optional[Union[pyonms.models.node.PrimaryType, str]] = None,
+    ) -> Iterator[pyonms.models.node.IPInterface]:
+        """Iterate over matching IP Interface objects, fetching one page at a time.
+            Search parameters are the same as `get_ips`.
+
+        Args:
+            limit (int, optional): Number of IPs to return. Defaults to 0 (all).
+            batch_size (int, optional): Number of IPs to return per page. Defaults to 100.
+
+        Returns:
+            Iterator[pyonms.models.node.IPInterface]: `IPInterface` objects.
+        """
+        params = self._search_params(
+            ip=ip, nodeId=nodeId, nodeLabel=nodeLabel, primary=primary
+        )
+        for address in self._iter_batch(
+            url=self.url,
+            limit=limit,
+            params=params,
+            batch_size=batch_size,
+            endpoint="ipInterface",
+        ):
+            if address:
+                yield self._process_ip(address)
+
+    def _search_params(
+        self,
+        ip: Optional[str] = None,
+        nodeId: Optional[int] = None,
+        nodeLabel: Optional[str] = None,
+        primary: Optional[Union[pyonms.models.node.PrimaryType, str]] = None,
+    ) -> dict:
         params = {}
         search = []
         if ip:
@@ -65,18 +116,10 @@ class IPAPI(Endpoint):
                     valid=pyonms.models.node.PrimaryType.list(),
                 )
         params["_s"] = ";".join(search)
-        record = self._get_batch(
-            url=self.url,
-            limit=limit,
-            params=params,
-            batch_size=batch_size,
-            endpoint="ipInterface",
-        )
-        ip_list = []
-        for address in record:
-            if address:
-                ip_list.append(self._process_ip(address))
-        return ip_list
+        return params
+
+    def _process_ips(self, records: List[dict]) -> List[pyonms.models.node.IPInterface]:
+        return [self._process_ip(record) for record in records if record]
 
     def _process_ip(self, data: dict) -> pyonms.models.node.IPInterface:
         ip = pyonms.models.node.IPInterface(**data)
@@ -1,18 +1,32 @@
 # dao.nodes.py
 
-# cspell:ignore snmpinterfaces, ipinterfaces
+# cspell:ignore snmpinterfaces, ipinterfaces, ifservices
 
 "Nodes data access"
 
 import concurrent.futures
 from enum import Enum
-from typing import List, Optional, Union
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from tqdm import tqdm
 
+import pyonms.cache
 import pyonms.models.node
+import pyonms.utils
 from pyonms.dao.base import Endpoint
 
+NODE_TIME_FIELDS = ["createTime", "lastCapsdPoll", "lastIngressFlow", "lastEgressFlow"]
+IP_TIME_FIELDS = ["lastCapsdPoll", "lastIngressFlow", "lastEgressFlow"]
+SERVICE_TIME_FIELDS = ["lastFail", "lastGood"]
+SNMP_TIME_FIELDS = [
+    "lastCapsdPoll",
+    "lastIngressFlow",
+    "lastEgressFlow",
+    "lastSnmpPoll",
+]
+NODE_TIME_COLUMNS = NODE_TIME_FIELDS + ["assetRecord.lastModifiedDate"]
+
 
 class NodeComponents(Enum):
     """Node components to retrieve from API."""
@@ -39,8 +53,14 @@ class NodeAPI(Endpoint):
         components: Optional[List[NodeComponents]] = None,
     ) -> Optional[pyonms.models.node.Node]:
         """Get node by database ID number."""
-        if not components:
-            components = [NodeComponents.NONE]
+        components = self._default_components(components)
+        return self._cached(
+            (id, frozenset(components)), lambda: self._fetch_node(id, components)
+        )
+
+    def _fetch_node(
+        self, id: int, components: List[NodeComponents]  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.node.Node]:
         record = self._get(url=f"{self.url}/{id}")
         if record is not None:
             return self._process_node(record, components=components)
@@ -54,14 +74,16 @@ class NodeAPI(Endpoint):
         batch_size: int = 100,
         components: Optional[List[NodeComponents]] = None,
         threads: int = 10,
+        bulk: bool = False,
     ) -> List[pyonms.models.node.Node]:
-        """Get all matching Node objects."""
-        if not components:
-            components = [NodeComponents.NONE]
-        devices: List[pyonms.models.node.Node] = []
-        params = {}
-        if fiql:
-            params["_s"] = fiql
+        """Get all matching Node objects.
+        Set `bulk` to hydrate IP interfaces, services, and SNMP interfaces for a whole
+        batch of nodes with one collection query each, instead of one call per node and IP.
+        Metadata has no collection endpoint, so with `METADATA` or `ALL` it is still fetched
+        with one call per node, per IP interface, and per service, even with `bulk`.
+        """
+        components = self._default_components(components)
+        params = self._fiql_params(fiql)
         records = self._get_batch(
             url=self.url,
             endpoint="node",
@@ -70,7 +92,158 @@ class NodeAPI(Endpoint):
             params=params,
         )
         if records == [None]:
+            return []
+        if bulk:
+            return self._process_nodes_bulk(
+                records, components=components, threads=threads
+            )
+        return self._process_nodes(records, components=components, threads=threads)
+
+    def get_nodes_table(
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+        output: str = "pandas",
+        columns: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Get all matching nodes as a pandas `DataFrame` or Arrow `Table`, without building `Node` objects.
+        Only the fields returned by the node collection are included; components are not hydrated.
+        See `pyonms.dao.alarms.AlarmAPI.get_alarms_table` for the arguments.
+        """
+        params = self._fiql_params(fiql)
+        return self._get_table(
+            url=self.url,
+            endpoint="node",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+            output=output,
+            columns=columns,
+            time_columns=NODE_TIME_COLUMNS,
+        )
+
+    def iter_nodes(
+        self,
+        fiql: Optional[str] = None,
+        limit: int = 0,
+        batch_size: int = 100,
+        components: Optional[List[NodeComponents]] = None,
+        threads: int = 10,
+        bulk: bool = False,
+    ) -> Iterator[pyonms.models.node.Node]:
+        """Iterate over matching Node objects, fetching and hydrating one page at a time.
+        Only the current page is held in memory. See `get_nodes` for `bulk`.
+        """
+        components = self._default_components(components)
+        params = self._fiql_params(fiql)
+        records = self._iter_batch(
+            url=self.url,
+            endpoint="node",
+            limit=limit,
+            batch_size=batch_size,
+            params=params,
+        )
+        process = self._process_nodes_bulk if bulk else self._process_nodes
+        while page := list(islice(records, batch_size)):
+            yield from process(
+                page, components=components, threads=threads, hide_progress=True
+            )
+
+    def get_nodes_cached(
+        self,
+        cache: pyonms.cache.NodeCache,
+        fiql: Optional[str] = None,
+        batch_size: int = 100,
+        components: Optional[List[NodeComponents]] = None,
+        threads: int = 10,
+        bulk: bool = False,
+        prune: bool = True,
+    ) -> List[pyonms.models.node.Node]:
+        """Get all matching Node objects through a persistent `pyonms.cache.NodeCache`.
+        The first call hydrates and stores every matching node. Later calls only refetch nodes
+        whose `lastCapsdPoll` or `createTime` is at or after the newest value already cached,
+        and with `prune` drop cached nodes that no longer exist on the server.
+        Changing `fiql` or `components` rebuilds this server's cache.
+        """
+        components = self._default_components(components)
+        scope, incremental, watermark, params = self._cached_query(
+            cache, fiql, components
+        )
+        records = [
+            record
+            for record in self._iter_batch(
+                url=self.url,
+                endpoint="node",
+                limit=0,
+                batch_size=batch_size,
+                params=params,
+            )
+            if record
+        ]
+        watermark = self._node_watermark(records, watermark)
+        process = self._process_nodes_bulk if bulk else self._process_nodes
+        cache.put(self.name, process(records, components=components, threads=threads))
+        if incremental and prune:
+            current = {
+                record["id"]
+                for record in self._iter_batch(
+                    url=self.url,
+                    endpoint="node",
+                    batch_size=batch_size,
+                    params=self._fiql_params(fiql),
+                    hide_progress=True,
+                )
+            }
+            cache.delete(self.name, cache.ids(self.name) - current)
+        cache.set_watermark(self.name, scope, watermark)
+        return cache.get_all(self.name)
+
+    def _cached_query(
+        self,
+        cache: pyonms.cache.NodeCache,
+        fiql: Optional[str],
+        components: List[NodeComponents],
+    ) -> Tuple[str, bool, int, dict]:
+        # Returns the cache scope, whether the refresh is incremental, the starting
+        # watermark, and the node query parameters. A changed scope clears the cache.
+        scope = repr((fiql, sorted(str(component.value) for component in components)))
+        state = cache.get_watermark(self.name)
+        incremental = state is not None and state[0] == scope
+        params = {}
+        if incremental:
+            watermark = state[1]  # type: ignore
+            since = pyonms.utils.fiql_time(watermark)
+            changed = f"lastCapsdPoll=ge={since},createTime=ge={since}"
+            params["_s"] = f"({fiql});({changed})" if fiql else changed
+        else:
+            watermark = 0
+            cache.clear(self.name)
+            if fiql:
+                params["_s"] = fiql
+        return scope, incremental, watermark, params
+
+    @staticmethod
+    def _node_watermark(records: List[dict], watermark: int) -> int:
+        for record in records:
+            watermark = max(
+                watermark,
+                record.get("lastCapsdPoll") or 0,
+                record.get("createTime") or 0,
+            )
+        return watermark
+
+    def _process_nodes(
+        self,
+        records: List[dict],
+        components: list,
+        threads: int = 10,
+        hide_progress: bool = False,
+    ) -> List[pyonms.models.node.Node]:
+        devices: List[pyonms.models.node.Node] = []
+        if not records:
             return devices
+        pyonms.utils.convert_record_times(records, NODE_TIME_FIELDS)
         if threads > len(records):
             threads = len(records)
         with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
@@ -78,6 +251,7 @@ class NodeAPI(Endpoint):
                 total=len(records),
                 unit="node",
                 desc=f"Hydrating {self.name} Node objects",
+                disable=hide_progress,
             ) as progress:
                 futures = []
                 for record in records:
@@ -92,114 +266,299 @@ class NodeAPI(Endpoint):
                     devices.append(result)
         return devices
 
+    def _process_nodes_bulk(
+        self,
+        records: List[dict],
+        components: list,
+        threads: int = 10,
+        hide_progress: bool = False,
+        bulk_size: int = 100,
+    ) -> List[pyonms.models.node.Node]:
+        nodes = self._process_node_records(records)
+        if not nodes or components in [[NodeComponents.NONE], []]:
+            return nodes
+        hydrate = self._hydrate_flags(components)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+            with tqdm(
+                total=len(nodes),
+                unit="node",
+                desc=f"Hydrating {self.name} Node objects",
+                disable=hide_progress,
+            ) as progress:
+                for index in range(0, len(nodes), bulk_size):
+                    batch = nodes[index : index + bulk_size]
+                    self._hydrate_node_batch(pool=pool, nodes=batch, **hydrate)
+                    progress.update(len(batch))
+        return nodes
+
+    @staticmethod
+    def _default_components(
+        components: Optional[List[NodeComponents]],
+    ) -> List[NodeComponents]:
+        return components or [NodeComponents.NONE]
+
+    @staticmethod
+    def _expand_components(components: List[NodeComponents]) -> List[NodeComponents]:
+        if NodeComponents.ALL in components:
+            return [
+                NodeComponents.SERVICES,
+                NodeComponents.SNMP,
+                NodeComponents.METADATA,
+                NodeComponents.HARDWARE,
+            ]
+        return components
+
+    @classmethod
+    def _hydrate_flags(cls, components: List[NodeComponents]) -> Dict[str, bool]:
+        # Keyword arguments for `_hydrate_node_batch()`.
+        components = cls._expand_components(components)
+        return {
+            "ips": NodeComponents.IP in components
+            or NodeComponents.SERVICES in components,
+            "services": NodeComponents.SERVICES in components,
+            "snmp": NodeComponents.SNMP in components,
+            "metadata": NodeComponents.METADATA in components,
+            "hardware": NodeComponents.HARDWARE in components,
+        }
+
+    @staticmethod
+    def _node_ids_fiql(node_ids: Iterable[int]) -> str:
+        return ",".join(f"node.id=={node_id}" for node_id in node_ids)
+
+    @staticmethod
+    def _process_node_records(records: List[dict]) -> List[pyonms.models.node.Node]:
+        pyonms.utils.convert_record_times(records, NODE_TIME_FIELDS)
+        return [pyonms.models.node.Node(**record) for record in records if record]
+
+    @staticmethod
+    def _process_snmp_interfaces(
+        records: List[dict],
+    ) -> List[pyonms.models.node.SnmpInterface]:
+        return [
+            pyonms.models.node.SnmpInterface(**record) for record in records if record
+        ]
+
+    @staticmethod
+    def _process_ip_interfaces(
+        records: List[dict],
+    ) -> List[pyonms.models.node.IPInterface]:
+        return [
+            pyonms.models.node.IPInterface(**record) for record in records if record
+        ]
+
+    @staticmethod
+    def _process_services(records: List[dict]) -> List[pyonms.models.node.Service]:
+        services: List[pyonms.models.node.Service] = []
+        for record in records:
+            if record:
+                service = pyonms.models.node.Service(**record)
+                if service not in services:
+                    services.append(service)
+        return services
+
+    @staticmethod
+    def _process_metadata(records: List[dict]) -> List[pyonms.models.node.Metadata]:
+        return [pyonms.models.node.Metadata(**record) for record in records if record]
+
+    def _metadata_url(
+        self,
+        node_id: int,
+        ipaddress: Optional[str] = None,
+        service: Optional[str] = None,
+    ) -> str:
+        url = f"{self.url}/{node_id}"
+        if ipaddress:
+            url += f"/ipinterfaces/{ipaddress}"
+            if service:
+                url += f"/services/{service}"
+        return f"{url}/metadata"
+
+    def _hydrate_node_batch(
+        self,
+        pool: concurrent.futures.ThreadPoolExecutor,
+        nodes: List[pyonms.models.node.Node],
+        ips: bool = False,
+        services: bool = False,
+        snmp: bool = False,
+        metadata: bool = False,
+        hardware: bool = False,
+    ) -> None:
+        node_map = {node.id: node for node in nodes}
+        fiql = self._node_ids_fiql(node_map)
+        futures = {}
+        if ips:
+            futures["ip"] = pool.submit(
+                self._get_collection, "ipinterfaces", "ipInterface", fiql
+            )
+        if services:
+            futures["service"] = pool.submit(
+                self._get_collection, "ifservices", "service", fiql
+            )
+        if snmp:
+            futures["snmp"] = pool.submit(
+                self._get_collection, "snmpinterfaces", "snmpInterface", fiql
+            )
+        node_metadata = {}
+        if metadata:
+            node_metadata = {
+                node.id: pool.submit(self._get_node_metadata, node.id) for node in nodes
+            }
+        hardware_inventory = {}
+        if hardware:
+            hardware_inventory = {
+                node.id: pool.submit(self._get_node_hardware, node.id) for node in nodes
+            }
+
+        ip_map = self._join_node_components(
+            node_map,
+            ip_records=futures["ip"].result() if ips else None,
+            service_records=futures["service"].result() if services else None,
+            snmp_records=futures["snmp"].result() if snmp else None,
+        )
+        if metadata:
+            # Metadata has no collection endpoint, so it is fetched per resource
+            # on the shared pool and joined once all requests complete.
+            ip_metadata = {}
+            service_metadata = {}
+            for ip in ip_map.values():
+                node_id = ip.nodeId
+                ip_metadata[ip.id] = pool.submit(
+                    self._get_ip_metadata, node_id, ip.ipAddress  # type: ignore
+                )
+                for service in ip.services:
+                    service_metadata[(ip.id, service.id)] = pool.submit(
+                        self._get_service_metadata,
+                        node_id,  # type: ignore
+                        ip.ipAddress,  # type: ignore
+                        service.serviceType.name,  # type: ignore
+                    )
+            for node_id, metadata_future in node_metadata.items():
+                node_map[node_id].metadata = metadata_future.result()  # type: ignore
+            for ip in ip_map.values():
+                ip.metadata = ip_metadata[ip.id].result()
+                for service in ip.services:
+                    service.metadata = service_metadata[(ip.id, service.id)].result()
+        for node_id, hardware_future in hardware_inventory.items():
+            node_map[node_id].hardwareInventory = hardware_future.result()
+
+    @staticmethod
+    def _join_node_components(
+        node_map: Dict[int, pyonms.models.node.Node],
+        ip_records: Optional[List[dict]] = None,
+        service_records: Optional[List[dict]] = None,
+        snmp_records: Optional[List[dict]] = None,
+    ) -> Dict[int, pyonms.models.node.IPInterface]:
+        # Attaches collection records to their nodes and returns the IP interfaces by ID.
+        # Record lists that were not requested are `None` and leave the nodes untouched.
+        ip_map: Dict[int, pyonms.models.node.IPInterface] = {}
+        if ip_records is not None:
+            for node in node_map.values():
+                node.ipInterfaces = []
+            pyonms.utils.convert_record_times(ip_records, IP_TIME_FIELDS)
+            for record in ip_records:
+                ip = pyonms.models.node.IPInterface(**record)
+                if ip.nodeId in node_map:
+                    node_map[ip.nodeId].ipInterfaces.append(ip)
+                    ip_map[ip.id] = ip  # type: ignore
+        if service_records is not None:
+            pyonms.utils.convert_record_times(service_records, SERVICE_TIME_FIELDS)
+            for record in service_records:
+                service = pyonms.models.node.Service(**record)
+                ip = ip_map.get(service.ipInterfaceId)  # type: ignore
+                if ip and service not in ip.services:
+                    ip.services.append(service)
+        if snmp_records is not None:
+            for node in node_map.values():
+                node.snmpInterfaces = []
+            pyonms.utils.convert_record_times(snmp_records, SNMP_TIME_FIELDS)
+            for record in snmp_records:
+                snmp_interface = pyonms.models.node.SnmpInterface(**record)
+                if snmp_interface.nodeId in node_map:
+                    node_map[snmp_interface.nodeId].snmpInterfaces.append(
+                        snmp_interface
+                    )
+        return ip_map
+
+    def _get_collection(self, collection: str, endpoint: str, fiql: str) -> List[dict]:
+        return [
+            record
+            for record in self._iter_batch(
+                url=f"{self.base_v2}{collection}",
+                endpoint=endpoint,
+                batch_size=1000,
+                params={"_s": fiql},
+                hide_progress=True,
+            )
+            if record
+        ]
+
     def _get_node_snmpinterfaces(
         self, node_id: int
     ) -> List[pyonms.models.node.SnmpInterface]:
-        interfaces = []
         records = self._get_batch(
             url=f"{self.url}/{node_id}/snmpinterfaces",
             endpoint="snmpInterface",
             hide_progress=True,
         )
-        if records:
-            for snmp_interface in records:
-                if snmp_interface:
-                    interfaces.append(
-                        pyonms.models.node.SnmpInterface(**snmp_interface)
-                    )
-        return interfaces
+        return self._process_snmp_interfaces(records)
 
     def _get_node_ip_addresses(
         self, node_id: int, services: bool = False, metadata: bool = False
     ) -> List[pyonms.models.node.IPInterface]:
-        ip_addresses = []
         records = self._get_batch(
             url=f"{self.url}/{node_id}/ipinterfaces",
             endpoint="ipInterface",
             hide_progress=True,
         )
-        if records:
-            for ip_interface in records:
-                if ip_interface:
-                    ip = pyonms.models.node.IPInterface(**ip_interface)
-                    if services:
-                        ip.services = self._get_node_ip_services(
-                            node_id=node_id,
-                            ip_address=ip.ipAddress,  # type:ignore
-                            metadata=metadata,
-                        )
-                    if metadata:
-                        ip.metadata = self._get_ip_metadata(
-                            node_id=node_id,
-                            ipaddress=ip.ipAddress,  # type:ignore
-                        )
-                    ip_addresses.append(ip)
-                else:
-                    pass
+        ip_addresses = self._process_ip_interfaces(records)
+        for ip in ip_addresses:
+            if services:
+                ip.services = self._get_node_ip_services(
+                    node_id=node_id,
+                    ip_address=ip.ipAddress,  # type: ignore
+                    metadata=metadata,
+                )
+            if metadata:
+                ip.metadata = self._get_ip_metadata(
+                    node_id=node_id,
+                    ipaddress=ip.ipAddress,  # type: ignore
+                )
         return ip_addresses
 
     def _get_node_ip_services(
         self, node_id: int, ip_address: str, metadata: bool = False
     ) -> List[pyonms.models.node.Service]:
-        services = []
         records = self._get_batch(
             url=f"{self.url}/{node_id}/ipinterfaces/{ip_address}/services",
             endpoint="service",
             hide_progress=True,
         )
-        if records:
-            for service in records:
-                if service:
-                    new_service = pyonms.models.node.Service(**service)
-                    if metadata:
-                        new_service.metadata = self._get_service_metadata(
-                            node_id=node_id,
-                            ipaddress=ip_address,
-                            service=new_service.serviceType.name,  # type: ignore
-                        )
-                    if new_service not in services:
-                        services.append(new_service)
+        services = self._process_services(records)
+        if metadata:
+            for service in services:
+                service.metadata = self._get_service_metadata(
+                    node_id=node_id,
+                    ipaddress=ip_address,
+                    service=service.serviceType.name,  # type: ignore
+                )
         return services
 
+    def _get_metadata(self, url: str) -> List[pyonms.models.node.Metadata]:
+        records = self._get_batch(url=url, endpoint="metaData", hide_progress=True)
+        return self._process_metadata(records)
+
     def _get_node_metadata(self, node_id: int) -> List[pyonms.models.node.Metadata]:
-        records = self._get_batch(
-            url=f"{self.url}/{node_id}/metadata",
-            endpoint="metaData",
-            hide_progress=True,
-        )
-        metadata = []
-        for record in records:
-            if record:
-                metadata.append(pyonms.models.node.Metadata(**record))
-        return metadata
+        return self._get_metadata(url=self._metadata_url(node_id))
 
     def _get_ip_metadata(
         self, node_id: int, ipaddress: str
     ) -> List[pyonms.models.node.Metadata]:
-        records = self._get_batch(
-            url=f"{self.url}/{node_id}/ipinterfaces/{ipaddress}/metadata",
-            endpoint="metaData",
-            hide_progress=True,
-        )
-        metadata = []
-        for record in records:
-            if record:
-                metadata.append(pyonms.models.node.Metadata(**record))
-        return metadata
+        return self._get_metadata(url=self._metadata_url(node_id, ipaddress))
 
     def _get_service_metadata(
         self, node_id: int, ipaddress: str, service: str
     ) -> List[pyonms.models.node.Metadata]:
-        records = self._get_batch(
-            url=f"{self.url}/{node_id}/ipinterfaces/{ipaddress}/services/{service}/metadata",
-            endpoint="metaData",
-            hide_progress=True,
-        )
-        metadata = []
-        for record in records:
-            if record:
-                metadata.append(pyonms.models.node.Metadata(**record))
-        return metadata
+        return self._get_metadata(url=self._metadata_url(node_id, ipaddress, service))
 
     def _get_node_hardware(
         self, node_id: int
@@ -209,32 +568,32 @@ class NodeAPI(Endpoint):
 
     def _process_node(self, data: dict, components: list) -> pyonms.models.node.Node:
         node = pyonms.models.node.Node(**data)
-        if NodeComponents.ALL in components:
+        hydrate = self._hydrate_flags(components)
+        if hydrate["metadata"]:
+            node.metadata = self._get_node_metadata(node.id)  # type: ignore
+        if hydrate["ips"]:
             node.ipInterfaces = self._get_node_ip_addresses(
-                node.id, services=True, metadata=True
-            )  # type:ignore
-            node.snmpInterfaces = self._get_node_snmpinterfaces(node.id)  # type:ignore
-            node.metadata = self._get_node_metadata(node.id)  # type:ignore
+                node.id, services=hydrate["services"], metadata=hydrate["metadata"]
+            )  # type: ignore
+        if hydrate["snmp"]:
+            node.snmpInterfaces = self._get_node_snmpinterfaces(node.id)  # type: ignore
+        if hydrate["hardware"]:
             node.hardwareInventory = self._get_node_hardware(node.id)
+        return node
+
+    @staticmethod
+    def _node_id(node: Union[int, pyonms.models.node.Node]) -> int:
+        if isinstance(node, int):
             return node
-        get_metadata = False
-        if NodeComponents.METADATA in components:
-            node.metadata = self._get_node_metadata(node.id)  # type:ignore
-            get_metadata = True
-        if NodeComponents.SERVICES in components:
-            node.ipInterfaces = self._get_node_ip_addresses(
-                node.id, services=True, metadata=get_metadata
-            )  # type:ignore
-        elif NodeComponents.IP in components:
-            node.ipInterfaces = self._get_node_ip_addresses(
-                node.id, services=False, metadata=get_metadata
-            )  # type:ignore
-        if NodeComponents.SNMP in components:
-            node.snmpInterfaces = self._get_node_snmpinterfaces(node.id)  # type:ignore
-        if NodeComponents.HARDWARE in components:
-            node.hardwareInventory = self._get_node_hardware(node.id)
+        if isinstance(node, pyonms.models.node.Node):
+            return node.id
+        raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
 
-        return node
+    def _invalidate_node(self, node_id: int) -> None:
+        if self.record_cache is not None:
+            self.record_cache.invalidate_if(
+                lambda key: isinstance(key, tuple) and key[0] == node_id
+            )
 
     def set_node_metadata(
         self,
@@ -242,25 +601,17 @@ class NodeAPI(Endpoint):
         metadata: pyonms.models.node.Metadata,
     ):
         """Set custom metadata on a node."""
-        if isinstance(node, int):
-            node_id = node
-        elif isinstance(node, pyonms.models.node.Node):
-            node_id = node.id
-        else:
-            raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
-        self._post(url=f"{self.url}/{node_id}/metadata", json=metadata.to_dict())
+        node_id = self._node_id(node)
+        self._post(url=self._metadata_url(node_id), json=metadata.to_dict())
+        self._invalidate_node(node_id)
 
     def remove_node_metadata(
         self, node: Union[int, pyonms.models.node.Node], context: str, key: str
     ):
         """Remove custom metadata from a node."""
-        if isinstance(node, int):
-            node_id = node
-        elif isinstance(node, pyonms.models.node.Node):
-            node_id = node.id
-        else:
-            raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
-        self._delete(url=f"{self.url}/{node_id}/metadata/{context}/{key}")
+        node_id = self._node_id(node)
+        self._delete(url=f"{self._metadata_url(node_id)}/{context}/{key}")
+        self._invalidate_node(node_id)
 
     def set_ip_metadata(
         self,
@@ -269,30 +620,17 @@ class NodeAPI(Endpoint):
         metadata: pyonms.models.node.Metadata,
     ):
         """Set custom metadata on an IP interface."""
-        if isinstance(node, int):
-            node_id = node
-        elif isinstance(node, pyonms.models.node.Node):
-            node_id = node.id
-        else:
-            raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
-        self._post(
-            url=f"{self.url}/{node_id}/ipinterfaces/{ip}/metadata",
-            json=metadata.to_dict(),
-        )
+        node_id = self._node_id(node)
+        self._post(url=self._metadata_url(node_id, ip), json=metadata.to_dict())
+        self._invalidate_node(node_id)
 
     def remove_ip_metadata(
         self, node: Union[int, pyonms.models.node.Node], ip: str, context: str, key: str
     ):
         """Remove custom metadata from an IP interface."""
-        if isinstance(node, int):
-            node_id = node
-        elif isinstance(node, pyonms.models.node.Node):
-            node_id = node.id
-        else:
-            raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
-        self._delete(
-            url=f"{self.url}/{node_id}/ipinterfaces/{ip}/metadata/{context}/{key}"
-        )
+        node_id = self._node_id(node)
+        self._delete(url=f"{self._metadata_url(node_id, ip)}/{context}/{key}")
+        self._invalidate_node(node_id)
 
     def set_service_metadata(
         self,
@@ -302,16 +640,11 @@ class NodeAPI(Endpoint):
         metadata: pyonms.models.node.Metadata,
     ):
         """Set custom metadata on an IP service."""
-        if isinstance(node, int):
-            node_id = node
-        elif isinstance(node, pyonms.models.node.Node):
-            node_id = node.id
-        else:
-            raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
+        node_id = self._node_id(node)
         self._post(
-            url=f"{self.url}/{node_id}/ipinterfaces/{ip}/services/{service}/metadata",
-            json=metadata.to_dict(),
+            url=self._metadata_url(node_id, ip, service), json=metadata.to_dict()
         )
+        self._invalidate_node(node_id)
 
     def remove_service_metadata(
         self,
@@ -322,12 +655,6 @@ class NodeAPI(Endpoint):
         key: str,
     ):
         """Remove custom metadata from an IP service."""
-        if isinstance(node, int):
-            node_id = node
-        elif isinstance(node, pyonms.models.node.Node):
-            node_id = node.id
-        else:
-            raise pyonms.models.exceptions.InvalidValueError(name="node", value=node)
-        self._delete(
-            url=f"{self.url}/{node_id}/ipinterfaces/{ip}/services/{service}/metadata/{context}/{key}"
-        )
+        node_id = self._node_id(node)
+        self._delete(url=f"{self._metadata_url(node_id, ip, service)}/{context}/{key}")
+        self._invalidate_node(node_id)
@@ -2,12 +2,14 @@
 
 "Requisitions data access"
 
-from typing import List, Optional, Union
+import concurrent.futures
+from typing import Iterator, List, Optional, Union
 
 from requests import Response
 
 import pyonms.models.requisition
 from pyonms.dao.base import Endpoint
+from pyonms.models import exceptions
 from pyonms.utils import normalize_dict
 
 
@@ -39,6 +41,26 @@ class RequisitionsAPI(Endpoint):
         else:
             return None
 
+    def iter_requisition_nodes(
+        self, name: str
+    ) -> Iterator[pyonms.models.requisition.RequisitionNode]:
+        """Get the nodes of a requisition one at a time, parsing the XML response as it arrives.
+        Memory use does not grow with the size of the requisition.
+
+        Args:
+            name (str): Requisition name.
+
+        Returns:
+            Iterator of `pyonms.models.requisition.RequisitionNode` objects
+        """
+        for record in self._iter_xml(
+            url=f"{self.url}/{name}",
+            tag="node",
+            force_list=pyonms.models.requisition.XML_LIST_KEYS,
+        ):
+            if record:
+                yield pyonms.models.requisition.RequisitionNode(**record)
+
     def get_requisitions(
         self,
     ) -> List[pyonms.models.requisition.Requisition]:
@@ -47,11 +69,16 @@ class RequisitionsAPI(Endpoint):
             url=self.url,
             endpoint="model-import",
         )
-        requisitions = []
-        for record in records["model-import"]:
-            if record:
-                requisitions.append(self._process_requisition(record))
-        return requisitions
+        return self._process_requisitions(records)
+
+    def _process_requisitions(
+        self, records: dict
+    ) -> List[pyonms.models.requisition.Requisition]:
+        return [
+            self._process_requisition(record)
+            for record in records["model-import"]
+            if record
+        ]
 
     def _process_requisition(self, data: dict) -> pyonms.models.requisition.Requisition:
         # if data.get("foreign-source"):
@@ -88,13 +115,43 @@ class RequisitionsAPI(Endpoint):
             return False
 
     def update_requisition(
-        self, requisition: pyonms.models.requisition.Requisition
+        self,
+        requisition: pyonms.models.requisition.Requisition,
+        stream: Optional[str] = None,
     ) -> Response:
-        """Post an entire requisition to create or overwrite."""
-        response = self._post(
-            url=self.url, headers=self.headers, json=requisition.to_dict()
+        """Post an entire requisition to create or overwrite.
+
+        Args:
+            requisition (`Requisition`): Requisition to post.
+            stream (str): Set to `json` or `xml` to serialize the requisition one node at a time
+                into a chunked request body, instead of building the whole payload in memory.
+                Defaults to `None`.
+        """  # noqa
+        if stream is None:
+            return self._post(
+                url=self.url, headers=self.headers, json=requisition.to_dict()
+            )
+        return self._post(
+            url=self.url,
+            headers=self._stream_headers(stream),
+            data=self._stream(requisition, stream),
+        )
+
+    def _stream_headers(self, stream: str) -> dict:
+        headers = dict(self.headers)
+        headers["Content-Type"] = f"application/{stream}"
+        return headers
+
+    def _stream(
+        self, requisition: pyonms.models.requisition.Requisition, stream: str
+    ) -> Iterator[bytes]:
+        if stream == "json":
+            return requisition.iter_json(dumps=self.json_backend.dumps)
+        elif stream == "xml":
+            return requisition.iter_xml()
+        raise exceptions.InvalidValueError(
+            name="stream", value=stream, valid=["json", "xml", None]
         )
-        return response
 
     def update_node(
         self,
@@ -102,11 +159,81 @@ class RequisitionsAPI(Endpoint):
         node: pyonms.models.requisition.RequisitionNode,
     ) -> Response:
         """Post a single node to create or overwrite."""
-        if isinstance(requisition, pyonms.models.requisition.Requisition):
-            requisition = requisition.foreign_source
         response = self._post(
-            url=f"{self.url}/{requisition}/nodes",
+            url=self._nodes_url(requisition),
             headers=self.headers,
             json=node.to_dict(),
         )
         return response
+
+    def delete_node(
+        self,
+        requisition: Union[str, pyonms.models.requisition.Requisition],
+        foreign_id: str,
+    ) -> dict:
+        """Delete a single node from a requisition."""
+        return self._delete(url=f"{self._nodes_url(requisition)}/{foreign_id}")
+
+    def _nodes_url(
+        self, requisition: Union[str, pyonms.models.requisition.Requisition]
+    ) -> str:
+        if isinstance(requisition, pyonms.models.requisition.Requisition):
+            requisition = requisition.foreign_source
+        return f"{self.url}/{requisition}/nodes"
+
+    def sync_requisition(
+        self,
+        desired: pyonms.models.requisition.Requisition,
+        threads: int = 10,
+        rescan: bool = False,
+    ) -> pyonms.models.requisition.RequisitionDiff:
+        """Bring a requisition in line with the desired version, sending only the nodes that differ.
+        Added and changed nodes are posted, and removed nodes deleted, concurrently.
+        A single import is triggered afterwards, and skipped when nothing changed.
+        A requisition that does not exist yet is posted in full.
+
+        Args:
+            desired (`Requisition`): Desired contents of the requisition.
+            threads (int): Concurrent requests. Defaults to 10.
+            rescan (bool): Rescan existing nodes on import. Defaults to `False`.
+
+        Returns:
+            `pyonms.models.requisition.RequisitionDiff` of the changes made
+        """
+        name = desired.foreign_source
+        if name in self.get_requisition_names():
+            current = self.get_requisition(name)
+        else:
+            current = None
+        if current is None:
+            diff = pyonms.models.requisition.Requisition(foreign_source=name).diff(
+                desired
+            )
+            self.update_requisition(desired)
+        else:
+            diff = current.diff(desired)
+            updates = self._sync_updates(desired, diff)
+            if updates or diff.removed:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(threads, len(updates) + len(diff.removed))
+                ) as pool:
+                    futures: List[concurrent.futures.Future] = [
+                        pool.submit(self.update_node, name, node) for node in updates
+                    ]
+                    futures += [
+                        pool.submit(self.delete_node, name, foreign_id)
+                        for foreign_id in diff.removed
+                    ]
+                    for future in futures:
+                        future.result()
+        if diff:
+            self.import_requisition(name, rescan=rescan)
+        return diff
+
+    @staticmethod
+    def _sync_updates(
+        desired: pyonms.models.requisition.Requisition,
+        diff: pyonms.models.requisition.RequisitionDiff,
+    ) -> List[pyonms.models.requisition.RequisitionNode]:
+        # Added and changed nodes, which are posted individually.
+        return [desired.node[foreign_id] for foreign_id in [*diff.added, *diff.changed]]
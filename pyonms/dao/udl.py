@@ -4,7 +4,7 @@
 
 "User Defined Links data access"
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import pyonms.models.udl
 from pyonms.dao.base import Endpoint
@@ -25,6 +25,11 @@ class UDLAPI(Endpoint):
         Args:
             id (int): ID number of UserDefinedLink to retrieve.
         """
+        return self._cached(id, lambda: self._fetch_link(id))
+
+    def _fetch_link(
+        self, id: int  # pylint: disable=W0622
+    ) -> Optional[pyonms.models.udl.UserDefinedLink]:
         record = self._get(url=f"{self.url}/{id}")
         if record not in [None, {}]:
             return self._process_udl(record)
@@ -40,17 +45,36 @@ class UDLAPI(Endpoint):
             limit (int, optional): Max number of UserDefinedLink objects to retrieve. Defaults to 100.
             batch_size (int, optional): Number of UserDefinedLink to retrieve per API call. Defaults to 100.
         """
-        links = []
         records = self._get_batch(
             url=self.url,
             endpoint="user_defined_link",
             limit=limit,
             batch_size=batch_size,
         )
-        for record in records:
+        return self._process_udls(records)
+
+    def iter_links(
+        self, limit: int = 0, batch_size: int = 100
+    ) -> Iterator[pyonms.models.udl.UserDefinedLink]:
+        """Iterate over UserDefinedLink objects, fetching one page at a time.
+
+        Args:
+            limit (int, optional): Max number of UserDefinedLink objects to retrieve. Defaults to 0 (all).
+            batch_size (int, optional): Number of UserDefinedLink to retrieve per API call. Defaults to 100.
+        """
+        for record in self._iter_batch(
+            url=self.url,
+            endpoint="user_defined_link",
+            limit=limit,
+            batch_size=batch_size,
+        ):
             if record:
-                links.append(self._process_udl(record))
-        return links
+                yield self._process_udl(record)
+
+    def _process_udls(
+        self, records: List[dict]
+    ) -> List[pyonms.models.udl.UserDefinedLink]:
+        return [self._process_udl(record) for record in records if record]
 
     def _process_udl(self, data: dict) -> pyonms.models.udl.UserDefinedLink:
         clean_data = {"owner": data["owner"]}
@@ -69,6 +93,7 @@ class UDLAPI(Endpoint):
             id (int): ID number of UserDefinedLink to delete
         """
         self._delete(url=f"{self.url}/{id}")
+        self._invalidate(id)
 
     def create_link(self, link: pyonms.models.udl.UserDefinedLink) -> bool:
         """Create new UserDefinedLink between two nodes.
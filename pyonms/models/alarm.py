@@ -4,16 +4,17 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pyonms.models.event import Event, EventParameter, Severity
 from pyonms.models.node import ServiceType
-from pyonms.utils import convert_time
+from pyonms.utils import SLOTS, convert_time
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, **SLOTS)
 class Alarm:
     "Alarm model"
+
     id: int
     reductionKey: str
     type: int
@@ -54,24 +55,91 @@ class Alarm:
     serviceType: Optional[ServiceType] = None
 
     def __post_init__(self):
-        self.suppressedUntil = convert_time(self.suppressedUntil)
-        self.suppressedTime = convert_time(self.suppressedTime)
-        self.firstEventTime = convert_time(self.firstEventTime)
-        self.lastEventTime = convert_time(self.lastEventTime)
-        self.firstAutomationTime = convert_time(self.firstAutomationTime)
-        self.lastAutomationTime = convert_time(self.lastAutomationTime)
-        self.ackTime = convert_time(self.ackTime)
         self.severity = Severity[self.severity]
-        if self.lastEvent:
-            self.lastEvent = Event(**self.lastEvent)
-        self.parameters = [EventParameter(**parameter) for parameter in self.parameters]
-        if self.serviceType:
-            self.serviceType = ServiceType(**self.serviceType)
-        if self.relatedAlarms:
-            relations = []
-            for related in self.relatedAlarms:
-                relations.append(Alarm(**related))
-            self.relatedAlarms = relations
+        for name, convert in ALARM_CONVERTERS.items():
+            setattr(self, name, convert(getattr(self, name)))
 
     def __repr__(self):
         return f"Alarm(id={self.id}, reductionKey={self.reductionKey})"
+
+
+def _convert_time(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return convert_time(value)
+
+
+def _convert_event(value):
+    return Event(**value) if value else value
+
+
+def _convert_parameters(value):
+    return [EventParameter(**parameter) for parameter in value]
+
+
+def _convert_service_type(value):
+    return ServiceType(**value) if value else value
+
+
+def _convert_related_alarms(value):
+    return [Alarm(**related) for related in value] if value else value
+
+
+ALARM_TIME_FIELDS = [
+    "suppressedUntil",
+    "suppressedTime",
+    "firstEventTime",
+    "lastEventTime",
+    "firstAutomationTime",
+    "lastAutomationTime",
+    "ackTime",
+]
+"""Fields holding epoch milliseconds in API responses"""
+
+ALARM_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    **{name: _convert_time for name in ALARM_TIME_FIELDS},
+    "lastEvent": _convert_event,
+    "parameters": _convert_parameters,
+    "serviceType": _convert_service_type,
+    "relatedAlarms": _convert_related_alarms,
+}
+"""Field conversions applied to API values, eagerly by `Alarm` and on first access by `LazyAlarm`"""
+
+
+class LazyAlarm(Alarm):
+    """`Alarm` that defers timestamp conversion and nested object construction
+    until each field is first read. Fields in `ALARM_CONVERTERS` keep their raw API value until then.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._raw: Dict[str, Any] = {}
+        self._values: Dict[str, Any] = {}
+        self._ready = False
+        super().__init__(*args, **kwargs)
+
+    def __post_init__(self):
+        self.severity = Severity[self.severity]
+        self._ready = True
+
+
+def _lazy_field(name: str, convert: Callable[[Any], Any]) -> property:
+    # The accessors become properties of `LazyAlarm`, so they read its own private state.
+    # pylint: disable=W0212
+    def getter(self):
+        values = self._values
+        if name not in values:
+            values[name] = convert(self._raw.pop(name))
+        return values[name]
+
+    def setter(self, value):
+        if self._ready:
+            self._raw.pop(name, None)
+            self._values[name] = value
+        else:
+            self._raw[name] = value
+
+    return property(getter, setter)
+
+
+for _name, _convert in ALARM_CONVERTERS.items():
+    setattr(LazyAlarm, _name, _lazy_field(_name, _convert))
@@ -5,10 +5,12 @@
 "Enlinkd Models"
 
 import re
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Union
 
 from pyonms import utils
 
@@ -52,10 +54,11 @@ class BridgeLinkRemoteNode:
             if remote_node := infer_node_from_url(url=self.bridgeRemoteUrl):
                 self.bridgeRemoteNodeId = remote_node
         if self.bridgeRemotePort:
-            if remote_ifindex := infer_ifindex(text=self.bridgeRemotePort):
-                self.bridgeRemoteIfIndex = remote_ifindex
-            if remote_ip := infer_ip(text=self.bridgeRemotePort):
-                self.bridgeRemoteIP = remote_ip
+            remote_port = parse_port(self.bridgeRemotePort)
+            if remote_port.ifindex:
+                self.bridgeRemoteIfIndex = remote_port.ifindex
+            if remote_port.ip:
+                self.bridgeRemoteIP = remote_port.ip
         if self.bridgeRemote:
             if remote_mac := infer_mac(text=self.bridgeRemote):
                 self.bridgeRemoteMAC = remote_mac
@@ -96,10 +99,11 @@ class BridgeLink(Link):
             if local_node := infer_node_from_url(url=self.bridgeLocalPortUrl):
                 self.bridgeLocalNodeId = local_node
         if self.bridgeLocalPort:
-            if local_mac := infer_mac(self.bridgeLocalPort):
-                self.bridgeLocalMAC = local_mac
-            if local_ifindex := infer_ifindex(self.bridgeLocalPort):
-                self.bridgeLocalIfIndex = local_ifindex
+            local_port = parse_port(self.bridgeLocalPort)
+            if local_port.mac:
+                self.bridgeLocalMAC = local_port.mac
+            if local_port.ifindex:
+                self.bridgeLocalIfIndex = local_port.ifindex
 
 
 @dataclass
@@ -136,10 +140,11 @@ class CdpLink(Link):
             if local_ifindex := infer_ifindex(self.cdpLocalPort):
                 self.cdpLocalIfIndex = local_ifindex
         if self.cdpCacheDevicePort:
-            if remote_ifindex := infer_ifindex(self.cdpCacheDevicePort):
-                self.cdpCacheDeviceIfIndex = remote_ifindex
-            if remote_ip := infer_ip(self.cdpCacheDevicePort):
-                self.cdpCacheDeviceIP = remote_ip
+            remote_port = parse_port(self.cdpCacheDevicePort)
+            if remote_port.ifindex:
+                self.cdpCacheDeviceIfIndex = remote_port.ifindex
+            if remote_port.ip:
+                self.cdpCacheDeviceIP = remote_port.ip
 
 
 @dataclass
@@ -172,6 +177,17 @@ class IsIsLink(Link):
             self.isisLinkLastPollTime = utils.convert_link_time(
                 self.isisLinkLastPollTime
             )
+        if self.isisCircIfIndex:
+            self.isisLocalIfIndex = self.isisCircIfIndex
+        if self.isisISAdjNeighSysUrl:
+            if remote_node := infer_node_from_url(url=self.isisISAdjNeighSysUrl):
+                self.isisRemNodeId = remote_node
+        if self.isisISAdjNeighPort:
+            remote_port = parse_port(self.isisISAdjNeighPort)
+            if remote_port.mac:
+                self.isisRemMAC = remote_port.mac
+            if remote_port.ifindex:
+                self.isisRemIfIndex = remote_port.ifindex
 
 
 @dataclass
@@ -205,15 +221,17 @@ class LldpLink(Link):
             if remote_node := infer_node_from_url(url=self.lldpRemChassisIdUrl):
                 self.lldpRemNodeId = remote_node
         if self.lldpLocalPort:
-            if local_mac := infer_mac(self.lldpLocalPort):
-                self.lldpLocalMAC = local_mac
-            if local_ifindex := infer_ifindex(self.lldpLocalPort):
-                self.lldpLocalIfIndex = local_ifindex
+            local_port = parse_port(self.lldpLocalPort)
+            if local_port.mac:
+                self.lldpLocalMAC = local_port.mac
+            if local_port.ifindex:
+                self.lldpLocalIfIndex = local_port.ifindex
         if self.ldpRemPort:
-            if remote_mac := infer_mac(self.ldpRemPort):
-                self.lldpRemMAC = remote_mac
-            if remote_ifindex := infer_ifindex(self.ldpRemPort):
-                self.lldpRemIfIndex = remote_ifindex
+            remote_port = parse_port(self.ldpRemPort)
+            if remote_port.mac:
+                self.lldpRemMAC = remote_port.mac
+            if remote_port.ifindex:
+                self.lldpRemIfIndex = remote_port.ifindex
 
 
 @dataclass
@@ -243,6 +261,24 @@ class OspfLink(Link):
             self.ospfLinkLastPollTime = utils.convert_link_time(
                 self.ospfLinkLastPollTime
             )
+        if self.ospfLocalPortUrl:
+            if local_node := infer_node_from_url(url=self.ospfLocalPortUrl):
+                self.ospfLocalNodeId = local_node
+        if remote_url := self.ospfRemRouterUrl or self.ospfRemPortUrl:
+            if remote_node := infer_node_from_url(url=remote_url):
+                self.ospfRemNodeId = remote_node
+        if self.ospfLocalPort:
+            local_port = parse_port(self.ospfLocalPort)
+            if local_port.mac:
+                self.ospfLocalMAC = local_port.mac
+            if local_port.ifindex:
+                self.ospfLocalIfIndex = local_port.ifindex
+        if self.ospfRemPort:
+            remote_port = parse_port(self.ospfRemPort)
+            if remote_port.mac:
+                self.ospfRemMAC = remote_port.mac
+            if remote_port.ifindex:
+                self.ospfRemIfIndex = remote_port.ifindex
 
 
 @dataclass
@@ -354,37 +390,287 @@ class Topology:
     ospf_elements: List[OspfElement] = field(default_factory=list)
 
 
+@dataclass
+class TopologyEdge:
+    "Link between two nodes, reported once no matter how many ends saw it"
+    link_type: LinkType
+    source: int
+    target: int
+    source_ifindex: Optional[int] = None
+    target_ifindex: Optional[int] = None
+
+    def __repr__(self):
+        return (
+            f"TopologyEdge({self.link_type.name}, {self.source}:{self.source_ifindex}"
+            f" <-> {self.target}:{self.target_ifindex})"
+        )
+
+    def ifindex(self, node_id: int) -> Optional[int]:
+        """Get the ifIndex of this link on `node_id`."""
+        return self.source_ifindex if node_id == self.source else self.target_ifindex
+
+    def merge(
+        self,
+        source: int,
+        source_ifindex: Optional[int],
+        target_ifindex: Optional[int],
+    ) -> bool:
+        """Merge the same link reported from the `source` end, filling in any ifIndex not yet known.
+        Returns `False` without changes when the ifIndexes conflict, since that is a separate link.
+        """
+        if source != self.source:
+            source_ifindex, target_ifindex = target_ifindex, source_ifindex
+        if None not in (source_ifindex, self.source_ifindex) and (
+            source_ifindex != self.source_ifindex
+        ):
+            return False
+        if None not in (target_ifindex, self.target_ifindex) and (
+            target_ifindex != self.target_ifindex
+        ):
+            return False
+        self.source_ifindex = self.source_ifindex or source_ifindex
+        self.target_ifindex = self.target_ifindex or target_ifindex
+        return True
+
+
+@dataclass
+class TopologyGraph:
+    """Network-wide link graph built from per-node `Topology` objects.
+    `adjacency` maps each node ID to its neighbor node IDs and the links to each neighbor.
+    """
+
+    adjacency: Dict[int, Dict[int, List[TopologyEdge]]] = field(default_factory=dict)
+
+    def __repr__(self):
+        return f"TopologyGraph(nodes={len(self.adjacency)}, edges={len(self.edges)})"
+
+    @property
+    def edges(self) -> List[TopologyEdge]:
+        """Every distinct link in the graph."""
+        seen: Set[int] = set()
+        edges = []
+        for neighbors in self.adjacency.values():
+            for links in neighbors.values():
+                for edge in links:
+                    if id(edge) not in seen:
+                        seen.add(id(edge))
+                        edges.append(edge)
+        return edges
+
+    def add_link(
+        self,
+        link_type: LinkType,
+        source: int,
+        target: Optional[int],
+        source_ifindex: Optional[int] = None,
+        target_ifindex: Optional[int] = None,
+    ) -> Optional[TopologyEdge]:
+        """Add a link, merging it with the same link already reported by the other end.
+        Links to a remote end that is not a known node are skipped.
+        """
+        self.adjacency.setdefault(source, {})
+        if target is None:
+            return None
+        links = self.adjacency[source].setdefault(target, [])
+        for edge in links:
+            if edge.link_type == link_type and edge.merge(
+                source, source_ifindex, target_ifindex
+            ):
+                return edge
+        edge = TopologyEdge(
+            link_type=link_type,
+            source=source,
+            target=target,
+            source_ifindex=source_ifindex,
+            target_ifindex=target_ifindex,
+        )
+        links.append(edge)
+        if target != source:
+            self.adjacency.setdefault(target, {}).setdefault(source, []).append(edge)
+        return edge
+
+    def add_topology(self, node_id: int, topology: Topology) -> None:
+        """Add the links of one node's `Topology`."""
+        self.adjacency.setdefault(node_id, {})
+        for bridge_link in topology.bridge_links:
+            for remote in bridge_link.BridgeLinkRemoteNodes:
+                if remote:
+                    self.add_link(
+                        LinkType.BRIDGE,
+                        bridge_link.bridgeLocalNodeId or node_id,
+                        remote.bridgeRemoteNodeId,
+                        bridge_link.bridgeLocalIfIndex,
+                        remote.bridgeRemoteIfIndex,
+                    )
+        for cdp_link in topology.cdp_links:
+            self.add_link(
+                LinkType.CDP,
+                cdp_link.cdpLocalNodeId or node_id,
+                cdp_link.cdpCacheDeviceNodeId,
+                cdp_link.cdpLocalIfIndex,
+                cdp_link.cdpCacheDeviceIfIndex,
+            )
+        for isis_link in topology.isis_links:
+            self.add_link(
+                LinkType.ISIS,
+                isis_link.isisLocalNodeId or node_id,
+                isis_link.isisRemNodeId,
+                isis_link.isisLocalIfIndex,
+                isis_link.isisRemIfIndex,
+            )
+        for lldp_link in topology.lldp_links:
+            self.add_link(
+                LinkType.LLDP,
+                lldp_link.lldpLocalNodeId or node_id,
+                lldp_link.lldpRemNodeId,
+                lldp_link.lldpLocalIfIndex,
+                lldp_link.lldpRemIfIndex,
+            )
+        for ospf_link in topology.ospf_links:
+            self.add_link(
+                LinkType.OSPF,
+                ospf_link.ospfLocalNodeId or node_id,
+                ospf_link.ospfRemNodeId,
+                ospf_link.ospfLocalIfIndex,
+                ospf_link.ospfRemIfIndex,
+            )
+
+    def neighbors(
+        self, node_id: int, link_types: Optional[List[LinkType]] = None
+    ) -> List[int]:
+        """Get the node IDs directly linked to `node_id`, optionally only over `link_types`."""
+        return [
+            neighbor
+            for neighbor, links in self.adjacency.get(node_id, {}).items()
+            if neighbor != node_id
+            and (
+                link_types is None
+                or any(edge.link_type in link_types for edge in links)
+            )
+        ]
+
+    def links(self, node_id: int, neighbor: int) -> List[TopologyEdge]:
+        """Get the links between two nodes."""
+        return list(self.adjacency.get(node_id, {}).get(neighbor, []))
+
+    def shortest_path(
+        self,
+        source: int,
+        target: int,
+        link_types: Optional[List[LinkType]] = None,
+        exclude: Iterable[int] = (),
+    ) -> Optional[List[int]]:
+        """Get the node IDs on a shortest hop-count path from `source` to `target`, or `None` when unreachable.
+        Nodes in `exclude` are treated as down.
+        """
+        excluded = set(exclude)
+        if source not in self.adjacency or source in excluded:
+            return None
+        previous: Dict[int, Optional[int]] = {source: None}
+        queue = deque([source])
+        while queue:
+            node_id = queue.popleft()
+            if node_id == target:
+                path = [node_id]
+                while (hop := previous[path[-1]]) is not None:
+                    path.append(hop)
+                return path[::-1]
+            for neighbor in self.neighbors(node_id, link_types=link_types):
+                if neighbor not in previous and neighbor not in excluded:
+                    previous[neighbor] = node_id
+                    queue.append(neighbor)
+        return None
+
+    def reachable(
+        self,
+        node_id: int,
+        max_hops: Optional[int] = None,
+        link_types: Optional[List[LinkType]] = None,
+        exclude: Iterable[int] = (),
+    ) -> Dict[int, int]:
+        """Get every node reachable from `node_id`, mapped to its hop count.
+        Nodes in `exclude` are treated as down.
+        """
+        excluded = set(exclude)
+        if node_id not in self.adjacency or node_id in excluded:
+            return {}
+        hops = {node_id: 0}
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            if max_hops is not None and hops[current] >= max_hops:
+                continue
+            for neighbor in self.neighbors(current, link_types=link_types):
+                if neighbor not in hops and neighbor not in excluded:
+                    hops[neighbor] = hops[current] + 1
+                    queue.append(neighbor)
+        return hops
+
+    def blast_radius(
+        self,
+        node_ids: Union[int, Iterable[int]],
+        root: int,
+        link_types: Optional[List[LinkType]] = None,
+    ) -> Set[int]:
+        """Get the nodes that lose their path to `root` when `node_ids` go down, not counting the failed nodes."""
+        failed = {node_ids} if isinstance(node_ids, int) else set(node_ids)
+        before = self.reachable(root, link_types=link_types)
+        after = self.reachable(root, link_types=link_types, exclude=failed)
+        return set(before) - set(after) - failed
+
+
+TAG_PATTERN = re.compile(r"\(([^()]*)\)")
+HEX_PATTERN = re.compile(r"[0-9A-Fa-f]+")
+IP_PATTERN = re.compile(r"((25[0-5]|(2[0-4]|1\d|[1-9]|)\d)\.?\b){4}")
+NODE_PATTERN = re.compile(r"node=(\d+)")
+
+
+class PortInfo(NamedTuple):
+    "Values parsed from an enlinkd port string"
+    ifindex: Optional[int] = None
+    ip: Optional[str] = None
+    mac: Optional[str] = None
+
+
+@lru_cache(maxsize=8192)
+def parse_port(text: str) -> PortInfo:
+    """Parse the `(ifindex:N)`, `(mac:X)`/`(macAddress:X)` and `(a.b.c.d)` tags of a port string in one pass.
+    Only the first line is read, and when a tag appears more than once, the last one wins.
+    """
+    ifindex = ip = mac = None
+    for tag in TAG_PATTERN.findall(text.partition("\n")[0]):
+        kind, _, value = tag.partition(":")
+        if kind == "ifindex":
+            if value.isdecimal():
+                ifindex = int(value)
+        elif kind in ("mac", "macAddress"):
+            if HEX_PATTERN.fullmatch(value):
+                mac = value
+        elif IP_PATTERN.fullmatch(tag):
+            ip = tag
+    return PortInfo(ifindex=ifindex, ip=ip, mac=mac)
+
+
 def infer_ifindex(text: str) -> Optional[int]:
     "Infer ifIndex from string"
-    ifindex = re.search(r"^.*\(ifindex:(\d+)\).*", text)
-    if ifindex:
-        return int(ifindex.group(1))
-    else:
-        return None
+    return parse_port(text).ifindex
 
 
 def infer_ip(text: str) -> Optional[str]:
     "Infer IP address from string"
-    ip = re.search(r"^.*\((((25[0-5]|(2[0-4]|1\d|[1-9]|)\d)\.?\b){4})\).*", text)
-    if ip:
-        return ip.group(1)
-    else:
-        return None
+    return parse_port(text).ip
 
 
+@lru_cache(maxsize=8192)
 def infer_node_from_url(url: str) -> Optional[int]:
     "Infer node ID from url querystring"
-    node = re.search(r"^.*node=(\d+).*", url)
-    if node:
-        return int(node.group(1))
+    nodes = NODE_PATTERN.findall(url.partition("\n")[0])
+    if nodes:
+        return int(nodes[-1])
     else:
         return None
 
 
 def infer_mac(text: str) -> Optional[str]:
     "Infer MAC address from string"
-    mac = re.search(r"^.*\((mac|macAddress):([0-9A-Fa-f]+)\).*", text)
-    if mac:
-        return mac.group(2)
-    else:
-        return None
+    return parse_port(text).mac
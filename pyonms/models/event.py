@@ -2,13 +2,13 @@
 
 """Event models"""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional, Union
 
 from pyonms.models.node import ServiceType
-from pyonms.utils import convert_time
+from pyonms.utils import SLOTS, convert_time
 
 
 class Severity(Enum):
@@ -47,7 +47,7 @@ class SeverityName(Enum):
     "Critical"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class EventParameter:
     """Event Parameter"""
 
@@ -66,7 +66,7 @@ class EventParameter:
         return hash((self.name))
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, **SLOTS)
 class Event:
     """OnmsEvent Model"""
 
@@ -119,7 +119,9 @@ class Event:
     def to_dict(self) -> dict:
         "Convert object to a `dict`"
         payload = {}
-        for key, value in vars(self).items():
+        for item in fields(self):
+            key = item.name
+            value = getattr(self, key)
             if key == "description":
                 key = "descr"
             elif key == "operatorInstructions":
@@ -2,12 +2,14 @@
 
 """Node models"""
 
+import ipaddress
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
 
-from pyonms.utils import check_ip_address, convert_time
+from pyonms.utils import SLOTS, check_ip_address, convert_time, fingerprint
 
 
 class LabelSource(Enum):
@@ -86,10 +88,26 @@ class PrimaryType(Enum):
         return list(map(lambda c: c.value, cls))
 
 
+class _KeyedRecord:
+    """Base for records that model lists are indexed by, such as metadata by `key`.
+    Assigning `_key_field` after construction counts as a rename, which tells indexes to rebuild.
+    """
+
+    _key_field = ""
+    renames = 0
+
+    def __setattr__(self, name, value):
+        if name == self._key_field and name in self.__dict__:
+            _KeyedRecord.renames += 1
+        super().__setattr__(name, value)
+
+
 @dataclass
-class Metadata:
+class Metadata(_KeyedRecord):
     """Metadata record"""
 
+    _key_field = "key"
+
     context: str
     key: str
     value: str
@@ -104,6 +122,10 @@ class Metadata:
 
     _to_dict = to_dict
 
+    def fingerprint(self) -> str:
+        "Stable content hash of the record"
+        return fingerprint("metadata", self.context, self.key, self.value)
+
 
 @dataclass(repr=False)
 class AssetRecord:
@@ -243,7 +265,7 @@ class Service:
         return hash((self.id))
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, **SLOTS)
 class SnmpInterface:
     """SNMP Interface object"""
 
@@ -418,3 +440,149 @@ class Node:
 
     def __hash__(self):
         return hash((self.id))
+
+
+def _ip_address(
+    value: str,
+) -> Optional[Union[ipaddress.IPv4Address, ipaddress.IPv6Address]]:
+    # The `%zone` suffix of a scoped IPv6 address is dropped, so `fe80::1%eth0` matches `fe80::1`.
+    try:
+        return ipaddress.ip_address(value.split("%", 1)[0])
+    except ValueError:
+        return None
+
+
+class NodeIndex:
+    """In-memory index of `Node` objects for constant-time lookups.
+
+    IP addresses are read from `Node.ipInterfaces`, so fetch nodes with at least
+    `NodeComponents.IP` to look them up by address.
+
+    ```python
+    index = NodeIndex(server.nodes.get_nodes(limit=0, components=[NodeComponents.IP]))
+    index.by_ip("10.0.0.1")
+    index.in_network("10.0.0.0/24")
+    ```
+    """
+
+    def __init__(self, nodes: Iterable[Node] = ()):
+        """Attributes:
+            nodes (Iterable[Node]): Nodes to index.
+        Returns:
+            `NodeIndex` object
+        """
+        self.nodes: Dict[int, Node] = {}
+        self._keys: Dict[int, List[Tuple[str, Hashable]]] = {}
+        self._index: Dict[Tuple[str, Hashable], Dict[int, Node]] = {}
+        self._networks: Dict[int, Tuple[List[int], List[Hashable]]] = {}
+        for node in nodes:
+            self.add(node)
+
+    def __repr__(self):
+        return f"NodeIndex(nodes={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self.nodes
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.nodes.values())
+
+    def add(self, node: Node) -> None:
+        """Add a node, replacing any node already indexed with the same ID."""
+        self.remove(node.id)
+        keys: List[Tuple[str, Hashable]] = [
+            ("label", node.label),
+            ("foreign_id", (node.foreignSource, node.foreignId)),
+            ("sys_object_id", node.sysObjectId),
+        ]
+        keys += [
+            ("category", category)
+            for category in node.categories
+            if isinstance(category, str)
+        ]
+        for ip_interface in node.ipInterfaces:
+            if ip_interface and ip_interface.ipAddress:
+                # Addresses that do not parse are left out of the index.
+                keys.append(("ip", _ip_address(ip_interface.ipAddress)))
+        keys = [
+            key for key in dict.fromkeys(keys) if key[1] not in (None, (None, None))
+        ]
+        self.nodes[node.id] = node
+        self._keys[node.id] = keys
+        for key in keys:
+            self._index.setdefault(key, {})[node.id] = node
+            if key[0] == "ip":
+                self._networks.clear()
+
+    def remove(self, node_id: int) -> Optional[Node]:
+        """Remove a node by ID, returning it if it was indexed."""
+        node = self.nodes.pop(node_id, None)
+        for key in self._keys.pop(node_id, []):
+            entries = self._index[key]
+            entries.pop(node_id, None)
+            if not entries:
+                del self._index[key]
+            if key[0] == "ip":
+                self._networks.clear()
+        return node
+
+    def _lookup(self, kind: str, value: Hashable) -> List[Node]:
+        return list(self._index.get((kind, value), {}).values())
+
+    def get(self, id: int) -> Optional[Node]:  # pylint: disable=W0622
+        """Get node by database ID number."""
+        return self.nodes.get(id)
+
+    def by_ip(self, ip: str) -> Optional[List[Node]]:
+        """Get the nodes with an interface on an IP address, or `None` if `ip` is not a valid address."""
+        address = _ip_address(ip)
+        if address is None:
+            return None
+        return self._lookup("ip", address)
+
+    def by_label(self, label: str) -> List[Node]:
+        """Get the nodes with a label."""
+        return self._lookup("label", label)
+
+    def by_foreign_id(self, foreign_source: str, foreign_id: str) -> Optional[Node]:
+        """Get the node provisioned by a requisition as `foreign_source:foreign_id`."""
+        nodes = self._lookup("foreign_id", (foreign_source, foreign_id))
+        return nodes[0] if nodes else None
+
+    def by_sys_object_id(self, sys_object_id: str) -> List[Node]:
+        """Get the nodes with an SNMP `sysObjectId`."""
+        return self._lookup("sys_object_id", sys_object_id)
+
+    def by_category(self, category: str) -> List[Node]:
+        """Get the nodes in a surveillance category."""
+        return self._lookup("category", category)
+
+    def in_network(
+        self, network: Union[str, ipaddress.IPv4Network, ipaddress.IPv6Network]
+    ) -> List[Node]:
+        """Get the nodes with an interface inside a CIDR network, such as `10.0.0.0/24`.
+        Host bits in `network` are ignored.
+        """
+        if isinstance(network, str):
+            network = ipaddress.ip_network(network, strict=False)
+        if network.version not in self._networks:
+            # Addresses are sorted once per IP version and kept until the next change.
+            pairs = sorted(
+                (int(address), address)  # type: ignore
+                for kind, address in self._index
+                if kind == "ip" and address.version == network.version  # type: ignore
+            )
+            self._networks[network.version] = (
+                [number for number, _ in pairs],
+                [address for _, address in pairs],
+            )
+        numbers, addresses = self._networks[network.version]
+        start = bisect_left(numbers, int(network.network_address))
+        end = bisect_right(numbers, int(network.broadcast_address))
+        nodes: Dict[int, Node] = {}
+        for address in addresses[start:end]:
+            nodes.update(self._index[("ip", address)])
+        return list(nodes.values())
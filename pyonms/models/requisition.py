@@ -1,14 +1,19 @@
 # models.requisition.py
 
 "Requisition models"
+
+import json
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import partial
+from operator import attrgetter
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from xml.sax.saxutils import escape, quoteattr
 
 from pyonms.models import exceptions
-from pyonms.models.node import AssetRecord, Metadata, PrimaryType
-from pyonms.utils import check_ip_address, convert_time
+from pyonms.models.node import AssetRecord, Metadata, PrimaryType, _KeyedRecord
+from pyonms.utils import check_ip_address, convert_time, fingerprint
 
 NODE_ATTRIBUTES = [
     "node_label",
@@ -22,10 +27,126 @@ NODE_ATTRIBUTES = [
 
 ASSET_FIELDS = [item for item in dir(AssetRecord) if item[0] != "_"]
 
+MODEL_IMPORT_NAMESPACE = "http://xmlns.opennms.org/xsd/config/model-import"
+
+XML_CHILD_ORDER = ["interface", "monitored-service", "category", "asset", "meta-data"]
+"""Order of child elements in the model-import schema"""
+
+XML_LIST_KEYS = [key.replace("-", "_") for key in XML_CHILD_ORDER]
+"""Normalized keys of repeatable model-import elements"""
+
+
+class _KeyIndex:
+    """Position of each item in a model list, by key.
+    The first item wins for duplicate keys, as with a linear scan.
+    It is rebuilt when the list is replaced, resized, or has a different last item than
+    when it was indexed, when any indexed record has been renamed since,
+    and when a found item was replaced in place.
+    """
+
+    __slots__ = ("key", "items", "positions", "size", "last", "renames")
+
+    def __init__(self, key: Callable[[Any], str]):
+        self.key = key
+        self.items: Optional[list] = None
+        self.positions: Dict[str, int] = {}
+        self.size = 0
+        self.last: Any = None
+        self.renames = 0
+
+    def _stale(self, items: list) -> bool:
+        return (
+            items is not self.items
+            or len(items) != self.size
+            or (bool(items) and items[-1] is not self.last)
+            or self.renames != _KeyedRecord.renames
+        )
+
+    def _rebuild(self, items: list):
+        self.items = items
+        self.size = len(items)
+        self.last = items[-1] if items else None
+        self.renames = _KeyedRecord.renames
+        self.positions = {}
+        for position, item in enumerate(items):
+            if item is not None:
+                self.positions.setdefault(self.key(item), position)
+
+    def find(self, items: list, key: str) -> Any:
+        "Get the first item with the given key, or `None`"
+        if self._stale(items):
+            self._rebuild(items)
+        position = self.positions.get(key)
+        if position is None:
+            return None
+        item = items[position]
+        if item is None or self.key(item) != key:
+            # Replaced in place
+            self._rebuild(items)
+            position = self.positions.get(key)
+            return None if position is None else items[position]
+        return item
+
+    def append(self, items: list, item: Any):
+        "Append an item to the list and index it"
+        if self._stale(items):
+            self._rebuild(items)
+        items.append(item)
+        self.positions.setdefault(self.key(item), len(items) - 1)
+        self.size = len(items)
+        self.last = item
+
+
+def _asset_key(asset: "AssetField") -> str:
+    return asset.name.lower()
+
+
+_new_metadata_index = partial(_KeyIndex, key=attrgetter("key"))
+_new_service_index = partial(_KeyIndex, key=attrgetter("service_name"))
+_new_asset_index = partial(_KeyIndex, key=_asset_key)
+_new_category_index = partial(_KeyIndex, key=attrgetter("name"))
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _xml_attributes(payload: Dict[str, Any]) -> str:
+    return "".join(
+        f" {key}={quoteattr(str(value))}"
+        for key, value in payload.items()
+        if value is not None and not isinstance(value, list)
+    )
+
+
+def _xml_element(tag: str, payload: Dict[str, Any]) -> str:
+    # Scalars become attributes and lists of dicts become child elements.
+    children = "".join(
+        _xml_element(child, item)
+        for child in XML_CHILD_ORDER
+        for item in payload.get(child, [])
+    )
+    if children:
+        return f"<{escape(tag)}{_xml_attributes(payload)}>{children}</{escape(tag)}>"
+    return f"<{escape(tag)}{_xml_attributes(payload)}/>"
+
+
+def _fingerprints(items: list) -> List[str]:
+    # Sorted, so that list order does not change the parent fingerprint.
+    # Metadata and assets without a value are skipped, as `to_dict()` does.
+    return sorted(
+        item.fingerprint()
+        for item in items
+        if item is not None and getattr(item, "value", True)
+    )
+
 
 @dataclass
-class Category:
+class Category(_KeyedRecord):
     "Surveillance Category"
+
+    _key_field = "name"
+
     name: str
 
     def __hash__(self):
@@ -37,10 +158,17 @@ class Category:
 
     _to_dict = to_dict
 
+    def fingerprint(self) -> str:
+        "Stable content hash of the category"
+        return fingerprint("category", self.name)
+
 
 @dataclass
-class AssetField:
+class AssetField(_KeyedRecord):
     "Asset field records"
+
+    _key_field = "name"
+
     name: str
     value: Optional[str] = None
 
@@ -59,13 +187,23 @@ class AssetField:
 
     _to_dict = to_dict
 
+    def fingerprint(self) -> str:
+        "Stable content hash of the asset field"
+        return fingerprint("asset", self.name, self.value)
+
 
 @dataclass
-class Service:
+class Service(_KeyedRecord):
     "Monitored Services"
+
+    _key_field = "service_name"
+
     service_name: str
     category: List[Optional[Category]] = field(default_factory=list)
     meta_data: List[Optional[Metadata]] = field(default_factory=list)
+    _meta_data_index: _KeyIndex = field(
+        default_factory=_new_metadata_index, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         for index, category in enumerate(self.category):
@@ -95,23 +233,34 @@ class Service:
 
     _to_dict = to_dict
 
+    def fingerprint(self) -> str:
+        "Stable content hash of the service, its categories and metadata"
+        return fingerprint(
+            "service",
+            self.service_name,
+            _fingerprints(self.category),
+            _fingerprints(self.meta_data),
+        )
+
     def set_metadata(self, key: str, value: str):
         """Add or update metadata for the service.
         If a Metadata record for the given key exists, it will be replaced with the new value.
         Set `value` to none to remove the key.
         Context will be "requisition".
         """
-        for data in self.meta_data:
-            if isinstance(data, Metadata):
-                if data.key == key:
-                    data.value = value
-                    return
-        self.meta_data.append(Metadata(context="requisition", key=key, value=value))
+        data = self._meta_data_index.find(self.meta_data, key)
+        if data is not None:
+            data.value = value
+        else:
+            self._meta_data_index.append(
+                self.meta_data, Metadata(context="requisition", key=key, value=value)
+            )
 
 
 @dataclass
 class Interface:
     "Requisition Interface"
+
     ip_addr: str
     snmp_primary: PrimaryType = PrimaryType.NOT_ELIGIBLE
     status: int = 1
@@ -120,9 +269,20 @@ class Interface:
     monitored_service: List[Service] = field(default_factory=list)
     category: List[Category] = field(default_factory=list)
     meta_data: List[Metadata] = field(default_factory=list)
+    _service_index: _KeyIndex = field(
+        default_factory=_new_service_index,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _meta_data_index: _KeyIndex = field(
+        default_factory=_new_metadata_index, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         check_ip_address(self.ip_addr, raise_error=True)
+        if isinstance(self.status, str):
+            self.status = int(self.status)
         if isinstance(self.snmp_primary, str):
             self.snmp_primary = PrimaryType(self.snmp_primary)
         for index, category in enumerate(self.category):
@@ -147,6 +307,8 @@ class Interface:
         }
         if self.descr:
             payload["descr"] = self.descr
+        if self.managed:
+            payload["managed"] = self.managed
         payload["monitored-service"] = [
             service.to_dict() for service in self.monitored_service
         ]
@@ -156,19 +318,51 @@ class Interface:
 
     _to_dict = to_dict
 
+    def fingerprint(self) -> str:
+        "Stable content hash of the interface, its services, categories and metadata"
+        return fingerprint(
+            "interface",
+            self.ip_addr,
+            self.snmp_primary.value,
+            self.status,
+            self.descr,
+            self.managed,
+            _fingerprints(self.monitored_service),
+            _fingerprints(self.category),
+            _fingerprints(self.meta_data),
+        )
+
     def set_metadata(self, key: str, value: str):
         """Add or update metadata for the interface.
         If a Metadata record for the given key exists, it will be replaced with the new value.
         Set `value` to none to remove the key.
         Context will be "requisition".
         """
-        for data in self.meta_data:
-            if data.key == key:
-                data.value = value
-                return
-        self.meta_data.append(Metadata(context="requisition", key=key, value=value))
+        data = self._meta_data_index.find(self.meta_data, key)
+        if data is not None:
+            data.value = value
+        else:
+            self._meta_data_index.append(
+                self.meta_data, Metadata(context="requisition", key=key, value=value)
+            )
+
+    def set_service(self, service: Service):
+        """Add a monitored service to the interface.
+        If a service with the same name exists, it will be replaced.
+        """
+        name = service.service_name
+        if self._service_index.find(self.monitored_service, name) is not None:
+            self.monitored_service[self._service_index.positions[name]] = service
+        else:
+            self._service_index.append(self.monitored_service, service)
+
+    def merge_interface(self, new_interface: "Interface") -> "Interface":
+        """Get a copy of this interface with the non-null attributes, services, categories
+        and metadata of another version of it merged in.
 
-    def _merge_interface(self, new_interface: "Interface") -> "Interface":
+        Raises:
+            pyonms.models.exceptions.InvalidValueError: If `new_interface` has a different IP address.
+        """
         if self.ip_addr != new_interface.ip_addr:
             raise exceptions.InvalidValueError(
                 name="ip_addr", value=new_interface.ip_addr, valid=[self.ip_addr]
@@ -186,25 +380,90 @@ class Interface:
         if new_interface.managed:
             final_interface.managed = new_interface.managed
         for service in new_interface.monitored_service:
-            if service.service_name in [_.service_name for _ in self.monitored_service]:
-                final_interface.monitored_service = [
-                    _.service_name
-                    for _ in final_interface.monitored_service
-                    if _.service_name != service.service_name
-                ]
-            final_interface.monitored_service.append(service)
+            final_interface.set_service(service)
 
+        categories = {category.name for category in final_interface.category}
         for category in new_interface.category:
-            if category.name not in [cat.name for cat in self.category]:
+            if category.name not in categories:
+                categories.add(category.name)
                 final_interface.category.append(Category(name=category.name))
         for meta in new_interface.meta_data:
             final_interface.set_metadata(key=meta.key, value=meta.value)
         return final_interface
 
+    _merge_interface = merge_interface
+
+
+@dataclass
+class ChangeSet:
+    "Keys added, changed and removed between two collections"
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+def _compare(current: Dict[str, Any], desired: Dict[str, Any]) -> ChangeSet:
+    return ChangeSet(
+        added=[key for key in desired if key not in current],
+        changed=[
+            key for key in desired if key in current and current[key] != desired[key]
+        ],
+        removed=[key for key in current if key not in desired],
+    )
+
+
+def _metadata_values(meta_data: List[Metadata]) -> Dict[str, Any]:
+    return {
+        f"{data.context}:{data.key}": data.value for data in meta_data if data.value
+    }
+
+
+@dataclass
+class NodeDiff:
+    """Differences between the current and desired version of a requisition node.
+    Metadata keys are `context:key`, interfaces are keyed by IP address,
+    and `service` holds the service changes of interfaces present in both versions.
+    """
+
+    foreign_id: str
+    attributes: List[str] = field(default_factory=list)
+    asset: ChangeSet = field(default_factory=ChangeSet)
+    category: ChangeSet = field(default_factory=ChangeSet)
+    meta_data: ChangeSet = field(default_factory=ChangeSet)
+    interface: ChangeSet = field(default_factory=ChangeSet)
+    service: Dict[str, ChangeSet] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.attributes
+            or self.asset
+            or self.category
+            or self.meta_data
+            or self.interface
+        )
+
+
+@dataclass
+class RequisitionDiff:
+    "Nodes added, changed and removed between two versions of a requisition"
+
+    foreign_source: str
+    added: List[str] = field(default_factory=list)
+    changed: Dict[str, NodeDiff] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
 
 @dataclass
 class RequisitionNode:
     "Requisition Node class"
+
     foreign_id: str
     node_label: str
     location: Optional[str] = None
@@ -217,6 +476,21 @@ class RequisitionNode:
     category: List[Category] = field(default_factory=list)
     interface: Dict[str, Interface] = field(default_factory=dict)
     meta_data: List[Metadata] = field(default_factory=list)
+    _asset_index: _KeyIndex = field(
+        default_factory=_new_asset_index,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _category_index: _KeyIndex = field(
+        default_factory=_new_category_index,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _meta_data_index: _KeyIndex = field(
+        default_factory=_new_metadata_index, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):  # noqa C901
         self.foreign_id = str(self.foreign_id)
@@ -258,6 +532,66 @@ class RequisitionNode:
 
     _to_dict = to_dict
 
+    def fingerprint(self) -> str:
+        "Stable content hash of the node and everything it contains"
+        return fingerprint(
+            "node",
+            self.foreign_id,
+            [getattr(self, name) for name in NODE_ATTRIBUTES],
+            _fingerprints(self.asset),
+            _fingerprints(self.category),
+            _fingerprints(list(self.interface.values())),
+            _fingerprints(self.meta_data),
+        )
+
+    def diff(self, desired: "RequisitionNode") -> NodeDiff:
+        """Compare this node with the desired version of it.
+        Metadata and assets without a value are ignored, as they are not sent by `to_dict()`.
+
+        Args:
+            desired (`RequisitionNode`): Desired version of the node.
+
+        Returns:
+            `NodeDiff` object, which is falsy when both versions are equivalent.
+        """
+        result = NodeDiff(
+            foreign_id=self.foreign_id,
+            attributes=[
+                name
+                for name in NODE_ATTRIBUTES
+                if getattr(self, name) != getattr(desired, name)
+            ],
+            asset=_compare(
+                {asset.name: asset.value for asset in self.asset if asset.value},
+                {asset.name: asset.value for asset in desired.asset if asset.value},
+            ),
+            category=_compare(
+                {category.name: None for category in self.category},
+                {category.name: None for category in desired.category},
+            ),
+            meta_data=_compare(
+                _metadata_values(self.meta_data), _metadata_values(desired.meta_data)
+            ),
+            interface=_compare(
+                {ip: value.fingerprint() for ip, value in self.interface.items()},
+                {ip: value.fingerprint() for ip, value in desired.interface.items()},
+            ),
+        )
+        for ip in result.interface.changed:
+            services = _compare(
+                {
+                    service.service_name: service.fingerprint()
+                    for service in self.interface[ip].monitored_service
+                },
+                {
+                    service.service_name: service.fingerprint()
+                    for service in desired.interface[ip].monitored_service
+                },
+            )
+            if services:
+                result.service[ip] = services
+        return result
+
     def add_interface(self, interface: Interface, merge: bool = True):
         """Add an IP interface to the node
 
@@ -266,18 +600,41 @@ class RequisitionNode:
             merge (bool, optional): Merge non-null attributes with existing interface in requisition.
                 Set to `False` to overwrite entire node record.
                 Defaults to `True`.
-
-        Raises:
-            `NotImplementedError`: If `merge` not set to `False`
         """  # noqa
-        if merge:
-            if interface.ip_addr not in self.interface:
-                self.interface[interface.ip_addr] = interface
-            else:
-                raise NotImplementedError
-        else:
+        current = self.interface.get(interface.ip_addr)
+        if merge and current and current.fingerprint() != interface.fingerprint():
+            self.interface[interface.ip_addr] = current.merge_interface(interface)
+        elif not merge or not current:
             self.interface[interface.ip_addr] = interface
 
+    def merge_node(self, new_node: "RequisitionNode") -> "RequisitionNode":
+        """Get a copy of this node with the non-null attributes, assets, categories,
+        metadata and interfaces of another version of it merged in.
+
+        Raises:
+            pyonms.models.exceptions.InvalidValueError: If `new_node` has a different foreign ID.
+        """
+        if self.foreign_id != new_node.foreign_id:
+            raise exceptions.InvalidValueError(
+                name="foreign_id", value=new_node.foreign_id, valid=[self.foreign_id]
+            )
+        final_node = deepcopy(self)
+        for node_field in NODE_ATTRIBUTES:
+            if getattr(new_node, node_field):
+                setattr(final_node, node_field, getattr(new_node, node_field))
+        for asset in new_node.asset:
+            if asset.value:
+                final_node.set_asset(name=asset.name, value=asset.value)
+        for category in new_node.category:
+            final_node.add_category(category.name)
+        for meta in new_node.meta_data:
+            final_node.set_metadata(key=meta.key, value=meta.value)
+        for interface in new_node.interface.values():
+            final_node.add_interface(deepcopy(interface), merge=True)
+        return final_node
+
+    _merge_node = merge_node
+
     def change_ip(self, old_ip: str, new_ip: str):
         """Change the IP address of an existing IP interface
 
@@ -291,7 +648,7 @@ class RequisitionNode:
         """  # noqa
         if old_ip not in self.interface:
             raise exceptions.InvalidValueError(
-                name="old_ip", value=old_ip, valid=[ip for ip in self.interface]
+                name="old_ip", value=old_ip, valid=list(self.interface)
             )
         if new_ip not in self.interface:
             self.interface[new_ip] = self.interface[old_ip]
@@ -307,11 +664,13 @@ class RequisitionNode:
             key (str):   Metadata key.
             value (str): Metadata value. Set to `None` to remove the entry.
         """
-        for data in self.meta_data:
-            if data.key == key:
-                data.value = value
-                return
-        self.meta_data.append(Metadata(context="requisition", key=key, value=value))
+        data = self._meta_data_index.find(self.meta_data, key)
+        if data is not None:
+            data.value = value
+        else:
+            self._meta_data_index.append(
+                self.meta_data, Metadata(context="requisition", key=key, value=value)
+            )
 
     def set_asset(self, name: str, value: str):
         """Add or update asset data for the node.
@@ -320,11 +679,11 @@ class RequisitionNode:
             name (str):  Asset field name.
             value (str): Asset field value. Set to `None` to remove the entry.
         """
-        for data in self.asset:
-            if data.name.lower() == name.lower():
-                data.value = value
-                return
-        self.asset.append(AssetField(name=name, value=value))
+        data = self._asset_index.find(self.asset, name.lower())
+        if data is not None:
+            data.value = value
+        else:
+            self._asset_index.append(self.asset, AssetField(name=name, value=value))
 
     def add_category(self, category: str):
         """Add category to node, if not currently assigned
@@ -332,8 +691,8 @@ class RequisitionNode:
         Args:
             category (str): Category name
         """
-        if category not in [cat.name for cat in self.category]:
-            self.category.append(Category(name=category))
+        if self._category_index.find(self.category, category) is None:
+            self._category_index.append(self.category, Category(name=category))
 
     def remove_category(self, category: str):
         """Remove category from node
@@ -346,6 +705,7 @@ class RequisitionNode:
 @dataclass
 class Requisition:
     "Requisition class"
+
     foreign_source: str
     date_stamp: Optional[Union[datetime, int]] = None
     last_import: Optional[Union[datetime, int]] = None
@@ -370,8 +730,68 @@ class Requisition:
 
     def to_dict(self) -> dict:
         "Convert object to a `dict`"
-        payload: Dict[str, Any] = {"foreign-source": self.foreign_source}
+        payload = self._header()
         payload["node"] = [node.to_dict() for node in self.node.values()]
+        return payload
+
+    _to_dict = to_dict
+
+    def iter_json(
+        self,
+        dumps: Optional[Callable[[Any], bytes]] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[bytes]:
+        """Serialize the requisition as JSON, one node at a time.
+        The output is equivalent to `to_dict()`, without holding every node's `dict` in memory.
+
+        Args:
+            dumps (Callable): Encode an object to UTF-8 `bytes`. Defaults to the standard library `json` module.
+            chunk_size (int): Approximate size in bytes of each chunk. Defaults to 64 KiB.
+
+        Returns:
+            Iterator of `bytes` chunks
+        """  # noqa
+        if dumps is None:
+            dumps = _json_dumps
+        buffer = bytearray(dumps(self._header())[:-1])
+        buffer += b',"node":['
+        for index, node in enumerate(self.node.values()):
+            if index:
+                buffer += b","
+            buffer += dumps(node.to_dict())
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]}"
+        yield bytes(buffer)
+
+    def iter_xml(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Serialize the requisition as model-import XML, one node at a time.
+
+        Args:
+            chunk_size (int): Approximate size in bytes of each chunk. Defaults to 64 KiB.
+
+        Returns:
+            Iterator of `bytes` chunks
+        """
+        attributes = {"xmlns": MODEL_IMPORT_NAMESPACE, **self._header()}
+        for time_field in ["date-stamp", "last-import"]:
+            if time_field in attributes:
+                attributes[time_field] = getattr(
+                    self, time_field.replace("-", "_")
+                ).isoformat()
+        buffer = bytearray(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        buffer += f"<model-import{_xml_attributes(attributes)}>".encode("utf-8")
+        for node in self.node.values():
+            buffer += _xml_element("node", node.to_dict()).encode("utf-8")
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"</model-import>"
+        yield bytes(buffer)
+
+    def _header(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"foreign-source": self.foreign_source}
         for time_field in ["date_stamp", "last_import"]:
             if getattr(self, time_field):
                 payload[time_field.replace("_", "-")] = int(
@@ -379,8 +799,6 @@ class Requisition:
                 )
         return payload
 
-    _to_dict = to_dict
-
     def add_node(self, node: RequisitionNode, merge: bool = True):
         """Add a node to the requisition
 
@@ -389,18 +807,35 @@ class Requisition:
             merge (bool, optional): Merge non-null attributes with existing node in requisition.
                 Set to `False` to overwrite entire node record.
                 Defaults to `True`.
-
-        Raises:
-            `NotImplementedError`: If `merge` not set to `False`
         """  # noqa
-        if merge:
-            if node.foreign_id not in self.node:
-                self.node[node.foreign_id] = node
-            else:
-                raise NotImplementedError
-        else:
+        current = self.node.get(node.foreign_id)
+        if merge and current and current.fingerprint() != node.fingerprint():
+            self.node[node.foreign_id] = current.merge_node(node)
+        elif not merge or not current:
             self.node[node.foreign_id] = node
 
+    def diff(self, desired: "Requisition") -> RequisitionDiff:
+        """Compare this requisition with the desired version of it, node by node.
+
+        Args:
+            desired (`Requisition`): Desired version of the requisition.
+
+        Returns:
+            `RequisitionDiff` object, which is falsy when both versions are equivalent.
+        """
+        result = RequisitionDiff(foreign_source=desired.foreign_source)
+        for foreign_id, node in desired.node.items():
+            if foreign_id not in self.node:
+                result.added.append(foreign_id)
+            elif self.node[foreign_id].fingerprint() != node.fingerprint():
+                node_diff = self.node[foreign_id].diff(node)
+                if node_diff:
+                    result.changed[foreign_id] = node_diff
+        result.removed = [
+            foreign_id for foreign_id in self.node if foreign_id not in desired.node
+        ]
+        return result
+
     def remove_node(self, foreign_id: str):
         """Remove a node from the requisition
 
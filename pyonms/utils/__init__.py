@@ -2,16 +2,30 @@
 
 """Helper Utilities"""
 
+import hashlib
 import ipaddress
+import json
+import sys
+import time as _time
 from collections import OrderedDict
-from datetime import datetime, tzinfo
-from typing import Optional, Union
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List, Optional, Union
 
 import pytz
-import xmltodict
+
+from pyonms.utils.xml_parser import parse_xml
+
+try:
+    import numpy  # type: ignore
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
 
 LINK_TIME_PATTERN = "%m/%d/%y, %I:%M:%S %p"
 
+SLOTS: dict = {"slots": True} if sys.version_info >= (3, 10) else {}
+"""`dataclass` keyword arguments for slot-based models on Python 3.10+"""
+
 
 def convert_time(
     time: int, zone: Optional[Union[str, tzinfo]] = None
@@ -39,7 +53,7 @@ def convert_link_time(
     if not time:
         return None
     if isinstance(time, str):
-        link_time = datetime.strptime(time, LINK_TIME_PATTERN)
+        link_time = _parse_link_time(time)
         if isinstance(zone, str):
             link_time.replace(tzinfo=pytz.timezone(zone))
         elif isinstance(zone, tzinfo):
@@ -53,10 +67,95 @@ def convert_link_time(
         )
 
 
+def convert_times(times: Iterable[Any]) -> List[Optional[datetime]]:
+    """Convert a column of epoch milliseconds to `datetime`, as `convert_time` does for each value.
+    Values that are not integers, such as `datetime` objects already converted, are returned unchanged.
+    Uses NumPy when it is installed. The NumPy path assumes the local UTC offset changes at most once
+    per UTC day, which holds for current time zone rules.
+    """
+    values = list(times)
+    positions = [
+        index
+        for index, value in enumerate(values)
+        if isinstance(value, int) and not isinstance(value, bool)
+    ]
+    if numpy is not None and len(positions) > 1:
+        converted = _local_times([values[index] for index in positions])
+    else:
+        converted = [convert_time(values[index]) for index in positions]
+    for index, value in zip(positions, converted):
+        values[index] = value
+    return [value if value else None for value in values]
+
+
+def _local_times(stamps: List[int]) -> list:
+    # The local UTC offset is looked up at both ends of each UTC day. Values
+    # on days where it changes are looked up individually, once per distinct second.
+    millis = numpy.array(stamps, dtype=numpy.int64)
+    days, day_index = numpy.unique(millis // 86400000, return_inverse=True)
+    day_index = day_index.reshape(-1)
+    starts = numpy.array([_utc_offset(day * 86400) for day in days.tolist()])
+    ends = numpy.array([_utc_offset(day * 86400 + 86399) for day in days.tolist()])
+    offsets = starts[day_index]
+    changing = numpy.flatnonzero((starts != ends)[day_index])
+    if changing.size:
+        seconds, second_index = numpy.unique(
+            millis[changing] // 1000, return_inverse=True
+        )
+        offsets[changing] = numpy.array(
+            [_utc_offset(second) for second in seconds.tolist()]
+        )[second_index.reshape(-1)]
+    local = millis + offsets * 1000
+    converted = local.astype("datetime64[ms]").astype(object).tolist()
+    return [stamp if value else None for stamp, value in zip(converted, stamps)]
+
+
+def _utc_offset(seconds: int) -> int:
+    return _time.localtime(seconds).tm_gmtoff
+
+
+@lru_cache(maxsize=4096)
+def _parse_link_time(time: str) -> datetime:
+    return datetime.strptime(time, LINK_TIME_PATTERN)
+
+
+def convert_link_times(times: Iterable[Any]) -> List[Optional[datetime]]:
+    """Convert a column of enlinkd time strings to `datetime`, matching `convert_link_time` for each value.
+    Values that are not strings are returned unchanged. Repeated strings are parsed once.
+    """
+    return [
+        convert_link_time(value) if isinstance(value, str) else value or None
+        for value in times
+    ]
+
+
+def convert_record_times(
+    records: List[dict],
+    keys: Iterable[str],
+    convert: Callable[[Iterable[Any]], List[Optional[datetime]]] = convert_times,
+) -> None:
+    """Convert the `keys` of every record in place, one column at a time.
+    Used on raw pages before models are built, so their per-field conversion is skipped.
+    """
+    for key in keys:
+        present = [record for record in records if record and key in record]
+        if present:
+            converted = convert([record[key] for record in present])
+            for record, value in zip(present, converted):
+                record[key] = value
+
+
+def fiql_time(time: Union[int, datetime]) -> str:
+    """Format epoch milliseconds or `datetime` as a FIQL timestamp"""
+    if isinstance(time, datetime):
+        time = int(time.timestamp() * 1000)
+    time_stamp = datetime.fromtimestamp(time // 1000, tz=timezone.utc)
+    return f"{time_stamp:%Y-%m-%dT%H:%M:%S}.{time % 1000:03d}+0000"
+
+
 def convert_xml(data: str) -> dict:
-    """Parse XML string into a `dict`"""
-    parsed_data = xmltodict.parse(data)
-    return dict(normalize_dict(parsed_data))
+    """Parse XML string into a `dict` with normalized keys"""
+    return parse_xml(data)
 
 
 def normalize_dict(data: Union[OrderedDict, dict, list]) -> Union[dict, list]:
@@ -98,3 +197,11 @@ def check_ip_address(ip: str, raise_error: bool = False):
                 raise ipaddress.AddressValueError from e
             else:
                 return False
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable content hash of JSON-serializable values, as a hex string.
+    Unlike `hash()`, it is the same across interpreter runs.
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
@@ -0,0 +1,118 @@
+# utils.columnar.py
+
+# cspell:ignore pyarrow
+
+"""Columnar export of raw API records to pandas or Arrow"""
+
+import importlib
+import json
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from pyonms.models.exceptions import InvalidValueError
+
+LIBRARIES = {"pandas": "pandas", "arrow": "pyarrow"}
+
+
+def flatten_record(record: dict, prefix: str = "") -> Dict[str, Any]:
+    """Flatten nested dictionaries into dotted keys, such as `serviceType.name`.
+    Lists are left as-is.
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, prefix=f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def to_columns(
+    records: Iterable[dict], columns: Optional[Sequence[str]] = None
+) -> Dict[str, list]:
+    """Collect records into one list per column, filling missing values with `None`.
+
+    Args:
+        records (Iterable[dict]): Raw API records. Nested dictionaries are flattened with `flatten_record`.
+        columns (Sequence[str]): Only keep these columns, in this order. Defaults to every column seen.
+
+    Returns:
+        `dict` of column name to values
+    """
+    data: Dict[str, list] = {name: [] for name in columns or []}
+    count = 0
+    for record in records:
+        if not record:
+            continue
+        for name, value in flatten_record(record).items():
+            column = data.get(name)
+            if column is None:
+                if columns:
+                    continue
+                column = data[name] = [None] * count
+            column.append(value)
+        count += 1
+        for column in data.values():
+            if len(column) < count:
+                column.append(None)
+    return data
+
+
+def _import_library(output: str) -> Any:
+    if output not in LIBRARIES:
+        raise InvalidValueError(name="output", value=output, valid=list(LIBRARIES))
+    try:
+        return importlib.import_module(LIBRARIES[output])
+    except ImportError as error:
+        raise ImportError(
+            f"`{output}` export requires `{LIBRARIES[output]}`. Install it with `pip install pyonms[{output}]`."
+        ) from error
+
+
+def _pandas_table(pandas: Any, data: Dict[str, list], time_columns: Sequence[str]):
+    frame = pandas.DataFrame(data)
+    for name in time_columns:
+        if name in frame:
+            frame[name] = pandas.to_datetime(frame[name], unit="ms", utc=True)
+    return frame
+
+
+def _arrow_table(pyarrow: Any, data: Dict[str, list], time_columns: Sequence[str]):
+    arrays = {}
+    for name, values in data.items():
+        if name in time_columns:
+            arrays[name] = pyarrow.array(values, type=pyarrow.timestamp("ms", tz="UTC"))
+        elif any(isinstance(value, list) for value in values):
+            arrays[name] = pyarrow.array(
+                [json.dumps(value) if value is not None else None for value in values],
+                type=pyarrow.string(),
+            )
+        else:
+            arrays[name] = pyarrow.array(values)
+    return pyarrow.table(arrays)
+
+
+def to_table(
+    records: Iterable[dict],
+    output: str = "pandas",
+    columns: Optional[Sequence[str]] = None,
+    time_columns: Sequence[str] = (),
+) -> Any:
+    """Build a pandas `DataFrame` or Arrow `Table` from raw API records.
+    The library is imported before `records` is consumed, so a missing dependency fails before any fetch.
+
+    Args:
+        records (Iterable[dict]): Raw API records, consumed once.
+        output (str): `pandas` or `arrow`. Defaults to `pandas`.
+        columns (Sequence[str]): Only keep these columns. Defaults to every column seen.
+        time_columns (Sequence[str]): Columns holding epoch milliseconds, converted to UTC timestamps.
+            List values in other columns are kept as objects in pandas and encoded as JSON strings in Arrow.
+
+    Returns:
+        `pandas.DataFrame` or `pyarrow.Table`
+    """
+    library = _import_library(output)
+    data = to_columns(records, columns=columns)
+    if output == "arrow":
+        return _arrow_table(library, data, time_columns)
+    return _pandas_table(library, data, time_columns)
@@ -0,0 +1,86 @@
+# utils.json_backend.py
+
+# cspell:ignore orjson msgspec
+
+"""Pluggable JSON encoding and decoding"""
+
+import json
+from typing import Any, Callable, Union
+
+from pyonms.models.exceptions import InvalidValueError
+
+BACKENDS = ["orjson", "msgspec", "json"]
+
+
+class JSONBackend:
+    """JSON encoder/decoder pair"""
+
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], bytes],
+    ):
+        self.name = name
+        self.loads = loads
+        """Decode `bytes` or `str` into Python objects"""
+        self.dumps = dumps
+        """Encode Python objects as UTF-8 `bytes`"""
+
+    def __repr__(self):
+        return f"JSONBackend(name={self.name})"
+
+
+def _stdlib_backend() -> JSONBackend:
+    return JSONBackend(
+        name="json",
+        loads=json.loads,
+        dumps=lambda data: json.dumps(data).encode("utf-8"),
+    )
+
+
+def _orjson_backend() -> JSONBackend:
+    import orjson  # pylint: disable=C0415
+
+    return JSONBackend(
+        name="orjson", loads=orjson.loads, dumps=orjson.dumps  # pylint: disable=E1101
+    )
+
+
+def _msgspec_backend() -> JSONBackend:
+    import msgspec  # type: ignore # pylint: disable=C0415,E0401
+
+    return JSONBackend(
+        name="msgspec", loads=msgspec.json.decode, dumps=msgspec.json.encode
+    )
+
+
+def get_json_backend(name: str = "json") -> JSONBackend:
+    """Get a JSON backend by name.
+
+    Args:
+        name (str): `orjson`, `msgspec`, `json`, or `auto` for the fastest installed backend.
+            Falls back to the standard library `json` module when the requested package is not installed.
+
+    Returns:
+        `JSONBackend` object
+    """
+    loaders = {
+        "orjson": _orjson_backend,
+        "msgspec": _msgspec_backend,
+        "json": _stdlib_backend,
+    }
+    if name == "auto":
+        candidates = BACKENDS
+    elif name in loaders:
+        candidates = [name, "json"]
+    else:
+        raise InvalidValueError(
+            name="json_backend", value=name, valid=BACKENDS + ["auto"]
+        )
+    for candidate in candidates:
+        try:
+            return loaders[candidate]()
+        except ImportError:
+            continue
+    return _stdlib_backend()
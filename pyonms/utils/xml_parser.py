@@ -0,0 +1,138 @@
+# utils.xml_parser.py
+
+"""Single-pass XML to `dict` conversion with normalized keys"""
+
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Union
+from xml.parsers import expat
+
+_MISSING = object()
+
+
+class _Builder:
+    """Expat handlers building the same structure as `xmltodict.parse()` followed by
+    `normalize_dict()`: attributes and child elements share one `dict`, repeated children become lists,
+    text-only elements become strings, and empty elements become `None`.
+    """
+
+    def __init__(self, tag: Optional[str] = None, force_list: Iterable[str] = ()):
+        self.tag = tag
+        self.force_list = set(force_list)
+        self.keys: Dict[str, str] = {}
+        self.stack: List[list] = []
+        self.items: List[Any] = []
+        self.root: Optional[dict] = None
+
+    def parser(self) -> Any:
+        """Create an expat parser wired to this builder."""
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        parser.CharacterDataHandler = self.characters
+        return parser
+
+    def key(self, name: str) -> str:
+        """Normalize an element or attribute name, memoized per document."""
+        key = self.keys.get(name)
+        if key is None:
+            key = self.keys[name] = name.replace("-", "_")
+        return key
+
+    def start(self, name: str, attributes: Dict[str, str]):
+        """Open an element, keeping its attributes until it ends."""
+        item = None
+        if attributes:
+            item = {self.key(key): value for key, value in attributes.items()}
+        self.stack.append([name, item, []])
+
+    def characters(self, data: str):
+        """Collect text of the open element."""
+        self.stack[-1][2].append(data)
+
+    def end(self, name: str):
+        """Close an element and attach its value to the parent, or collect it when it matches `tag`."""
+        _, item, data = self.stack.pop()
+        text = "".join(data).strip() if data else ""
+        if item is None:
+            value = text or None
+        else:
+            if text:
+                item["#text"] = text
+            value = item
+        key = self.key(name)
+        if name == self.tag:
+            self.items.append(value)
+            return
+        if not self.stack:
+            self.root = {key: value}
+            return
+        parent = self.stack[-1]
+        if parent[1] is None:
+            parent[1] = {}
+        siblings = parent[1]
+        current = siblings.get(key, _MISSING)
+        if current is _MISSING:
+            siblings[key] = [value] if key in self.force_list else value
+        elif isinstance(current, list):
+            current.append(value)
+        else:
+            siblings[key] = [current, value]
+
+
+def parse_xml(data: Union[str, bytes], force_list: Iterable[str] = ()) -> dict:
+    """Parse an XML document into a `dict` with normalized keys, in one pass.
+    Equivalent to `normalize_dict(xmltodict.parse(data))`.
+
+    Args:
+        data (str): XML document.
+        force_list (Iterable[str]): Normalized keys to always return as a list, even with a single element.
+
+    Raises:
+        `xml.parsers.expat.ExpatError`: If the document is not valid XML.
+
+    Returns:
+        `dict`
+    """
+    builder = _Builder(force_list=force_list)
+    builder.parser().Parse(data, True)
+    return builder.root or {}
+
+
+def iter_xml(
+    source: Union[str, bytes, IO],
+    tag: str,
+    force_list: Iterable[str] = (),
+    chunk_size: int = 65536,
+) -> Iterator[Any]:
+    """Parse an XML document incrementally, yielding each `tag` element as soon as it is complete.
+    Yielded elements are not kept in their parent, so memory use does not grow with the document.
+
+    Args:
+        source (str | bytes | IO): XML document, or a binary file-like object such as a streamed response body.
+        tag (str): Element name to yield, such as `node`.
+        force_list (Iterable[str]): Normalized keys to always return as a list, even with a single element.
+        chunk_size (int): Bytes fed to the parser at a time. Defaults to 64 KiB.
+
+    Raises:
+        `xml.parsers.expat.ExpatError`: If the document is not valid XML.
+
+    Returns:
+        Iterator of converted elements
+    """
+    builder = _Builder(tag=tag, force_list=force_list)
+    parser = builder.parser()
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        chunks: Iterable[bytes] = (
+            source[offset : offset + chunk_size]
+            for offset in range(0, len(source), chunk_size)
+        )
+    else:
+        chunks = iter(lambda: source.read(chunk_size), b"")  # type: ignore[union-attr]
+    for chunk in chunks:
+        parser.Parse(chunk, False)
+        yield from builder.items
+        builder.items.clear()
+    parser.Parse(b"", True)
+    yield from builder.items
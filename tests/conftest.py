@@ -2,7 +2,13 @@
 
 # pylint: disable=C0114,C0116,W0621,W0212
 
+import asyncio
+import io
+import json
 import os
+import re
+from datetime import datetime
+from typing import Dict, List
 
 import pytest
 from dotenv import load_dotenv
@@ -29,3 +35,261 @@ def test_instance() -> PyONMS:
         username=os.getenv("test_user", "admin"),
         password=os.getenv("test_pass", "admin"),
     )
+
+
+class OfflineResponse:
+    """Canned `requests.Response` stand-in for offline pagination tests"""
+
+    def __init__(self, data: dict, status_code: int = 200):
+        self.status_code = status_code
+        self.data = data
+        self.text = str(data)
+        self.encoding = "utf-8"
+        self.headers: Dict[str, str] = {}
+
+    def json(self) -> dict:
+        return json.loads(self.content)
+
+    @property
+    def content(self) -> bytes:
+        if isinstance(self.data, bytes):
+            return self.data
+        return json.dumps(self.data).encode()
+
+    @property
+    def raw(self) -> io.BytesIO:
+        return io.BytesIO(self.content)
+
+    def __enter__(self) -> "OfflineResponse":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+class OfflineSession:
+    """Serves paged v2 collection responses from in-memory records"""
+
+    def __init__(self, collections: Dict[str, List[dict]], endpoints: Dict[str, str]):
+        self.collections = collections
+        self.endpoints = endpoints
+        self.details: Dict[str, dict] = {}
+        self.etags: Dict[str, str] = {}
+        self.calls: List[dict] = []
+        self.writes: List[tuple] = []
+        self.page_cap = 0
+
+    def get(self, url: str, params=None, headers=None, **kwargs) -> OfflineResponse:
+        params = dict(params or {})
+        self.calls.append(params)
+        if "/rest/" in url and url.split("/rest/", 1)[1].strip("/") in self.details:
+            return OfflineResponse(self.details[url.split("/rest/", 1)[1].strip("/")])
+        collection = url.rsplit("/", 1)[-1]
+        etag = self.etags.get(collection)
+        if etag and (headers or {}).get("If-None-Match") == etag:
+            return OfflineResponse({}, status_code=304)
+        if collection.isdigit():
+            collection, record_id = url.rsplit("/", 2)[-2:]
+            if f"{collection}/{record_id}" in self.details:
+                return OfflineResponse(self.details[f"{collection}/{record_id}"])
+            for record in self.collections[collection]:
+                if record["id"] == int(record_id):
+                    return OfflineResponse(record)
+            return OfflineResponse({}, status_code=204)
+        records = self.collections[collection]
+        cursor = re.search(r"id=gt=(\d+)", params.get("_s", ""))
+        if cursor:
+            records = [record for record in records if record["id"] > int(cursor[1])]
+        since = [
+            (
+                field,
+                datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp() * 1000,
+            )
+            for field, value in re.findall(
+                r"(\w+)=ge=([\d\-T:.]+\+0000)", params.get("_s", "")
+            )
+        ]
+        if since:
+            records = [
+                record
+                for record in records
+                if any((record.get(field) or 0) >= value for field, value in since)
+            ]
+        node_ids = {
+            int(node_id)
+            for node_id in re.findall(r"node\.id==(\d+)", params.get("_s", ""))
+        }
+        if node_ids:
+            records = [
+                record for record in records if self._node_id(record) in node_ids
+            ]
+        if params.get("orderBy"):
+            records = sorted(
+                records,
+                key=lambda record: record.get(params["orderBy"]) or 0,
+                reverse=params.get("order") == "desc",
+            )
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 0))
+        if self.page_cap:
+            limit = min(limit, self.page_cap) if limit else self.page_cap
+        page = records[offset : offset + limit] if limit else records[offset:]
+        response = OfflineResponse(
+            {
+                self.endpoints[collection]: page,
+                "count": len(page),
+                "offset": offset,
+                "totalCount": len(records),
+            }
+        )
+        if etag:
+            response.headers["ETag"] = etag
+        return response
+
+    def _node_id(self, record: dict) -> int:
+        if "ipInterfaceId" in record:
+            for ip_interface in self.collections["ipinterfaces"]:
+                if ip_interface["id"] == record["ipInterfaceId"]:
+                    return ip_interface["nodeId"]
+        return record.get("nodeId", 0)
+
+    def put(self, url: str, params=None, **kwargs) -> OfflineResponse:
+        self.calls.append(dict(params or {}))
+        self.writes.append(("PUT", url, kwargs.get("json")))
+        return OfflineResponse({}, status_code=204)
+
+    def post(self, url: str, json=None, data=None, **kwargs) -> OfflineResponse:
+        if data is not None and not isinstance(data, (str, bytes)):
+            data = b"".join(data)
+        self.writes.append(("POST", url, json if json is not None else data))
+        return OfflineResponse({}, status_code=202)
+
+    def delete(self, url: str, **kwargs) -> OfflineResponse:
+        self.writes.append(("DELETE", url, None))
+        return OfflineResponse({}, status_code=202)
+
+
+class OfflineAsyncResponse:
+    """Canned `aiohttp.ClientResponse` stand-in built from an `OfflineResponse`"""
+
+    def __init__(self, response: OfflineResponse):
+        self.status = response.status_code
+        self.content_type = "application/json"
+        self.charset = "utf-8"
+        self.body = response.content
+        self.headers = response.headers
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self) -> str:
+        return self.body.decode()
+
+
+class OfflineAsyncSession:
+    """Serves `OfflineSession` responses through the `aiohttp.ClientSession.request()` interface"""
+
+    def __init__(self, session: OfflineSession):
+        self.offline = session
+        self.headers: List[dict] = []
+
+    async def request(
+        self, method: str, url: str, params=None, json=None, data=None, **kwargs
+    ) -> OfflineAsyncResponse:
+        self.headers.append(dict(kwargs.get("headers") or {}))
+        if method == "GET":
+            response = self.offline.get(
+                url, params=params, headers=kwargs.get("headers")
+            )
+        elif method == "POST":
+            response = self.offline.post(url, json=json, data=data)
+        elif method == "PUT":
+            response = self.offline.put(url, params=params, json=json)
+        else:
+            response = self.offline.delete(url)
+        return OfflineAsyncResponse(response)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def offline_args() -> dict:
+    alarms = [
+        {
+            "id": alarm_id,
+            "reductionKey": f"uei.opennms.org/test::{alarm_id}",
+            "type": 1,
+            "severity": "MINOR",
+            "description": "Test alarm",
+            "logMessage": "Test alarm",
+        }
+        for alarm_id in range(1, 24)
+    ]
+    events = [
+        {"id": event_id, "uei": "uei.opennms.org/test"} for event_id in range(1, 6)
+    ]
+    nodes = [{"id": node_id, "label": f"node{node_id}"} for node_id in range(1, 4)]
+    ip_interfaces = [
+        {"id": ip_id, "nodeId": (ip_id + 1) // 2, "ipAddress": f"10.0.0.{ip_id}"}
+        for ip_id in range(1, 6)
+    ]
+    services = [
+        {
+            "id": service_id,
+            "ipInterfaceId": (service_id + 1) // 2,
+            "serviceType": {
+                "id": service_id % 2 + 1,
+                "name": ["ICMP", "SNMP"][service_id % 2],
+            },
+        }
+        for service_id in range(1, 11)
+    ]
+    session = OfflineSession(
+        collections={
+            "alarms": alarms,
+            "events": events,
+            "nodes": nodes,
+            "ipinterfaces": ip_interfaces,
+            "ifservices": services,
+        },
+        endpoints={
+            "alarms": "alarm",
+            "events": "event",
+            "nodes": "node",
+            "ipinterfaces": "ipInterface",
+            "ifservices": "service",
+        },
+    )
+    return {
+        "hostname": "http://localhost:8980/opennms",
+        "username": "admin",
+        "password": "admin",
+        "name": "offline",
+        "session": session,
+    }
+
+
+@pytest.fixture
+def bsm_record() -> dict:
+    return {
+        "id": 1,
+        "name": "Service 1",
+        "location": "Default",
+        "operational-status": "NORMAL",
+        "ip-service-edges": [],
+        "reduction-key-edges": [],
+        "child-edges": [],
+        "application-edges": [],
+        "parent-services": [],
+        "reduce-function": {"type": "HighestSeverity", "properties": {}},
+    }
+
+
+@pytest.fixture
+def offline_async_args(offline_args: dict) -> dict:
+    return dict(
+        offline_args,
+        session=OfflineAsyncSession(offline_args["session"]),
+        semaphore=asyncio.Semaphore(10),
+    )
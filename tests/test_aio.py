@@ -0,0 +1,348 @@
+# tests.test_aio.py
+
+# pylint: disable=C0114,C0116,W0621,W0212
+
+import asyncio
+import inspect
+import warnings
+
+import pytest
+
+from pyonms.aio import AsyncPyONMS
+from pyonms.aio.alarms import AlarmAPI
+from pyonms.aio.business_services import BSMAPI
+from pyonms.aio.events import EventAPI
+from pyonms.aio.ips import IPAPI
+from pyonms.aio.nodes import NodeAPI
+from pyonms.aio.requisitions import RequisitionsAPI
+from pyonms.aio.udl import UDLAPI
+from pyonms.cache import NodeCache
+from pyonms.dao.nodes import NodeComponents
+from pyonms.models.alarm import Alarm
+from pyonms.models.node import Metadata, Service
+from pyonms.models.requisition import Interface, Requisition, RequisitionNode
+
+
+def test_aio_alarm_batch(offline_async_args: dict):
+    alarm_api = AlarmAPI(offline_async_args)
+    alarms = asyncio.run(alarm_api.get_alarms(limit=20, batch_size=5))
+    assert len(alarms) == 20
+    assert isinstance(alarms[0], Alarm)
+    assert [alarm.id for alarm in alarms] == list(range(1, 21))
+    offsets = [int(call["offset"]) for call in alarm_api.session.offline.calls]
+    assert sorted(offsets) == [0, 5, 10, 15]
+
+
+def test_aio_alarm_batch_page_cap(offline_async_args: dict):
+    alarm_api = AlarmAPI(offline_async_args)
+    session = alarm_api.session.offline
+    session.page_cap = 5
+    alarms = asyncio.run(alarm_api.get_alarms(limit=23, batch_size=10))
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert [int(call["offset"]) for call in session.calls] == list(range(0, 23, 5))
+    session.calls.clear()
+    alarms = asyncio.run(alarm_api.get_alarms(limit=0))
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert [int(call["offset"]) for call in session.calls] == list(range(0, 23, 5))
+
+
+def test_aio_alarm_iter(offline_async_args: dict):
+    alarm_api = AlarmAPI(offline_async_args)
+
+    async def run():
+        return [alarm.id async for alarm in alarm_api.iter_alarms(limit=12)]
+
+    alarm_ids = asyncio.run(run())
+    assert alarm_ids == list(range(1, 13))
+
+
+def test_aio_alarm_keyset(offline_async_args: dict):
+    alarm_api = AlarmAPI(offline_async_args)
+
+    async def run():
+        return [
+            alarm.id
+            async for alarm in alarm_api.iter_alarms(
+                fiql="severity==MINOR", batch_size=10, keyset=True
+            )
+        ]
+
+    assert asyncio.run(run()) == list(range(1, 24))
+    calls = alarm_api.session.offline.calls
+    assert [call["_s"] for call in calls] == [
+        "(severity==MINOR);id=gt=0",
+        "(severity==MINOR);id=gt=10",
+        "(severity==MINOR);id=gt=20",
+    ]
+    assert calls[0]["orderBy"] == "id"
+
+
+def test_aio_event_keyset_resume(offline_async_args: dict):
+    event_api = EventAPI(offline_async_args)
+    events = asyncio.run(event_api.get_events(limit=0, batch_size=2, after_id=1))
+    assert [event.id for event in events] == [2, 3, 4, 5]
+    assert [call["_s"] for call in event_api.session.offline.calls] == [
+        "id=gt=1",
+        "id=gt=3",
+        "id=gt=5",
+    ]
+
+
+def test_aio_alarm_watch(offline_async_args: dict):
+    alarm_api = AlarmAPI(offline_async_args)
+    records = alarm_api.session.offline.collections["alarms"]
+    del records[3:]
+    for record in records:
+        record["lastEventTime"] = 1704904715000 + record["id"] * 1000
+
+    async def run():
+        watch = alarm_api.watch(since=1704904717000, interval=0, max_polls=2)
+        first = [(await watch.__anext__()).id, (await watch.__anext__()).id]
+        records[1]["lastEventTime"] = 1704904720000
+        return first, [alarm.id async for alarm in watch]
+
+    assert asyncio.run(run()) == ([2, 3], [2])
+    assert alarm_api.session.offline.calls[-1]["_s"] == (
+        "lastEventTime=ge=2024-01-10T16:38:38.000+0000"
+    )
+
+
+def test_aio_event_tail(offline_async_args: dict):
+    event_api = EventAPI(offline_async_args)
+    events = event_api.session.offline.collections["events"]
+    received = []
+
+    async def forward(event):
+        received.append(event.id)
+        if event.id == 5:
+            events.append({"id": 6, "uei": "uei.opennms.org/test"})
+        if event.id == 7:
+            stop.set()
+
+    async def run():
+        await event_api.tail_forever(forward, after_id=3, interval=0, max_polls=2)
+        events.append({"id": 7, "uei": "uei.opennms.org/test"})
+        await event_api.tail_forever(forward, after_id=6, interval=60, stop=stop)
+
+    stop = asyncio.Event()
+    asyncio.run(run())
+    assert received == [4, 5, 6, 7]
+
+
+def test_aio_iter_ips(offline_async_args: dict):
+    ip_api = IPAPI(offline_async_args)
+
+    async def run():
+        return [ip.ipAddress async for ip in ip_api.iter_ips(nodeId=2, batch_size=1)]
+
+    assert asyncio.run(run()) == ["10.0.0.3", "10.0.0.4"]
+    assert ip_api.session.offline.calls[0]["_s"] == "node.id==2"
+
+
+def test_aio_iter_links(offline_async_args: dict):
+    udl_api = UDLAPI(offline_async_args)
+    session = udl_api.session.offline
+    session.endpoints["userdefinedlinks"] = "user_defined_link"
+    session.collections["userdefinedlinks"] = [
+        {
+            "owner": "admin",
+            "node-id-a": link_id,
+            "node-id-z": link_id + 1,
+            "component-label-a": "a",
+            "component-label-z": "z",
+            "link-id": f"link-{link_id}",
+            "db-id": link_id,
+        }
+        for link_id in range(1, 4)
+    ]
+
+    async def run():
+        return [link.db_id async for link in udl_api.iter_links(batch_size=2)]
+
+    assert asyncio.run(run()) == [1, 2, 3]
+    assert [int(call["offset"]) for call in session.calls] == [0, 2]
+
+
+def test_aio_alarms_table(offline_async_args: dict):
+    pandas = pytest.importorskip("pandas")
+    alarm_api = AlarmAPI(offline_async_args)
+    frame = asyncio.run(alarm_api.get_alarms_table(limit=12, batch_size=5))
+    assert isinstance(frame, pandas.DataFrame)
+    assert list(frame["id"]) == list(range(1, 13))
+
+
+def test_aio_bsm_cache(offline_async_args: dict, bsm_record: dict):
+    bsm_api = BSMAPI(offline_async_args)
+    session = bsm_api.session.offline
+    session.details["business-services/1"] = bsm_record
+
+    async def run():
+        first = await bsm_api.get_bsm(1)
+        assert (await bsm_api.get_bsm(1)) is not first
+        assert (await bsm_api.find_bsm_name("Service 1", cache_only=True)).id == 1
+        bsm_api.enable_cache()
+        first = await bsm_api.get_bsm(1)
+        assert (await bsm_api.get_bsm(1)) is first
+
+    asyncio.run(run())
+    assert len(session.calls) == 3
+
+
+def test_aio_find_bsm_name(offline_async_args: dict, bsm_record: dict):
+    bsm_api = BSMAPI(offline_async_args)
+    session = bsm_api.session.offline
+    session.collections["business-services"] = [
+        f"/api/v2/business-services/{bsm_id}" for bsm_id in range(1, 4)
+    ]
+    session.endpoints["business-services"] = "business-services"
+    for bsm_id in range(1, 4):
+        session.details[f"business-services/{bsm_id}"] = dict(
+            bsm_record, id=bsm_id, name=f"Service {bsm_id}"
+        )
+
+    async def run():
+        assert await bsm_api.find_bsm_name("Service 2", cache_only=True) is None
+        assert (await bsm_api.find_bsm_name("Service 2")).id == 2
+        assert (await bsm_api.find_bsm_name("Service 3", threads=1)).id == 3
+        assert await bsm_api.find_bsm_name("Missing") is None
+
+    asyncio.run(run())
+    assert len(session.calls) == 4
+
+
+def test_aio_auth_header(offline_async_args: dict):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        alarm_api = AlarmAPI(offline_async_args)
+    asyncio.run(alarm_api.get_alarm(1))
+    assert alarm_api.session.headers[-1]["Authorization"] == "Basic YWRtaW46YWRtaW4="
+
+
+def test_aio_record_cache(offline_async_args: dict):
+    node_api = NodeAPI(dict(offline_async_args, cache_ttl=60))
+    event_api = EventAPI(dict(offline_async_args, cache_ttl=60))
+    session = node_api.session.offline
+
+    async def run():
+        node = await node_api.get_node(1)
+        assert (await node_api.get_node(1)) is node
+        await node_api.set_node_metadata(
+            1, Metadata(context="requisition", key="owner", value="noc")
+        )
+        assert (await node_api.get_node(1)) is not node
+        event = await event_api.get_event(1)
+        assert (await event_api.get_event(1)) is event
+
+    asyncio.run(run())
+    assert len(session.calls) == 3
+
+
+def test_aio_conditional_requests(offline_async_args: dict):
+    alarm_api = AlarmAPI(dict(offline_async_args, conditional_requests=True))
+    alarm_api.session.offline.etags["alarms"] = '"v1"'
+    first = asyncio.run(alarm_api.get_alarms(limit=0))
+    second = asyncio.run(alarm_api.get_alarms(limit=0))
+    assert [alarm.id for alarm in second] == [alarm.id for alarm in first]
+    assert second[0] is not first[0]
+    assert alarm_api.validator_cache.hits == 1
+    assert alarm_api.session.headers[-1]["If-None-Match"] == '"v1"'
+
+
+def test_aio_node_bulk_hydration(offline_async_args: dict):
+    node_api = NodeAPI(offline_async_args)
+    nodes = asyncio.run(
+        node_api.get_nodes(limit=0, components=[NodeComponents.SERVICES], bulk=True)
+    )
+    assert [node.id for node in nodes] == [1, 2, 3]
+    assert [ip.ipAddress for ip in nodes[0].ipInterfaces] == ["10.0.0.1", "10.0.0.2"]
+    assert [ip.id for ip in nodes[2].ipInterfaces] == [5]
+    assert [service.id for service in nodes[1].ipInterfaces[1].services] == [7, 8]
+    assert isinstance(nodes[1].ipInterfaces[1].services[0], Service)
+    assert len(node_api.session.offline.calls) == 3
+
+
+def test_aio_iter_nodes_bulk(offline_async_args: dict):
+    node_api = NodeAPI(offline_async_args)
+
+    async def run():
+        return [
+            node
+            async for node in node_api.iter_nodes(
+                batch_size=2, components=[NodeComponents.IP], bulk=True
+            )
+        ]
+
+    nodes = asyncio.run(run())
+    assert [node.id for node in nodes] == [1, 2, 3]
+    assert [ip.id for ip in nodes[1].ipInterfaces] == [3, 4]
+    assert sorted(
+        call["_s"] for call in node_api.session.offline.calls if "_s" in call
+    ) == ["node.id==1,node.id==2", "node.id==3"]
+
+
+def test_aio_node_cache(offline_async_args: dict):
+    node_api = NodeAPI(offline_async_args)
+    session = node_api.session.offline
+    records = session.collections["nodes"]
+    for record in records:
+        record["createTime"] = 1704904715000
+    cache = NodeCache()
+    nodes = asyncio.run(
+        node_api.get_nodes_cached(cache, components=[NodeComponents.IP], bulk=True)
+    )
+    assert [node.id for node in nodes] == [1, 2, 3]
+    assert cache.get_watermark("offline")[1] == 1704904715000
+
+    records[1].update(label="renamed", lastCapsdPoll=1704904716000)
+    del records[2]
+    session.calls.clear()
+    nodes = asyncio.run(
+        node_api.get_nodes_cached(cache, components=[NodeComponents.IP], bulk=True)
+    )
+    assert session.calls[0]["_s"] == (
+        "lastCapsdPoll=ge=2024-01-10T16:38:35.000+0000,"
+        "createTime=ge=2024-01-10T16:38:35.000+0000"
+    )
+    assert [node.label for node in nodes] == ["node1", "renamed"]
+    assert [ip.ipAddress for ip in nodes[1].ipInterfaces] == ["10.0.0.3", "10.0.0.4"]
+    assert cache.get("offline", 3) is None
+
+
+def test_aio_requisition_iter_nodes(offline_async_args: dict):
+    requisitions_api = RequisitionsAPI(offline_async_args)
+    requisition = Requisition(foreign_source="cmdb")
+    for node_id in range(1, 4):
+        requisition.add_node(
+            RequisitionNode(
+                foreign_id=str(node_id),
+                node_label=f"node{node_id}",
+                interface=[Interface(ip_addr=f"10.0.0.{node_id}")],
+            )
+        )
+    requisitions_api.session.offline.details["requisitions/cmdb"] = b"".join(
+        requisition.iter_xml()
+    )
+
+    async def run():
+        return [node async for node in requisitions_api.iter_requisition_nodes("cmdb")]
+
+    nodes = asyncio.run(run())
+    assert [node.foreign_id for node in nodes] == ["1", "2", "3"]
+    assert not Requisition(foreign_source="cmdb", node=nodes).diff(requisition)
+    assert requisitions_api.session.headers[-1]["Accept"] == "application/xml"
+
+
+def test_aio_overrides_sync_methods():
+    onms = AsyncPyONMS(
+        hostname="http://localhost:8980/opennms", username="admin", password="admin"
+    )
+    for endpoint in onms._endpoints():
+        for name in dir(type(endpoint)):
+            method = getattr(type(endpoint), name)
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            if name.endswith(("_cache", "_conditional_requests")):
+                continue
+            assert inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(
+                method
+            ), f"{type(endpoint).__name__}.{name}"
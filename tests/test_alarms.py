@@ -7,7 +7,7 @@ from datetime import datetime
 import pytest
 
 from pyonms import PyONMS
-from pyonms.models.alarm import Alarm
+from pyonms.models.alarm import Alarm, LazyAlarm
 from pyonms.models.event import Event, Severity
 
 
@@ -40,3 +40,63 @@ def test_alarm_batch(test_instance: PyONMS):
     assert alarms[0].id == 76
     assert alarms[0].lastEvent.id == 317
     assert alarms[0].parameters[0].name == "label"
+
+
+def test_lazy_alarm():
+    alarm = LazyAlarm(
+        id=1,
+        reductionKey="uei.opennms.org/test::1",
+        type=1,
+        severity="MAJOR",
+        description="Test alarm",
+        logMessage="Test alarm",
+        lastEventTime=1704904715000,
+        lastEvent={"id": 5, "uei": "uei.opennms.org/test"},
+        parameters=[{"name": "key", "value": "value", "type": "string"}],
+    )
+    assert isinstance(alarm, Alarm)
+    assert alarm.severity == Severity.MAJOR
+    assert alarm._raw["lastEventTime"] == 1704904715000
+    assert isinstance(alarm.lastEventTime, datetime)
+    assert "lastEventTime" not in alarm._raw
+    assert isinstance(alarm.lastEvent, Event)
+    assert alarm.lastEvent is alarm.lastEvent
+    assert alarm.parameters[0].value == "value"
+    assert alarm.ackTime is None
+    alarm.ackTime = datetime(2024, 1, 1)
+    assert alarm.ackTime == datetime(2024, 1, 1)
+
+
+def test_alarm_converted_times():
+    last_event_time = datetime(2024, 1, 10, 16, 38, 35)
+    alarm = Alarm(
+        id=1,
+        reductionKey="uei.opennms.org/test::1",
+        type=1,
+        severity="MAJOR",
+        description="Test alarm",
+        logMessage="Test alarm",
+        lastEventTime=last_event_time,
+        firstEventTime=1704904715000,
+    )
+    assert alarm.lastEventTime is last_event_time
+    assert isinstance(alarm.firstEventTime, datetime)
+
+
+def test_alarm_invalid_time():
+    fields = {
+        "id": 1,
+        "reductionKey": "uei.opennms.org/test::1",
+        "type": 1,
+        "severity": "MAJOR",
+        "description": "Test alarm",
+        "logMessage": "Test alarm",
+        "lastEventTime": "2024-01-10T16:38:35",
+    }
+    with pytest.raises(ValueError):
+        Alarm(**fields)
+    alarm = LazyAlarm(**fields)
+    with pytest.raises(ValueError):
+        alarm.lastEventTime  # pylint: disable=W0104
+    fields["lastEventTime"] = None
+    assert LazyAlarm(**fields).lastEventTime is None
@@ -0,0 +1,314 @@
+# tests.test_batch.py
+
+# pylint: disable=C0114,C0116,W0621,W0212
+
+import json
+import threading
+from types import GeneratorType
+
+import pytest
+
+from pyonms.cache import NodeCache
+from pyonms.dao.alarms import AlarmAPI
+from pyonms.dao.events import EventAPI
+from pyonms.dao.nodes import NodeAPI, NodeComponents
+from pyonms.models.alarm import Alarm, LazyAlarm
+from pyonms.models.exceptions import ApiPayloadError
+from pyonms.models.node import Service
+from tests.conftest import OfflineResponse
+
+
+def test_get_batch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = alarm_api.get_alarms(limit=20, batch_size=5)
+    assert len(alarms) == 20
+    assert [alarm.id for alarm in alarms] == list(range(1, 21))
+    assert len(alarm_api.session.calls) == 4
+
+
+def test_get_batch_unlimited(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = alarm_api.get_alarms(limit=0)
+    assert len(alarms) == 23
+    assert alarm_api.session.calls == [{"offset": 0, "limit": 0}]
+
+
+def test_iter_batch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = alarm_api.iter_alarms(batch_size=10)
+    assert isinstance(alarms, GeneratorType)
+    first = next(alarms)
+    assert isinstance(first, Alarm)
+    assert first.id == 1
+    assert len(alarm_api.session.calls) == 1
+    assert [alarm.id for alarm in alarms] == list(range(2, 24))
+    assert len(alarm_api.session.calls) == 3
+
+
+def test_iter_batch_limit(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = list(alarm_api.iter_alarms(limit=12, batch_size=5))
+    assert [alarm.id for alarm in alarms] == list(range(1, 13))
+
+
+def test_prefetch_batch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarm_api.page_threads = 3
+    alarms = alarm_api.get_alarms(limit=0, batch_size=5)
+    assert len(alarms) == 23
+    alarms = list(alarm_api.iter_alarms(batch_size=4))
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert sorted(call["offset"] for call in alarm_api.session.calls[1:]) == list(
+        range(0, 24, 4)
+    )
+
+
+def test_prefetch_batch_page_cap(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarm_api.page_threads = 3
+    alarm_api.session.page_cap = 3
+    alarms = list(alarm_api.iter_alarms(batch_size=5))
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert [call["offset"] for call in alarm_api.session.calls] == list(range(0, 23, 3))
+
+
+def test_sequential_batch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarm_api.page_threads = 1
+    alarms = list(alarm_api.iter_alarms(limit=22, batch_size=5))
+    assert [alarm.id for alarm in alarms] == list(range(1, 23))
+    assert [call["offset"] for call in alarm_api.session.calls] == [0, 5, 10, 15, 20]
+
+
+def test_lazy_batch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = alarm_api.get_alarms(limit=0, lazy=True)
+    assert all(isinstance(alarm, LazyAlarm) for alarm in alarms)
+    assert alarms[4].id == 5
+
+
+def test_keyset_batch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = alarm_api.iter_alarms(fiql="severity==MINOR", batch_size=10, keyset=True)
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert [call["_s"] for call in alarm_api.session.calls] == [
+        "(severity==MINOR);id=gt=0",
+        "(severity==MINOR);id=gt=10",
+        "(severity==MINOR);id=gt=20",
+    ]
+    assert {call["offset"] for call in alarm_api.session.calls} == {0}
+    assert alarm_api.session.calls[0]["orderBy"] == "id"
+
+
+def test_keyset_resume(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    alarms = alarm_api.get_alarms(limit=7, batch_size=5, after_id=15)
+    assert [alarm.id for alarm in alarms] == list(range(16, 23))
+    assert [call["limit"] for call in alarm_api.session.calls] == [5, 2]
+
+
+def test_stream_batch(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, stream_json=True))
+    alarms = list(alarm_api.iter_alarms(batch_size=10))
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert isinstance(alarms[0], Alarm)
+    assert len(alarm_api.session.calls) == 3
+
+
+def test_stream_batch_truncated(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, stream_json=True))
+    alarm_api.session.get = lambda *args, **kwargs: OfflineResponse(
+        b'{"alarm": [{"id": 1, "reductionKey": "uei'
+    )
+    with pytest.raises(ApiPayloadError):
+        list(alarm_api.iter_alarms(batch_size=10))
+
+
+def test_stream_batch_per_record(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, stream_json=True))
+    records = alarm_api.session.collections["alarms"][:2]
+    alarm_api.session.get = lambda *args, **kwargs: OfflineResponse(
+        json.dumps({"alarm": records})[:-2].encode() + b', {"id": 3, "reductionKey'
+    )
+    alarms = alarm_api.iter_alarms(batch_size=10)
+    assert [next(alarms).id, next(alarms).id] == [1, 2]
+    with pytest.raises(ApiPayloadError):
+        next(alarms)
+
+
+def test_stream_batch_page_cap(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, stream_json=True))
+    alarm_api.session.page_cap = 5
+    alarms = alarm_api.get_alarms(limit=0, batch_size=10)
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+    assert [call["offset"] for call in alarm_api.session.calls] == list(range(0, 23, 5))
+
+
+def test_json_backend_batch(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, json_backend="auto"))
+    alarms = alarm_api.get_alarms(limit=0)
+    assert [alarm.id for alarm in alarms] == list(range(1, 24))
+
+
+def test_node_bulk_hydration(offline_args: dict):
+    node_api = NodeAPI(offline_args)
+    nodes = node_api.get_nodes(limit=0, components=[NodeComponents.SERVICES], bulk=True)
+    assert [node.id for node in nodes] == [1, 2, 3]
+    assert [ip.ipAddress for ip in nodes[0].ipInterfaces] == ["10.0.0.1", "10.0.0.2"]
+    assert [ip.id for ip in nodes[2].ipInterfaces] == [5]
+    assert [service.id for service in nodes[1].ipInterfaces[1].services] == [7, 8]
+    assert isinstance(nodes[1].ipInterfaces[1].services[0], Service)
+    assert len(node_api.session.calls) == 3
+
+
+def test_node_bulk_hydration_fiql(offline_args: dict):
+    node_api = NodeAPI(offline_args)
+    records = node_api.session.collections["nodes"]
+    nodes = node_api._process_nodes_bulk(
+        [dict(record) for record in records],
+        components=[NodeComponents.SERVICES],
+        hide_progress=True,
+        bulk_size=2,
+    )
+    assert sorted(call["_s"] for call in node_api.session.calls) == [
+        "node.id==1,node.id==2",
+        "node.id==1,node.id==2",
+        "node.id==3",
+        "node.id==3",
+    ]
+    assert [ip.id for ip in nodes[1].ipInterfaces] == [3, 4]
+    assert [service.id for service in nodes[2].ipInterfaces[0].services] == [9, 10]
+
+
+def test_alarm_watch(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    records = alarm_api.session.collections["alarms"]
+    del records[3:]
+    for record in records:
+        record["lastEventTime"] = 1704904715000 + record["id"] * 1000
+    watch = alarm_api.watch(since=1704904717000, interval=0, max_polls=2)
+    assert [next(watch).id, next(watch).id] == [2, 3]
+    records[0]["lastEventTime"] = 1704904720000
+    records[1]["lastEventTime"] = 1704904720000
+    assert [alarm.id for alarm in watch] == [1, 2]
+    assert [call["_s"] for call in alarm_api.session.calls] == [
+        "lastEventTime=ge=2024-01-10T16:38:37.000+0000",
+        "lastEventTime=ge=2024-01-10T16:38:38.000+0000",
+    ]
+
+
+def test_event_tail(offline_args: dict):
+    event_api = EventAPI(offline_args)
+    events = event_api.session.collections["events"]
+    tail = event_api.tail(after_id=3, interval=0, max_polls=2)
+    assert [next(tail).id, next(tail).id] == [4, 5]
+    events.append({"id": 6, "uei": "uei.opennms.org/test"})
+    assert [event.id for event in tail] == [6]
+
+
+def test_event_tail_callback(offline_args: dict):
+    event_api = EventAPI(offline_args)
+    events = event_api.session.collections["events"]
+    received = []
+
+    def forward(event):
+        received.append(event.id)
+        if event.id == 6:
+            events.append({"id": 7, "uei": "uei.opennms.org/test"})
+
+    assert event_api.tail_forever(forward, interval=0, max_polls=1) is None
+    assert not received
+    events.append({"id": 6, "uei": "uei.opennms.org/test"})
+    event_api.tail_forever(forward, after_id=5, interval=0, max_polls=2)
+    assert received == [6, 7]
+
+
+def test_event_tail_stop(offline_args: dict):
+    event_api = EventAPI(offline_args)
+    events = event_api.session.collections["events"]
+    stop = threading.Event()
+    received = []
+
+    def forward(event):
+        received.append(event.id)
+        if event.id == 6:
+            stop.set()
+
+    events.append({"id": 6, "uei": "uei.opennms.org/test"})
+    event_api.tail_forever(forward, after_id=3, interval=60, stop=stop)
+    assert received == [4, 5, 6]
+    assert not list(event_api.tail(after_id=3, stop=stop))
+
+
+def test_node_cache(offline_args: dict):
+    node_api = NodeAPI(offline_args)
+    records = node_api.session.collections["nodes"]
+    for record in records:
+        record["createTime"] = 1704904715000
+    cache = NodeCache()
+    nodes = node_api.get_nodes_cached(cache, components=[NodeComponents.IP], bulk=True)
+    assert [node.id for node in nodes] == [1, 2, 3]
+    assert cache.get_watermark("offline")[1] == 1704904715000
+
+    records[1].update(label="renamed", lastCapsdPoll=1704904716000)
+    del records[2]
+    node_api.session.calls.clear()
+    nodes = node_api.get_nodes_cached(cache, components=[NodeComponents.IP], bulk=True)
+    assert node_api.session.calls[0]["_s"] == (
+        "lastCapsdPoll=ge=2024-01-10T16:38:35.000+0000,"
+        "createTime=ge=2024-01-10T16:38:35.000+0000"
+    )
+    assert [node.label for node in nodes] == ["node1", "renamed"]
+    assert [ip.ipAddress for ip in nodes[1].ipInterfaces] == ["10.0.0.3", "10.0.0.4"]
+    assert cache.get_watermark("offline")[1] == 1704904716000
+    assert cache.get("offline", 3) is None
+
+
+def test_node_cache_batch_size(offline_args: dict):
+    node_api = NodeAPI(offline_args)
+    node_api.page_threads = 1
+    nodes = node_api.get_nodes_cached(NodeCache(), batch_size=2)
+    assert [node.id for node in nodes] == [1, 2, 3]
+    assert [(call["offset"], call["limit"]) for call in node_api.session.calls[:2]] == [
+        (0, 2),
+        (2, 2),
+    ]
+
+
+def test_alarms_table(offline_args: dict):
+    pandas = pytest.importorskip("pandas")
+    alarm_api = AlarmAPI(offline_args)
+    frame = alarm_api.get_alarms_table(limit=20, batch_size=5)
+    assert isinstance(frame, pandas.DataFrame)
+    assert len(frame) == 20
+    assert list(frame["id"]) == list(range(1, 21))
+    assert "severity" in frame.columns
+    frame = alarm_api.get_alarms_table(columns=["id", "severity"])
+    assert list(frame.columns) == ["id", "severity"]
+
+
+def test_events_table(offline_args: dict):
+    pyarrow = pytest.importorskip("pyarrow")
+    event_api = EventAPI(offline_args)
+    for record in event_api.session.collections["events"]:
+        record["time"] = 1704904715000 + record["id"]
+    table = event_api.get_events_table(limit=0, batch_size=2, output="arrow")
+    assert isinstance(table, pyarrow.Table)
+    assert table.column("id").to_pylist() == [1, 2, 3, 4, 5]
+    assert table.schema.field("time").type == pyarrow.timestamp("ms", tz="UTC")
+
+
+def test_nodes_table(offline_args: dict):
+    pandas = pytest.importorskip("pandas")
+    node_api = NodeAPI(offline_args)
+    node_api.session.collections["nodes"][0]["assetRecord"] = {
+        "lastModifiedDate": 1704904715000
+    }
+    frame = node_api.get_nodes_table(
+        limit=0, columns=["id", "label", "assetRecord.lastModifiedDate"]
+    )
+    assert isinstance(frame, pandas.DataFrame)
+    assert list(frame["label"]) == ["node1", "node2", "node3"]
+    assert frame["assetRecord.lastModifiedDate"][0] == pandas.Timestamp(
+        1704904715000, unit="ms", tz="UTC"
+    )
@@ -0,0 +1,146 @@
+# tests.test_cache.py
+
+# pylint: disable=C0114,C0116,W0621,W0212
+
+import time
+
+import pytest
+
+from pyonms.cache import BusinessServiceCache, TTLCache
+from pyonms.dao.alarms import AlarmAPI
+from pyonms.dao.business_services import BSMAPI
+from pyonms.models.business_service import BusinessService, BusinessServiceRequest
+
+
+def test_ttl_cache_lru():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "one")
+    cache.set(2, "two")
+    assert cache.get(1) == "one"
+    cache.set(3, "three")
+    assert 2 not in cache
+    assert cache.get(1) == "one"
+    assert cache.get(3) == "three"
+    assert len(cache) == 2
+    cache.invalidate_if(lambda key: key > 2)
+    assert cache.get(3) is None
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+
+def test_ttl_cache_expiry():
+    cache = TTLCache(ttl=0.01)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    time.sleep(0.02)
+    assert cache.get("key", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_endpoint_cache(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, cache_ttl=60))
+    first = alarm_api.get_alarm(5)
+    assert first.id == 5
+    assert alarm_api.get_alarm(5) is first
+    assert len(alarm_api.session.calls) == 1
+    alarm_api.clear_alarm(5)
+    assert alarm_api.get_alarm(5) is not first
+    assert len(alarm_api.session.calls) == 3
+
+
+def test_endpoint_cache_disabled(offline_args: dict):
+    alarm_api = AlarmAPI(offline_args)
+    assert alarm_api.record_cache is None
+    alarm_api.get_alarm(5)
+    alarm_api.get_alarm(5)
+    assert len(alarm_api.session.calls) == 2
+
+
+def test_business_service_cache():
+    cache = BusinessServiceCache(maxsize=2)
+    first = BusinessService(id=1, location="", operational_status="", name="one")
+    second = BusinessService(id=2, location="", operational_status="", name="two")
+    cache.replace([first, second])
+    assert cache.complete
+    assert cache.get(2) is second
+    assert cache.get_name("one") is first
+    cache.remove(1)
+    assert cache.get_name("one") is None
+    assert not cache.complete
+    cache.replace(
+        [
+            BusinessService(
+                id=index, location="", operational_status="", name=str(index)
+            )
+            for index in range(3)
+        ]
+    )
+    assert not cache.complete
+
+
+def test_find_bsm_name(offline_args: dict):
+    bsm_api = BSMAPI(offline_args)
+    session = bsm_api.session
+    session.collections["business-services"] = [
+        f"/api/v2/business-services/{bsm_id}" for bsm_id in range(1, 4)
+    ]
+    session.endpoints["business-services"] = "business-services"
+    for bsm_id in range(1, 4):
+        session.details[f"business-services/{bsm_id}"] = {
+            "id": bsm_id,
+            "name": f"Service {bsm_id}",
+            "location": "Default",
+            "operational-status": "NORMAL",
+            "ip-service-edges": [],
+            "reduction-key-edges": [],
+            "child-edges": [],
+            "application-edges": [],
+            "parent-services": [],
+            "reduce-function": {"type": "HighestSeverity", "properties": {}},
+        }
+    assert bsm_api.find_bsm_name("Service 2", cache_only=True) is None
+    assert bsm_api.find_bsm_name("Service 2").id == 2
+    assert len(session.calls) == 4
+    assert bsm_api.find_bsm_name("Service 3").id == 3
+    assert bsm_api.find_bsm_name("Missing") is None
+    assert len(session.calls) == 4
+
+
+def test_bsm_record_cache(offline_args: dict, bsm_record: dict):
+    bsm_api = BSMAPI(offline_args)
+    session = bsm_api.session
+    session.details["business-services/1"] = bsm_record
+    assert bsm_api.record_cache is None
+    first = bsm_api.get_bsm(1)
+    assert bsm_api.get_bsm(1) is not first
+    assert len(session.calls) == 2
+    assert isinstance(bsm_api.bsm_cache, BusinessServiceCache)
+    assert bsm_api.find_bsm_name("Service 1", cache_only=True).id == 1
+    with pytest.warns(DeprecationWarning):
+        assert list(bsm_api.cache) == [1]
+    with pytest.warns(DeprecationWarning):
+        assert bsm_api.cache_name == {"Service 1": 1}
+    bsm_api.enable_cache()
+    assert bsm_api.record_cache is bsm_api.bsm_cache
+    first = bsm_api.get_bsm(1)
+    assert bsm_api.get_bsm(1) is first
+    assert bsm_api.find_bsm_name("Service 1", cache_only=True) is first
+    assert len(session.calls) == 3
+    bsm_api.update_bsm(1, BusinessServiceRequest(name="Service 1", attributes=[]))
+    assert bsm_api.find_bsm_name("Service 1", cache_only=True) is None
+    assert bsm_api.get_bsm(1) is not first
+    bsm_api.disable_cache()
+    assert bsm_api.get_bsm(1) is not bsm_api.get_bsm(1)
+
+
+def test_conditional_requests(offline_args: dict):
+    alarm_api = AlarmAPI(dict(offline_args, conditional_requests=True))
+    alarm_api.session.etags["alarms"] = '"v1"'
+    first = alarm_api.get_alarms(limit=0)
+    second = alarm_api.get_alarms(limit=0)
+    assert [alarm.id for alarm in second] == [alarm.id for alarm in first]
+    assert second[0] is not first[0]
+    assert alarm_api.validator_cache.hits == 1
+    alarm_api.session.etags["alarms"] = '"v2"'
+    assert len(alarm_api.get_alarms(limit=0)) == 23
+    assert alarm_api.validator_cache.hits == 2
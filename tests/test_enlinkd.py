@@ -0,0 +1,75 @@
+# tests.test_enlinkd.py
+
+# pylint: disable=C0114,C0116,W0621,W0212
+
+from pyonms.dao.enlinkd import EnlinkdAPI
+from pyonms.models import enlinkd
+
+
+def test_parse_port():
+    port = enlinkd.parse_port("Gi1/0/1(ifindex:10101)(10.0.0.1)(mac:00aabbccddee)")
+    assert port == enlinkd.PortInfo(ifindex=10101, ip="10.0.0.1", mac="00aabbccddee")
+    assert enlinkd.parse_port("eth0") == enlinkd.PortInfo()
+    assert enlinkd.parse_port("(300.1.1.1)(macAddress:zz)").ip is None
+
+    # Test the last tag wins, matching the previous greedy patterns
+    assert enlinkd.infer_ifindex("(ifindex:1)(ifindex:2)") == 2
+    assert enlinkd.infer_mac("(mac:aa)(macAddress:bb)") == "bb"
+    assert enlinkd.infer_ip("(10.0.0.1) (10.0.0.2)") == "10.0.0.2"
+    assert enlinkd.infer_node_from_url("node.jsp?node=3&parent=node=4") == 4
+
+
+def test_lldp_link_ports():
+    link = enlinkd.LldpLink(
+        lldpLocalPort="ge-0/0/1(ifindex:515)",
+        lldpLocalPortUrl="element/snmpinterface.jsp?node=12&ifindex=515",
+        ldpRemPort="ge-0/0/2(ifindex:516)(mac:0102030405)",
+    )
+    assert link.lldpLocalNodeId == 12
+    assert link.lldpLocalIfIndex == 515
+    assert link.lldpRemIfIndex == 516
+    assert link.lldpRemMAC == "0102030405"
+
+
+def test_topology_graph(offline_args: dict):
+    enlinkd_api = EnlinkdAPI(offline_args)
+    session = enlinkd_api.session
+    session.details["enlinkd/1"] = {
+        "lldpLinkNodes": [
+            {
+                "lldpLocalPort": "ge-0/0/1(ifindex:1)",
+                "lldpLocalPortUrl": "element/snmpinterface.jsp?node=1&ifindex=1",
+                "lldpRemChassisIdUrl": "element/node.jsp?node=2",
+                "ldpRemPort": "ge-0/0/11",
+            }
+        ]
+    }
+    session.details["enlinkd/2"] = {
+        "lldpLinkNodes": [
+            {
+                "lldpLocalPort": "ge-0/0/11(ifindex:11)",
+                "lldpRemChassisIdUrl": "element/node.jsp?node=1",
+                "ldpRemPort": "ge-0/0/1(ifindex:1)",
+            }
+        ],
+        "cdpLinkNodes": [
+            {
+                "cdpLocalPort": "Gi0/2(ifindex:2)",
+                "cdpCacheDeviceUrl": "element/node.jsp?node=3",
+                "cdpCacheDevicePort": "Gi0/3(ifindex:3)",
+            }
+        ],
+    }
+    session.details["enlinkd/3"] = {}
+    graph = enlinkd_api.get_topology_graph(threads=2)
+    assert sorted(graph.adjacency) == [1, 2, 3]
+    assert len(graph.edges) == 2
+    lldp = graph.links(1, 2)[0]
+    assert lldp.link_type == enlinkd.LinkType.LLDP
+    assert (lldp.ifindex(1), lldp.ifindex(2)) == (1, 11)
+    assert graph.neighbors(2) == [1, 3]
+    assert graph.neighbors(2, link_types=[enlinkd.LinkType.CDP]) == [3]
+    assert graph.shortest_path(1, 3) == [1, 2, 3]
+    assert graph.shortest_path(1, 3, exclude=[2]) is None
+    assert graph.reachable(1, max_hops=1) == {1: 0, 2: 1}
+    assert graph.blast_radius(2, root=1) == {3}
@@ -2,6 +2,7 @@
 
 # pylint: disable=C0114,C0116,W0621
 
+import sys
 from datetime import datetime
 
 import pytest
@@ -43,3 +44,23 @@ def test_event_batch(test_instance: PyONMS):
     assert events[0].id == 319
     assert events[0].uei == "uei.opennms.org/threshold/highThresholdExceeded"
     assert events[0].parameters["resourceType"].value == "if"
+
+
+def test_event_to_dict():
+    event = Event(
+        uei="uei.opennms.org/test",
+        id=5,
+        description="Test event",
+        ipAddress="10.0.0.1",
+        severity="MAJOR",
+        parameters=[{"name": "key", "value": "value", "type": "string"}],
+    )
+    assert event.to_dict() == {
+        "uei": "uei.opennms.org/test",
+        "descr": "Test event",
+        "severity": "MAJOR",
+        "interface": "10.0.0.1",
+        "parms": [{"parmName": "key", "value": "value"}],
+    }
+    if sys.version_info >= (3, 10):
+        assert not hasattr(event, "__dict__")
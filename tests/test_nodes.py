@@ -13,6 +13,7 @@ from pyonms.models.node import (
     LabelSource,
     Metadata,
     Node,
+    NodeIndex,
     NodeType,
     Service,
     SnmpInterface,
@@ -84,3 +85,58 @@ def test_node_metadata(test_instance: PyONMS):
     assert isinstance(test_metadata[0], Metadata)
     assert test_metadata[0].context == "requisition"
     assert len(test_metadata) == 5
+
+
+def test_node_index():
+    nodes = [
+        Node(
+            id=node_id,
+            label=f"node{node_id % 2}",
+            foreignSource="Servers",
+            foreignId=str(node_id),
+            sysObjectId=".1.3.6.1.4.1.9.1.1",
+            categories=[{"name": "Routers"}] if node_id == 1 else [],
+            ipInterfaces=[
+                IPInterface(ipAddress=f"10.0.{node_id}.1"),
+                IPInterface(ipAddress="2001:db8::1" if node_id == 2 else "127.0.0.1"),
+            ],
+        )
+        for node_id in range(1, 4)
+    ]
+    index = NodeIndex(nodes)
+    assert len(index) == 3
+    assert index.get(2) is nodes[1]
+    assert index.by_ip("10.0.2.1") == [nodes[1]]
+    assert index.by_ip("2001:0db8::0001") == [nodes[1]]
+    assert index.by_ip("127.0.0.1") == [nodes[0], nodes[2]]
+    assert index.by_label("node1") == [nodes[0], nodes[2]]
+    assert index.by_foreign_id("Servers", "3") is nodes[2]
+    assert len(index.by_sys_object_id(".1.3.6.1.4.1.9.1.1")) == 3
+    assert index.by_category("Routers") == [nodes[0]]
+    assert index.in_network("10.0.0.0/23") == [nodes[0]]
+    assert index.in_network("10.0.0.0/16") == nodes
+    assert index.in_network("2001:db8::/32") == [nodes[1]]
+    assert index.by_ip("not an address") is None
+
+    # Test scoped and malformed interface addresses
+    scoped = Node(
+        id=4,
+        label="node4",
+        ipInterfaces=[
+            IPInterface(ipAddress="fe80::1%eth0"),
+            IPInterface(ipAddress="10.0.4.1"),
+        ],
+    )
+    scoped.ipInterfaces[1].ipAddress = "10.0.4.256"
+    index.add(scoped)
+    assert index.by_ip("fe80::1") == [scoped]
+    assert index.by_ip("fe80::1%eth1") == [scoped]
+    assert index.by_ip("10.0.4.256") is None
+    assert index.in_network("fe80::/10") == [scoped]
+    index.remove(4)
+
+    # Test removing a node
+    index.remove(1)
+    assert index.by_ip("127.0.0.1") == [nodes[2]]
+    assert index.by_category("Routers") == []
+    assert index.in_network("10.0.0.0/16") == nodes[1:]
@@ -14,6 +14,8 @@ def test_instance_creation(test_instance: pyonms.PyONMS):
     assert test_instance.__repr__() == "http://localhost:8980/opennms"
     assert test_instance.nodes.verify_ssl is True
     assert test_instance.nodes.timeout == 30
+    assert test_instance.nodes.session is test_instance.session
+    assert test_instance.alarms.session is test_instance.nodes.session
 
     server2 = pyonms.PyONMS(
         hostname="http://localhost:8980/opennms",
@@ -22,12 +24,14 @@ def test_instance_creation(test_instance: pyonms.PyONMS):
         name="Test Server",
         verify_ssl=False,
         timeout=60,
+        pool_maxsize=25,
     )
     assert server2.name == "Test Server"
     assert server2.nodes.username == "admin"
     assert server2.nodes.password == "admin"
     assert server2.nodes.verify_ssl is False
     assert server2.nodes.timeout == 60
+    assert server2.nodes.session.get_adapter(server2.hostname)._pool_maxsize == 25
 
 
 @pytest.mark.vcr()
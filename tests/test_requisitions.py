@@ -2,10 +2,24 @@
 
 # pylint: disable=C0114,C0116,W0621,W0212
 
+import json
+import pickle
+import time
+from copy import deepcopy
+
 import pytest
+import xmltodict
 
 from pyonms import PyONMS
-from pyonms.models.requisition import Requisition
+from pyonms.dao.requisitions import RequisitionsAPI
+from pyonms.models.node import Metadata
+from pyonms.models.requisition import (
+    Category,
+    Interface,
+    Requisition,
+    RequisitionNode,
+    Service,
+)
 
 
 @pytest.mark.vcr()
@@ -71,3 +85,327 @@ def test_requisition_update_asset(test_instance: PyONMS):
     assert test_requisition.node["1"].asset[0].value == "test"
     test_requisition.node["1"].set_asset(name="region", value="value")
     assert test_requisition.node["1"].asset[0].value == "value"
+
+
+def test_requisition_sync(offline_args: dict):
+    requisitions_api = RequisitionsAPI(offline_args)
+    session = requisitions_api.session
+    current = Requisition(
+        foreign_source="cmdb",
+        node=[
+            RequisitionNode(
+                foreign_id=str(node_id),
+                node_label=f"node{node_id}",
+                interface=[
+                    Interface(
+                        ip_addr=f"10.0.0.{node_id}",
+                        monitored_service=[Service(service_name="ICMP")],
+                    )
+                ],
+            )
+            for node_id in range(1, 5)
+        ],
+    )
+    session.details["requisitionNames"] = {"foreign-source": ["cmdb"]}
+    session.details["requisitions/cmdb"] = current.to_dict()
+
+    desired = requisitions_api.get_requisition("cmdb")
+    desired.remove_node("4")
+    desired.add_node(RequisitionNode(foreign_id="5", node_label="node5"))
+    desired.node["1"].set_metadata(key="owner", value="noc")
+    desired.node["2"].interface["10.0.0.2"].monitored_service.append(
+        Service(service_name="SNMP")
+    )
+    diff = requisitions_api.sync_requisition(desired)
+
+    assert diff.added == ["5"]
+    assert diff.removed == ["4"]
+    assert list(diff.changed) == ["1", "2"]
+    assert diff.changed["1"].meta_data.added == ["requisition:owner"]
+    assert diff.changed["2"].interface.changed == ["10.0.0.2"]
+    assert diff.changed["2"].service["10.0.0.2"].added == ["SNMP"]
+    writes = sorted(
+        (method, url.rsplit("/rest/", 1)[1]) for method, url, _ in session.writes
+    )
+    assert writes == [
+        ("DELETE", "requisitions/cmdb/nodes/4"),
+        ("POST", "requisitions/cmdb/nodes"),
+        ("POST", "requisitions/cmdb/nodes"),
+        ("POST", "requisitions/cmdb/nodes"),
+        ("PUT", "requisitions/cmdb/import"),
+    ]
+
+    session.writes.clear()
+    assert not requisitions_api.sync_requisition(
+        requisitions_api.get_requisition("cmdb")
+    )
+    assert not session.writes
+
+
+def test_requisition_fingerprint():
+    def build(categories: list) -> RequisitionNode:
+        return RequisitionNode(
+            foreign_id="1",
+            node_label="node1",
+            category=[Category(name=name) for name in categories],
+            interface=[
+                Interface(
+                    ip_addr="10.0.0.1",
+                    monitored_service=[Service(service_name="ICMP")],
+                )
+            ],
+        )
+
+    node = build(["Routers", "Production"])
+    assert node.fingerprint() == build(["Production", "Routers"]).fingerprint()
+    fingerprint = node.fingerprint()
+    node.set_metadata(key="owner", value=None)
+    assert node.fingerprint() == fingerprint
+    node.interface["10.0.0.1"].set_metadata(key="owner", value="noc")
+    assert node.fingerprint() != fingerprint
+
+
+def test_requisition_interface_managed():
+    current = Requisition(foreign_source="cmdb")
+    current.add_node(
+        RequisitionNode(
+            foreign_id="1",
+            node_label="node1",
+            interface=[Interface(ip_addr="10.0.0.1")],
+        )
+    )
+    desired = deepcopy(current)
+    desired.node["1"].interface["10.0.0.1"].managed = "false"
+    assert desired.node["1"].interface["10.0.0.1"].to_dict()["managed"] == "false"
+    assert current.diff(desired).changed["1"].interface.changed == ["10.0.0.1"]
+    current.add_node(deepcopy(desired.node["1"]), merge=True)
+    assert current.node["1"].interface["10.0.0.1"].managed == "false"
+    assert not current.diff(desired)
+
+
+def test_requisition_add_node_merge():
+    requisition = Requisition(foreign_source="cmdb")
+    requisition.add_node(
+        RequisitionNode(
+            foreign_id="1",
+            node_label="node1",
+            interface=[
+                Interface(
+                    ip_addr="10.0.0.1",
+                    monitored_service=[Service(service_name="ICMP")],
+                )
+            ],
+        )
+    )
+    update = RequisitionNode(
+        foreign_id="1",
+        node_label="node1",
+        location="Default",
+        category=[Category(name="Routers")],
+        interface=[
+            Interface(
+                ip_addr="10.0.0.1",
+                monitored_service=[
+                    Service(service_name="ICMP"),
+                    Service(service_name="SNMP"),
+                ],
+            ),
+            Interface(ip_addr="10.0.0.2"),
+        ],
+    )
+    requisition.add_node(update)
+    node = requisition.node["1"]
+    assert node.location == "Default"
+    assert [category.name for category in node.category] == ["Routers"]
+    assert list(node.interface) == ["10.0.0.1", "10.0.0.2"]
+    assert [
+        service.service_name for service in node.interface["10.0.0.1"].monitored_service
+    ] == ["ICMP", "SNMP"]
+    requisition.add_node(
+        RequisitionNode(foreign_id="1", node_label="other"), merge=False
+    )
+    assert requisition.node["1"].node_label == "other"
+
+
+def test_requisition_node_indexes():
+    node = RequisitionNode(foreign_id="1", node_label="node1")
+    for index in range(500):
+        node.set_metadata(key=f"key{index}", value="old")
+        node.set_metadata(key=f"key{index}", value="new")
+    assert len(node.meta_data) == 500
+    assert {data.value for data in node.meta_data} == {"new"}
+    node.meta_data.reverse()
+    node.set_metadata(key="key0", value="first")
+    assert node.meta_data[-1].value == "first"
+    node.add_category("Routers")
+    node.add_category("Routers")
+    node.remove_category("Routers")
+    node.add_category("Routers")
+    assert node.to_dict()["category"] == [{"name": "Routers"}]
+    node.set_asset(name="city", value="Raleigh")
+    node.set_asset(name="city", value="Durham")
+    assert node.to_dict()["asset"] == [{"name": "city", "value": "Durham"}]
+    interface = Interface(ip_addr="10.0.0.1")
+    interface.set_service(Service(service_name="ICMP"))
+    interface.set_service(Service(service_name="ICMP", category=[Category("Web")]))
+    assert interface.to_dict()["monitored-service"] == [
+        {"service-name": "ICMP", "category": [{"name": "Web"}], "meta-data": []}
+    ]
+
+
+def test_requisition_stream(offline_args: dict):
+    requisitions_api = RequisitionsAPI(offline_args)
+    session = requisitions_api.session
+    requisition = Requisition(
+        foreign_source="cmdb",
+        node=[
+            RequisitionNode(
+                foreign_id=str(node_id),
+                node_label=f"node<{node_id}>",
+                category=[Category(name="Routers")],
+                interface=[
+                    Interface(
+                        ip_addr=f"10.0.0.{node_id}",
+                        monitored_service=[Service(service_name="ICMP")],
+                    )
+                ],
+            )
+            for node_id in range(1, 200)
+        ],
+    )
+    assert len(list(requisition.iter_json(chunk_size=1024))) > 1
+    requisitions_api.update_requisition(requisition, stream="json")
+    assert json.loads(session.writes[-1][2]) == requisition.to_dict()
+
+    requisitions_api.update_requisition(requisition, stream="xml")
+    document = xmltodict.parse(session.writes[-1][2], attr_prefix="")
+    nodes = document["model-import"]["node"]
+    assert document["model-import"]["foreign-source"] == "cmdb"
+    assert len(nodes) == 199
+    assert nodes[0]["node-label"] == "node<1>"
+    assert nodes[0]["interface"]["monitored-service"]["service-name"] == "ICMP"
+    assert list(nodes[0]) == ["foreign-id", "node-label", "interface", "category"]
+
+
+def test_requisition_iter_nodes(offline_args: dict):
+    requisitions_api = RequisitionsAPI(offline_args)
+    requisition = Requisition(foreign_source="cmdb")
+    for node_id in range(1, 4):
+        node = RequisitionNode(
+            foreign_id=str(node_id),
+            node_label=f"node{node_id}",
+            interface=[
+                Interface(
+                    ip_addr=f"10.0.0.{node_id}",
+                    monitored_service=[Service(service_name="ICMP")],
+                )
+            ],
+        )
+        node.set_metadata(key="owner", value="noc")
+        node.set_asset(name="city", value="Durham")
+        requisition.add_node(node)
+    requisitions_api.session.details["requisitions/cmdb"] = b"".join(
+        requisition.iter_xml()
+    )
+    nodes = list(requisitions_api.iter_requisition_nodes("cmdb"))
+    assert [node.foreign_id for node in nodes] == ["1", "2", "3"]
+    assert not Requisition(foreign_source="cmdb", node=nodes).diff(requisition)
+
+
+def test_requisition_node_index_stale():
+    node = RequisitionNode(foreign_id="1", node_label="node1")
+    node.set_metadata(key="k1", value="a")
+    meta_data = node.meta_data
+    meta_data.remove(meta_data[0])
+    meta_data.append(Metadata(context="requisition", key="k2", value="a"))
+    node.set_metadata(key="k2", value="b")
+    assert [(data.key, data.value) for data in node.meta_data] == [("k2", "b")]
+
+
+def test_requisition_node_index_in_place():
+    requisition = Requisition(foreign_source="cmdb")
+    node = RequisitionNode(foreign_id="1", node_label="node1")
+    node.set_metadata(key="k1", value="a")
+    node.set_metadata(key="k2", value="a")
+    node.add_category("Routers")
+    interface = Interface(ip_addr="10.0.0.1")
+    interface.set_service(Service(service_name="ICMP"))
+    node.add_interface(interface)
+    requisition.add_node(node)
+    node.meta_data[0] = Metadata(context="requisition", key="k3", value="a")
+    node.set_metadata(key="k1", value="b")
+    node.set_metadata(key="k3", value="b")
+    assert [(data.key, data.value) for data in node.meta_data] == [
+        ("k3", "b"),
+        ("k2", "a"),
+        ("k1", "b"),
+    ]
+    node.category[0].name = "Servers"
+    interface.monitored_service[0].service_name = "SNMP"
+    requisition.add_node(
+        RequisitionNode(
+            foreign_id="1",
+            node_label="node1",
+            category=[Category(name="Servers")],
+            interface=[
+                Interface(
+                    ip_addr="10.0.0.1", monitored_service=[Service(service_name="SNMP")]
+                )
+            ],
+        )
+    )
+    merged = requisition.node["1"]
+    assert merged.to_dict()["category"] == [{"name": "Servers"}]
+    assert [
+        service.service_name
+        for service in merged.interface["10.0.0.1"].monitored_service
+    ] == ["SNMP"]
+
+
+def test_requisition_node_index_rename():
+    node = RequisitionNode(foreign_id="1", node_label="node1")
+    for index in range(10):
+        node.set_metadata(key=f"key{index}", value="old")
+    node.meta_data[3].key = "renamed"
+    node.set_metadata(key="renamed", value="new")
+    node.set_metadata(key="key3", value="new")
+    assert len(node.meta_data) == 11
+    assert node.meta_data[3].value == "new"
+    node.set_asset(name="city", value="Raleigh")
+    node.asset[0].name = "state"
+    node.set_asset(name="state", value="NC")
+    assert node.to_dict()["asset"] == [{"name": "state", "value": "NC"}]
+
+
+def test_requisition_node_index_scaling():
+    def build(count: int) -> float:
+        node = RequisitionNode(foreign_id="1", node_label="node1")
+        start = time.perf_counter()
+        for index in range(count):
+            node.set_metadata(key=f"key{index}", value="value")
+        return time.perf_counter() - start
+
+    build(1000)
+    # Linear growth takes 8x as long for 8x the keys; a scan per new key would take about 64x.
+    assert build(16000) < 24 * build(2000)
+
+
+def test_requisition_pickle():
+    requisition = Requisition(foreign_source="cmdb")
+    node = RequisitionNode(
+        foreign_id="1",
+        node_label="node1",
+        interface=[
+            Interface(
+                ip_addr="10.0.0.1", monitored_service=[Service(service_name="ICMP")]
+            )
+        ],
+    )
+    node.set_metadata(key="owner", value="noc")
+    node.set_asset(name="city", value="Durham")
+    node.add_category("Routers")
+    requisition.add_node(node)
+    copy = pickle.loads(pickle.dumps(requisition))
+    assert copy == requisition
+    copy.node["1"].set_metadata(key="owner", value="ops")
+    assert len(copy.node["1"].meta_data) == 1
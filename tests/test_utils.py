@@ -3,14 +3,18 @@
 # pylint: disable=C0114,C0116,W0621,W0212
 
 import ipaddress
+import time as _time
 from collections import OrderedDict
-from datetime import datetime
+from datetime import datetime, timezone
 from xml.parsers.expat import ExpatError
 
 import pytest
 import pytz
 
 from pyonms import utils
+from pyonms.models.exceptions import InvalidValueError
+from pyonms.utils import columnar, json_backend
+from pyonms.utils.xml_parser import iter_xml, parse_xml
 
 
 def test_convert_time():
@@ -78,6 +82,62 @@ def test_convert_link_time_with_zone():
         utils.convert_link_time(time="01/01/24, 12:00:00 am", zone=12345)
 
 
+def test_convert_times():
+    # Test batch conversion matches single conversion
+    times = [1704904715000, None, 0, 1704904715123, 1720000000000]
+    assert utils.convert_times(times) == [
+        utils.convert_time(time=time) for time in times
+    ]
+
+    # Test values already converted are left alone
+    converted_time = utils.convert_time(time=1704904715000)
+    assert utils.convert_times([converted_time, 1704904715000]) == [
+        converted_time,
+        converted_time,
+    ]
+
+    # Test converting records in place
+    records = [{"id": 1, "time": 1704904715000}, {"id": 2}, None]
+    utils.convert_record_times(records, ["time"])
+    assert records == [{"id": 1, "time": converted_time}, {"id": 2}, None]
+
+
+@pytest.mark.skipif(not hasattr(_time, "tzset"), reason="requires time.tzset")
+def test_convert_times_transition(monkeypatch):
+    # St. John's switched to daylight time at 00:01 local time on this day,
+    # which is not on a 15 minute boundary in UTC.
+    monkeypatch.setenv("TZ", "America/St_Johns")
+    _time.tzset()
+    try:
+        times = [986095976255 + offset * 1000 for offset in range(-120, 120, 7)]
+        assert utils.convert_times(times) == [
+            utils.convert_time(stamp) for stamp in times
+        ]
+    finally:
+        monkeypatch.undo()
+        _time.tzset()
+
+
+def test_convert_link_times():
+    times = ["01/01/24, 12:00:00 am", None, "01/01/24, 12:00:00 am"]
+    converted_times = utils.convert_link_times(times)
+    assert converted_times == [utils.convert_link_time(time=time) for time in times]
+    assert converted_times[0] is converted_times[2]
+
+    # Test if value is not valid enlinkd time string
+    with pytest.raises(ValueError, match="time data 'now' does not match format"):
+        utils.convert_link_times(["now"])
+
+
+def test_fiql_time():
+    # Test epoch milliseconds
+    assert utils.fiql_time(time=1704904715123) == "2024-01-10T16:38:35.123+0000"
+
+    # Test round trip through `convert_time`
+    converted_time = utils.convert_time(time=1704904715000)
+    assert utils.fiql_time(time=converted_time) == "2024-01-10T16:38:35.000+0000"
+
+
 def test_convert_xml():
     # Test for valid XML
     source = """
@@ -105,6 +165,31 @@ def test_convert_xml():
         assert utils.convert_xml("hello")
 
 
+def test_iter_xml():
+    source = """
+    <nodes count="3">
+        <node label="name" foreign-id="1">
+            <interface ip-addr="10.0.0.1">text</interface>
+        </node>
+        <node label="name2"/>
+        <node/>
+    </nodes>"""
+    nodes = list(iter_xml(source, tag="node", force_list=["interface"], chunk_size=16))
+    assert nodes == [
+        {
+            "label": "name",
+            "foreign_id": "1",
+            "interface": [{"ip_addr": "10.0.0.1", "#text": "text"}],
+        },
+        {"label": "name2"},
+        None,
+    ]
+    assert parse_xml(source)["nodes"]["node"][1:] == nodes[1:]
+
+    with pytest.raises(ExpatError):
+        list(iter_xml("<nodes><node></nodes>", tag="node"))
+
+
 def test_normalize_dict():
     source = OrderedDict(
         {
@@ -147,3 +232,56 @@ def test_check_ip():
     assert utils.check_ip_address("invalid") == False
     with pytest.raises(ipaddress.AddressValueError):
         assert utils.check_ip_address("invalid", raise_error=True)
+
+
+def test_json_backend():
+    # Test default and automatic selection
+    assert json_backend.get_json_backend().name == "json"
+    backend = json_backend.get_json_backend(name="auto")
+    assert backend.name in json_backend.BACKENDS
+    assert backend.loads(backend.dumps({"a": [1, 2]})) == {"a": [1, 2]}
+    assert backend.loads('{"a": 1}') == {"a": 1}
+
+    # Test invalid backend name
+    with pytest.raises(InvalidValueError):
+        json_backend.get_json_backend(name="yaml")
+
+
+def test_to_columns():
+    records = [
+        {"id": 1, "serviceType": {"id": 2, "name": "ICMP"}},
+        {},
+        {"id": 2, "label": "node"},
+    ]
+    assert columnar.to_columns(records) == {
+        "id": [1, 2],
+        "serviceType.id": [2, None],
+        "serviceType.name": ["ICMP", None],
+        "label": [None, "node"],
+    }
+    assert columnar.to_columns(records, columns=["label", "id"]) == {
+        "label": [None, "node"],
+        "id": [1, 2],
+    }
+
+    # Test invalid output name
+    with pytest.raises(InvalidValueError):
+        columnar.to_table(records, output="csv")
+
+
+def test_to_table_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    records = [
+        {"id": 1, "time": 1704904715000, "parameters": [{"name": "a"}]},
+        {"id": 2, "time": None, "serviceType": {"name": "ICMP"}},
+    ]
+    table = columnar.to_table(records, output="arrow", time_columns=["time"])
+    assert isinstance(table, pyarrow.Table)
+    assert table.column_names == ["id", "time", "parameters", "serviceType.name"]
+    assert table.schema.field("time").type == pyarrow.timestamp("ms", tz="UTC")
+    assert table.column("time").to_pylist() == [
+        datetime(2024, 1, 10, 16, 38, 35, tzinfo=timezone.utc),
+        None,
+    ]
+    assert table.column("parameters").to_pylist() == ['[{"name": "a"}]', None]
+    assert table.column("serviceType.name").to_pylist() == [None, "ICMP"]